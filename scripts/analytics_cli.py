@@ -12,6 +12,10 @@ from datetime import datetime
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from analytics_dashboard import SleeperAnalyticsDashboard
+from season_simulator import SeasonSimulator, format_simulation
+from perf_metrics import metrics
+from secure_config import config
+from profiling import ProfileSession, print_profile_hint
 
 
 def main():
@@ -24,7 +28,12 @@ Examples:
   python analytics_cli.py --full-dashboard
   python analytics_cli.py --summary-only
   python analytics_cli.py --predict-player "nalaknas"
+  python analytics_cli.py --simulate --sims 200000 --processes 4 --seed 7
+  python analytics_cli.py --window 4
+  python analytics_cli.py --contrarian
+  python analytics_cli.py --streaks
   python analytics_cli.py --charts-only --output-dir ./my_analytics
+  python analytics_cli.py --full-dashboard --profile --profile-memory
         """
     )
     
@@ -52,6 +61,50 @@ Examples:
         help='Predict next week performance for a specific player (by display name)'
     )
     
+    parser.add_argument(
+        '--window',
+        type=int,
+        help='Recent-form leaderboard over the last N weeks (moving average, std and trend)'
+    )
+    
+    parser.add_argument(
+        '--streaks',
+        action='store_true',
+        help='Top-3 and last-place streaks plus per-week percentile ranks'
+    )
+    
+    parser.add_argument(
+        '--contrarian',
+        action='store_true',
+        help='Weekly pick consensus and contrarian scores (needs data/week_N_game_results.json)'
+    )
+    
+    parser.add_argument(
+        '--simulate',
+        action='store_true',
+        help='Monte Carlo the rest of the season and report skin/penalty/perfect-week odds'
+    )
+    
+    parser.add_argument(
+        '--sims',
+        type=int,
+        default=100000,
+        help='Seasons to simulate with --simulate (default: 100000)'
+    )
+    
+    parser.add_argument(
+        '--processes',
+        type=int,
+        default=1,
+        help='Worker processes for --simulate (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Random seed for reproducible --simulate results'
+    )
+    
     parser.add_argument(
         '--output-dir',
         type=str,
@@ -65,8 +118,40 @@ Examples:
         help='Sleeper league ID (optional, will use config if not provided)'
     )
     
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Profile the run with cProfile and save results to outputs/profiles/'
+    )
+    
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='Also trace allocations with tracemalloc (implies --profile)'
+    )
+    
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=25,
+        help='Number of hot functions / allocation sites in the profile summary (default: 25)'
+    )
+    
     args = parser.parse_args()
+    if args.window is not None and args.window < 1:
+        parser.error("--window must be at least 1 week")
+    
+    if args.profile or args.profile_memory:
+        with ProfileSession('analytics', top_n=args.profile_top, trace_memory=args.profile_memory) as session:
+            exit_code = run(args)
+        print_profile_hint(session)
+        return exit_code
     
+    return run(args)
+
+
+def run(args) -> int:
+    """Run the requested analytics actions"""
     # Initialize dashboard
     try:
         dashboard = SleeperAnalyticsDashboard(league_id=args.league_id)
@@ -145,6 +230,78 @@ Examples:
             print(f"   Trend: {prediction['trend']:+.2f}")
             print(f"   Next Week: {prediction['next_week']}")
             
+        elif args.window is not None:
+            print(f"📈 Rolling {args.window}-week form...")
+            dashboard.extract_player_data()
+            rolling = dashboard.rolling_window(args.window)
+            if rolling.empty:
+                print("📭 No scored weeks yet")
+            else:
+                leaders = dashboard.recent_form(args.window, rolling=rolling)
+                
+                print(f"\n🔥 RECENT FORM (last {args.window} weeks, through week {leaders['week'].max()}):")
+                for rank, (_, row) in enumerate(leaders.iterrows(), 1):
+                    print(f"   {rank:2d}. {row['display_name']}: {row['moving_average']:.2f} avg "
+                          f"(±{row['moving_std']:.2f}, trend {row['trend']:+.2f})")
+                
+                os.makedirs(args.output_dir, exist_ok=True)
+                rolling.to_csv(f"{args.output_dir}/rolling_{args.window}_weeks.csv", index=False)
+                print(f"💾 Rolling window saved to: {args.output_dir}/rolling_{args.window}_weeks.csv")
+            
+        elif args.streaks:
+            print("🔥 Calculating streaks and percentile ranks...")
+            dashboard.extract_player_data()
+            streaks = dashboard.streaks()
+            
+            print("\n🔥 LONGEST ACTIVE TOP-3 STREAKS:")
+            for rank, (_, row) in enumerate(streaks.head(5).iterrows(), 1):
+                print(f"   {rank}. {row['display_name']}: {row['current_top3_streak']} weeks "
+                      f"(best {row['longest_top3_streak']}, avg percentile {row['average_percentile']:.0%})")
+            
+            print("\n🧊 LONGEST ACTIVE LAST-PLACE STREAKS:")
+            cold = streaks.sort_values(['current_last_place_streak', 'longest_last_place_streak'], ascending=False)
+            for rank, (_, row) in enumerate(cold.head(5).iterrows(), 1):
+                print(f"   {rank}. {row['display_name']}: {row['current_last_place_streak']} weeks "
+                      f"(worst {row['longest_last_place_streak']})")
+            
+            os.makedirs(args.output_dir, exist_ok=True)
+            streaks.to_csv(f"{args.output_dir}/streaks.csv")
+            dashboard.weekly_ranks().to_csv(f"{args.output_dir}/weekly_ranks.csv", index=False)
+            print(f"💾 Streaks saved to: {args.output_dir}/streaks.csv")
+            print(f"💾 Weekly ranks saved to: {args.output_dir}/weekly_ranks.csv")
+            
+        elif args.contrarian:
+            print("🦄 Scoring pick consensus...")
+            consensus = dashboard.pick_consensus()
+            scores = consensus.user_scores()
+            decided = [int(week) for week in consensus.matrix.weeks[consensus.decided]]
+            
+            if decided:
+                print(f"\n🦄 MOST CONTRARIAN WINNERS (weeks {', '.join(str(w) for w in decided)}):")
+                for rank, (_, row) in enumerate(scores.head(10).iterrows(), 1):
+                    print(f"   {rank:2d}. {row['display_name']}: {row['contrarian_score']:.3f} "
+                          f"({int(row['correct_picks'])}/{int(row['decided_picks'])} correct, "
+                          f"avg rarity {row['average_rarity']:.2f})")
+            else:
+                print("📝 No game results files found - showing consensus only")
+            
+            os.makedirs(args.output_dir, exist_ok=True)
+            consensus.consensus_table().to_csv(f"{args.output_dir}/pick_consensus.csv", index=False)
+            scores.to_csv(f"{args.output_dir}/contrarian_scores.csv")
+            print(f"💾 Consensus saved to: {args.output_dir}/pick_consensus.csv")
+            print(f"💾 Contrarian scores saved to: {args.output_dir}/contrarian_scores.csv")
+            
+        elif args.simulate:
+            print(f"🎲 Simulating {args.sims:,} seasons...")
+            dashboard.extract_player_data()
+            simulation = SeasonSimulator(dashboard, seed=args.seed).simulate(
+                sims=args.sims, processes=args.processes)
+            print(format_simulation(simulation))
+            
+            os.makedirs(args.output_dir, exist_ok=True)
+            simulation.to_csv(f"{args.output_dir}/season_simulation.csv")
+            print(f"💾 Simulation saved to: {args.output_dir}/season_simulation.csv")
+            
         else:
             # Default: show summary
             print("📊 Generating performance summary...")
@@ -157,6 +314,14 @@ Examples:
         print(f"❌ Error during execution: {e}")
         return 1
     
+    metrics.print_summary()
+    try:
+        print(f"⏱️  Timing report saved to: {metrics.write_report(config.metrics_directory)}")
+        if config.prometheus_textfile:
+            metrics.write_prometheus(config.prometheus_textfile)
+    except Exception as e:
+        print(f"⚠️  Could not write timing report: {e}")
+    
     print("\n✅ Analytics completed successfully!")
     return 0
 
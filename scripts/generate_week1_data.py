@@ -14,6 +14,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.apple_shortcuts import AppleShortcutsIntegration
+from src.results_store import ResultsStore
 
 def main():
     """Generate Week 1 data for Apple Shortcuts"""
@@ -22,13 +23,12 @@ def main():
     
     # Load Week 1 results
     try:
-        with open('data/skins_game_results.json', 'r') as f:
-            results = json.load(f)
+        results = ResultsStore('data/skins_game_results.json').load()
     except FileNotFoundError:
         print("❌ No results file found at data/skins_game_results.json")
         print("   Run 'python3 main.py' first to process a week")
         return
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"❌ Error reading results file: {e}")
         print("   The file may be corrupted or invalid JSON")
         return
@@ -9,13 +9,48 @@ import os
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+import requests
+
 from src.weekly_runner import main as run_weekly, quick_status
 from src.view_results import view_results, view_season_summary
 from src.export_results import SkinsGameExporter
+from src.pick_analytics import PickConsensus, PickMatrix, load_game_results
+from src.skins_game_mvp import SleeperSkinsGameMVP
+from src.circuit_breaker import CircuitOpenError
+from src.secure_config import config
 from src.sms_notifications import SMSNotifier
+from src.profiling import ProfileSession, print_profile_hint
+
+PROFILE_FLAGS = ('--profile', '--profile-memory')
 
 def main():
     """Main entry point with command line argument handling"""
+    # --profile (cProfile) and --profile-memory (cProfile + tracemalloc) wrap any command
+    if any(flag in sys.argv for flag in PROFILE_FLAGS):
+        trace_memory = '--profile-memory' in sys.argv
+        sys.argv = [arg for arg in sys.argv if arg not in PROFILE_FLAGS]
+        label = sys.argv[1] if len(sys.argv) > 1 else 'weekly'
+        if label.isdigit():
+            label = f"week_{label}"
+        with ProfileSession(label, trace_memory=trace_memory) as session:
+            run_command()
+        print_profile_hint(session)
+    else:
+        run_command()
+
+def load_pick_consensus():
+    """Current season's pick consensus for the export (None if the league can't be reached)"""
+    try:
+        game = SleeperSkinsGameMVP()
+        matrix = PickMatrix.from_rosters(game.get_rosters())
+        names = {uid: user.get('display_name', 'Unknown') for uid, user in game.get_users().items()}
+    except (requests.RequestException, CircuitOpenError, ValueError) as e:
+        print(f"⚠️  Skipping pick consensus sheets: {e}")
+        return None
+    return PickConsensus(matrix, load_game_results(matrix.weeks, config.data_directory), names)
+
+def run_command():
+    """Dispatch the command given on the command line"""
     if len(sys.argv) > 1:
         if sys.argv[1] == "status":
             quick_status()
@@ -23,7 +58,9 @@ def main():
             view_results()
         elif sys.argv[1] == "export":
             print("📊 Exporting season report...")
-            exporter = SkinsGameExporter()
+            # The consensus sheets need the Sleeper API; the rest of the export works offline
+            pick_consensus = load_pick_consensus() if '--consensus' in sys.argv[2:] else None
+            exporter = SkinsGameExporter(pick_consensus=pick_consensus)
             if exporter.export_all():
                 print("✅ Export completed successfully!")
             else:
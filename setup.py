@@ -40,6 +40,9 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    extras_require={
+        "fast": ["ijson>=3.1", "orjson>=3.6", "zstandard>=0.15"],
+    },
     entry_points={
         "console_scripts": [
             "pickem-automation=main:main",
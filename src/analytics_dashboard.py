@@ -3,8 +3,8 @@ Analytics Dashboard for Sleeper Pickem League
 Provides comprehensive analytics and insights for league performance
 """
 
-import requests
 import json
+import threading
 import pandas as pd
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
@@ -12,6 +12,7 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
+from urllib.parse import urlparse
 from collections import defaultdict, Counter
 import numpy as np
 from dataclasses import dataclass
@@ -19,16 +20,32 @@ from dataclasses import dataclass
 # Handle both relative and absolute imports
 try:
     from .secure_config import config
+    from .sleeper_client import SleeperClient
+    from .roster_parser import iter_compact_rosters
+    from .compact_records import RosterTable, WeeklyScores
+    from .perf_metrics import metrics
+    from .metadata_cache import MetadataCache
+    from .player_stats import PlayerStatsStore
+    from .pick_analytics import PickConsensus, PickMatrix, load_game_results
 except ImportError:
     from secure_config import config
+    from sleeper_client import SleeperClient
+    from roster_parser import iter_compact_rosters
+    from compact_records import RosterTable, WeeklyScores
+    from perf_metrics import metrics
+    from metadata_cache import MetadataCache
+    from player_stats import PlayerStatsStore
+    from pick_analytics import PickConsensus, PickMatrix, load_game_results
 
 
 @dataclass
 class PlayerPerformance:
     """Data class for player performance metrics"""
+    __slots__ = ('user_id', 'display_name', 'weekly_scores', 'total_score', 'average_score',
+                 'consistency_score', 'improvement_trend', 'perfect_weeks', 'zero_weeks')
     user_id: str
     display_name: str
-    weekly_scores: Dict[int, float]
+    weekly_scores: WeeklyScores
     total_score: float
     average_score: float
     consistency_score: float
@@ -40,6 +57,8 @@ class PlayerPerformance:
 @dataclass
 class LeagueAnalytics:
     """Data class for league-wide analytics"""
+    __slots__ = ('total_players', 'weeks_analyzed', 'average_league_score', 'score_distribution',
+                 'top_performers', 'most_improved', 'most_consistent')
     total_players: int
     weeks_analyzed: int
     average_league_score: float
@@ -52,20 +71,33 @@ class LeagueAnalytics:
 class SleeperAnalyticsDashboard:
     """Main analytics dashboard class for Sleeper pickem league"""
     
-    def __init__(self, league_id: str = None):
+    def __init__(self, league_id: str = None, base_url: str = None,
+                 metadata_cache: Optional[MetadataCache] = None,
+                 player_stats: Optional[PlayerStatsStore] = None, results_file: str = None):
         """
         Initialize the analytics dashboard
         
         Args:
             league_id: Your Sleeper league ID (optional, will use config if not provided)
+            base_url: Sleeper API root URL (optional, e.g. a local stand-in server for benchmarks)
+            metadata_cache: Stale-while-revalidate store for league info (optional, built from config)
+            player_stats: Running per-player stats kept by process_week (optional, built from results_file)
+            results_file: Results file process_week writes to (optional, defaults to config.results_path)
         """
         self.league_id = league_id or config.sleeper_league_id
-        self.base_url = "https://api.sleeper.app/v1"
+        self.client = SleeperClient(base_url, cache_directory=config.cache_directory)
+        self.base_url = self.client.base_url
+        self.metadata_cache = metadata_cache or MetadataCache(
+            config.cache_directory, config.metadata_soft_ttl, config.metadata_hard_ttl
+        )
+        self.results_file = results_file or config.results_path
+        self.player_stats = player_stats or PlayerStatsStore(self.results_file)
         
         # Cache for API data
         self._users_cache = None
         self._rosters_cache = None
         self._league_info_cache = None
+        self._cache_lock = threading.RLock()  # One fetch per cache when shared across threads
         
         # Analytics data
         self.player_performances = {}
@@ -79,43 +111,67 @@ class SleeperAnalyticsDashboard:
             plt.style.use('seaborn')
         sns.set_palette("husl")
     
+    @classmethod
+    def from_league(cls, league: dict, **kwargs) -> 'SleeperAnalyticsDashboard':
+        """
+        Dashboard over league payloads fetched elsewhere, without any API calls
+
+        Args:
+            league: Dict with 'league_info', 'users' and 'rosters' payloads (e.g. from SyntheticLeagueGenerator)
+            **kwargs: Passed to the constructor
+        """
+        board = cls(league['league_info']['league_id'], **kwargs)
+        board._league_info_cache = league['league_info']
+        board._users_cache = {user['user_id']: user for user in league['users']}
+        board._rosters_cache = RosterTable.from_rosters(league['rosters'])
+        return board
+    
     def get_league_info(self) -> dict:
-        """Get league information including current week"""
-        if self._league_info_cache is None:
-            url = f"{self.base_url}/league/{self.league_id}"
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                self._league_info_cache = response.json()
+        """Get league information including current week (stale-while-revalidate across runs)"""
+        with self._cache_lock:
+            if self._league_info_cache is None:
+                cache_key = f"{urlparse(self.base_url).netloc}/league/{self.league_id}"
+                self._league_info_cache = self.metadata_cache.get(cache_key, self._fetch_league_info)
             else:
-                raise Exception(f"Failed to get league info: {response.status_code}")
+                metrics.incr('cache_hits')
         
         return self._league_info_cache
     
+    def _fetch_league_info(self) -> dict:
+        response = self.client.get(f"/league/{self.league_id}")
+        
+        if response.status_code == 200:
+            return response.json()
+        raise Exception(f"Failed to get league info: {response.status_code}")
+    
     def get_users(self) -> Dict[str, dict]:
         """Get all users in the league with caching"""
-        if self._users_cache is None:
-            url = f"{self.base_url}/league/{self.league_id}/users"
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                users = response.json()
-                self._users_cache = {user['user_id']: user for user in users}
+        with self._cache_lock:
+            if self._users_cache is None:
+                response = self.client.get(f"/league/{self.league_id}/users")
+                
+                if response.status_code == 200:
+                    users = response.json()
+                    self._users_cache = {user['user_id']: user for user in users}
+                else:
+                    raise Exception(f"Failed to get league users: {response.status_code}")
             else:
-                raise Exception(f"Failed to get league users: {response.status_code}")
+                metrics.incr('cache_hits')
         
         return self._users_cache
     
-    def get_rosters(self) -> List[dict]:
-        """Get all rosters data with caching"""
-        if self._rosters_cache is None:
-            url = f"{self.base_url}/league/{self.league_id}/rosters"
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                self._rosters_cache = response.json()
+    def get_rosters(self) -> RosterTable:
+        """Get all rosters as compact RosterRecords with caching"""
+        with self._cache_lock:
+            if self._rosters_cache is None:
+                # Parse the body as it arrives so the full payload is never held in memory
+                with self.client.stream(f"/league/{self.league_id}/rosters") as (status_code, body):
+                    if status_code == 200:
+                        self._rosters_cache = RosterTable.from_rosters(iter_compact_rosters(body))
+                    else:
+                        raise Exception(f"Failed to get rosters: {status_code}")
             else:
-                raise Exception(f"Failed to get rosters: {response.status_code}")
+                metrics.incr('cache_hits')
         
         return self._rosters_cache
     
@@ -126,48 +182,52 @@ class SleeperAnalyticsDashboard:
         
         player_performances = {}
         
+        # Running stats from process_week, trusted while the results file has not changed since
+        season = self.get_league_info().get('season', '')
+        if self.player_stats.is_current():
+            running_stats = self.player_stats.season(season)
+            stored_weeks = set(self.player_stats.weeks(season))
+        else:
+            running_stats, stored_weeks = {}, set()
+        
         for roster in rosters:
-            owner_id = roster.get('owner_id')
+            owner_id = roster.owner_id
             if not owner_id:
                 continue
             
             user_info = users.get(owner_id, {})
             display_name = user_info.get('display_name', 'Unknown')
             
-            # Extract weekly scores
-            metadata = roster.get('metadata', {})
-            points_by_leg = metadata.get('points_by_leg', {})
-            
-            weekly_scores = {}
-            for leg_key, score in points_by_leg.items():
-                # Parse "v1:regular:X" to get week number
-                if 'regular:' in leg_key:
-                    week_num = int(leg_key.split(':')[2])
-                    weekly_scores[week_num] = float(score)
+            # Weekly scores are already a sorted week/score array pair
+            weekly_scores = roster.points
             
             if not weekly_scores:
                 continue
             
             # Calculate performance metrics
-            scores = list(weekly_scores.values())
-            total_score = sum(scores)
-            average_score = total_score / len(scores) if scores else 0
+            scores = np.asarray(weekly_scores.scores)
+            total_score = float(scores.sum())
+            average_score = total_score / len(scores)
             
-            # Calculate consistency (lower standard deviation = more consistent)
-            consistency_score = 1 / (np.std(scores) + 1) if len(scores) > 1 else 1
-            
-            # Calculate improvement trend (slope of scores over time)
-            weeks = sorted(weekly_scores.keys())
-            if len(weeks) > 1:
-                x = np.array(weeks)
-                y = np.array([weekly_scores[w] for w in weeks])
-                improvement_trend = np.polyfit(x, y, 1)[0]  # Linear regression slope
+            stats = running_stats.get(owner_id)
+            if (stats is not None and stats.count == len(scores)
+                    and weekly_scores.weeks[0] in stored_weeks and weekly_scores.weeks[-1] in stored_weeks):
+                consistency_score = stats.consistency_score()
+                improvement_trend = stats.improvement_trend()
             else:
-                improvement_trend = 0
+                # Calculate consistency (lower standard deviation = more consistent)
+                consistency_score = 1 / (np.std(scores) + 1) if len(scores) > 1 else 1
+                
+                # Calculate improvement trend (slope of scores over time)
+                if len(scores) > 1:
+                    weeks = np.asarray(weekly_scores.weeks, dtype=float)
+                    improvement_trend = np.polyfit(weeks, scores, 1)[0]  # Linear regression slope
+                else:
+                    improvement_trend = 0
             
             # Count perfect and zero weeks
-            perfect_weeks = sum(1 for score in scores if score == max(scores))
-            zero_weeks = sum(1 for score in scores if score == 0)
+            perfect_weeks = int(np.count_nonzero(scores == scores.max()))
+            zero_weeks = int(np.count_nonzero(scores == 0))
             
             player_performances[owner_id] = PlayerPerformance(
                 user_id=owner_id,
@@ -437,6 +497,268 @@ class SleeperAnalyticsDashboard:
             "next_week": next_week
         }
     
+    def score_matrix(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Every player's weekly scores as one players x weeks matrix
+
+        Returns:
+            (user_ids, weeks, scores, mask) where scores[i, j] is player i's score in
+            weeks[j] and mask[i, j] says whether that week has a score at all
+        """
+        if not self.player_performances:
+            self.extract_player_data()
+        
+        user_ids = list(self.player_performances)
+        week_arrays = [np.asarray(self.player_performances[uid].weekly_scores.weeks) for uid in user_ids]
+        score_arrays = [np.asarray(self.player_performances[uid].weekly_scores.scores) for uid in user_ids]
+        if not user_ids:
+            return user_ids, np.zeros(0), np.zeros((0, 0)), np.zeros((0, 0), dtype=bool)
+        
+        all_weeks = np.concatenate(week_arrays)
+        weeks = np.unique(all_weeks)
+        rows = np.repeat(np.arange(len(user_ids)), [len(w) for w in week_arrays])
+        cols = np.searchsorted(weeks, all_weeks)
+        
+        scores = np.zeros((len(user_ids), len(weeks)))
+        mask = np.zeros((len(user_ids), len(weeks)), dtype=bool)
+        scores[rows, cols] = np.concatenate(score_arrays)
+        mask[rows, cols] = True
+        return user_ids, weeks.astype(float), scores, mask
+    
+    def predict_all(self) -> pd.DataFrame:
+        """
+        Predict next week's score for every player in one vectorized pass
+        
+        Fits the same per-player linear trend as predict_next_week_performance,
+        using closed-form least squares over the masked score matrix.
+        
+        Returns:
+            DataFrame indexed by user_id with display_name, weeks_played, slope,
+            intercept, r_squared, next_week, predicted_score and confidence
+        """
+        user_ids, weeks, scores, mask = self.score_matrix()
+        
+        x = np.where(mask, weeks[None, :], 0.0)
+        y = np.where(mask, scores, 0.0)
+        n = mask.sum(axis=1).astype(float)
+        sum_x = x.sum(axis=1)
+        sum_y = y.sum(axis=1)
+        sum_xx = (x * x).sum(axis=1)
+        sum_xy = (x * y).sum(axis=1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_y = sum_y / n
+            denominator = n * sum_xx - sum_x * sum_x
+            fitted = (n >= 2) & (denominator != 0)
+            slope = np.where(fitted, (n * sum_xy - sum_x * sum_y) / denominator, 0.0)
+            intercept = np.where(fitted, (sum_y - slope * sum_x) / n, mean_y)
+            
+            residuals = np.where(mask, y - (slope[:, None] * x + intercept[:, None]), 0.0)
+            ss_res = (residuals * residuals).sum(axis=1)
+            ss_tot = np.where(mask, y - mean_y[:, None], 0.0)
+            ss_tot = (ss_tot * ss_tot).sum(axis=1)
+            r_squared = np.where(fitted & (ss_tot != 0), 1 - ss_res / ss_tot, 0.0)
+        
+        last_week = np.where(mask, weeks[None, :], -np.inf).max(axis=1) if len(weeks) else np.zeros(0)
+        next_week = last_week + 1
+        predicted = np.where(fitted, np.maximum(0, slope * next_week + intercept), mean_y)
+        confidence = np.where(fitted, np.clip(r_squared, 0.1, 0.9), 0.1)
+        
+        return pd.DataFrame({
+            'display_name': [self.player_performances[uid].display_name for uid in user_ids],
+            'weeks_played': n.astype(int),
+            'slope': slope,
+            'intercept': intercept,
+            'r_squared': r_squared,
+            'next_week': next_week.astype(int),
+            'predicted_score': predicted,
+            'confidence': confidence,
+        }, index=pd.Index(user_ids, name='user_id'))
+    
+    def rolling_window(self, window: int) -> pd.DataFrame:
+        """
+        Moving average, moving std and windowed trend for every player and week
+        
+        Each statistic covers the player's scored weeks among the last `window`
+        weeks. Windowed sums come from differences of cumulative sums, so the
+        cost does not depend on the window size.
+        
+        Args:
+            window: Number of weeks in the window
+        
+        Returns:
+            DataFrame with user_id, display_name, week, weeks_in_window,
+            moving_average, moving_std and trend, one row per player-week with
+            at least one score in the window
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1 week")
+        
+        user_ids, weeks, scores, mask = self.score_matrix()
+        x = np.where(mask, weeks[None, :], 0.0)
+        y = np.where(mask, scores, 0.0)
+        
+        # Sum of the trailing `window` columns at every week
+        start = np.maximum(np.arange(len(weeks)) + 1 - window, 0)
+        def windowed(values):
+            totals = np.zeros((values.shape[0], values.shape[1] + 1))
+            np.cumsum(values, axis=1, out=totals[:, 1:])
+            return totals[:, 1:] - totals[:, start]
+        
+        n = windowed(mask.astype(float))
+        sum_x, sum_y = windowed(x), windowed(y)
+        sum_xx, sum_xy, sum_yy = windowed(x * x), windowed(x * y), windowed(y * y)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = sum_y / n
+            std = np.sqrt(np.maximum(sum_yy / n - mean * mean, 0.0))
+            denominator = n * sum_xx - sum_x * sum_x
+            trend = np.where((n >= 2) & (denominator != 0), (n * sum_xy - sum_x * sum_y) / denominator, 0.0)
+        
+        rows, cols = np.nonzero(n > 0)
+        names = np.array([self.player_performances[uid].display_name for uid in user_ids], dtype=object)
+        return pd.DataFrame({
+            'user_id': np.array(user_ids, dtype=object)[rows],
+            'display_name': names[rows],
+            'week': weeks[cols].astype(int),
+            'weeks_in_window': n[rows, cols].astype(int),
+            'moving_average': mean[rows, cols],
+            'moving_std': std[rows, cols],
+            'trend': trend[rows, cols],
+        })
+    
+    def recent_form(self, window: int, top_n: int = 10, rolling: pd.DataFrame = None) -> pd.DataFrame:
+        """Leaderboard of the rolling window as of the latest week (pass rolling to reuse a computed frame)"""
+        if rolling is None:
+            rolling = self.rolling_window(window)
+        latest = rolling[rolling['week'] == rolling['week'].max()]
+        return latest.sort_values(['moving_average', 'trend'], ascending=False).head(top_n)
+    
+    def _rank_matrices(self) -> Dict[str, np.ndarray]:
+        """
+        Weekly ranks and streak run lengths for every player at once
+        
+        Players with no picks and no points in a week are unranked, as in the
+        skins game. Tiers are dense ranks from the top (1 = highest score, ties
+        share a tier), so tiers 1-3 are the three paid places and the bottom
+        tier is last place.
+        """
+        user_ids, weeks, scores, mask = self.score_matrix()
+        matrix = PickMatrix.from_rosters(self.get_rosters(), weeks=weeks.astype(int))
+        pick_rows = {owner_id: row for row, owner_id in enumerate(matrix.owner_ids)}
+        pick_counts = np.zeros(scores.shape, dtype=np.int32)
+        found = [(row, pick_rows[uid]) for row, uid in enumerate(user_ids) if uid in pick_rows]
+        if found:
+            rows, source = map(list, zip(*found))
+            pick_counts[rows] = matrix.pick_counts[source]
+        ranked = mask & ~((scores == 0) & (pick_counts == 0))
+        
+        # One column-wise sort; unranked players sink to the bottom as -inf
+        values = np.where(ranked, scores, -np.inf)
+        order = np.argsort(values, axis=0, kind='stable')
+        ordered = np.take_along_axis(values, order, axis=0)
+        players = len(user_ids)
+        
+        # Dense level of each sorted slot, and the last slot of its tie group
+        new_level = np.ones(ordered.shape, dtype=bool)
+        new_level[1:] = ordered[1:] != ordered[:-1]
+        level = np.cumsum(new_level, axis=0)
+        group_end = np.where(np.append(new_level[1:], np.ones((1, ordered.shape[1]), dtype=bool), axis=0),
+                             np.arange(players)[:, None], players)
+        group_end = np.minimum.accumulate(group_end[::-1], axis=0)[::-1]
+        
+        # Scatter back to player order
+        player_level = np.empty_like(level)
+        np.put_along_axis(player_level, order, level, axis=0)
+        at_or_below = np.empty_like(group_end)
+        np.put_along_axis(at_or_below, order, group_end + 1, axis=0)
+        
+        ranked_count = ranked.sum(axis=0)
+        unranked = players - ranked_count
+        tier = level.max(axis=0, initial=0) - player_level + 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percentile = np.where(ranked, (at_or_below - unranked) / ranked_count, np.nan)
+        top3 = ranked & (tier <= 3)
+        last_place = ranked & (player_level == 1 + (unranked > 0))
+        
+        return {
+            'user_ids': user_ids, 'weeks': weeks, 'scores': scores, 'ranked': ranked,
+            'tier': tier, 'percentile': percentile,
+            'top3_streak': self._run_lengths(top3), 'last_place_streak': self._run_lengths(last_place),
+        }
+    
+    @staticmethod
+    def _run_lengths(flags: np.ndarray) -> np.ndarray:
+        """Length of the run of True ending at each column (0 where False)"""
+        counts = np.cumsum(flags, axis=1)
+        resets = np.maximum.accumulate(np.where(flags, 0, counts), axis=1)
+        return counts - resets
+    
+    def weekly_ranks(self) -> pd.DataFrame:
+        """
+        Per-week tier, percentile rank and running streaks for every player
+        
+        Returns:
+            Long DataFrame with user_id, display_name, week, score, tier,
+            percentile (share of the week's ranked players scoring at or below),
+            top3_streak and last_place_streak, one row per ranked player-week
+        """
+        ranks = self._rank_matrices()
+        rows, cols = np.nonzero(ranks['ranked'])
+        names = np.array([self.player_performances[uid].display_name for uid in ranks['user_ids']], dtype=object)
+        return pd.DataFrame({
+            'user_id': np.array(ranks['user_ids'], dtype=object)[rows],
+            'display_name': names[rows],
+            'week': ranks['weeks'][cols].astype(int),
+            'score': ranks['scores'][rows, cols],
+            'tier': ranks['tier'][rows, cols],
+            'percentile': ranks['percentile'][rows, cols],
+            'top3_streak': ranks['top3_streak'][rows, cols],
+            'last_place_streak': ranks['last_place_streak'][rows, cols],
+        })
+    
+    def streaks(self) -> pd.DataFrame:
+        """
+        Current and longest top-3 and last-place streaks for every player
+        
+        A streak is broken by any week the player is not in the tier, including
+        weeks they did not play. Current streaks run through the latest week.
+        
+        Returns:
+            DataFrame indexed by user_id with display_name, current_top3_streak,
+            longest_top3_streak, current_last_place_streak,
+            longest_last_place_streak and average_percentile
+        """
+        ranks = self._rank_matrices()
+        top3, last_place = ranks['top3_streak'], ranks['last_place_streak']
+        has_weeks = top3.shape[1] > 0
+        weeks_ranked = ranks['ranked'].sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            average_percentile = np.where(ranks['ranked'], ranks['percentile'], 0.0).sum(axis=1) / weeks_ranked
+        frame = pd.DataFrame({
+            'display_name': [self.player_performances[uid].display_name for uid in ranks['user_ids']],
+            'current_top3_streak': top3[:, -1] if has_weeks else 0,
+            'longest_top3_streak': top3.max(axis=1, initial=0),
+            'current_last_place_streak': last_place[:, -1] if has_weeks else 0,
+            'longest_last_place_streak': last_place.max(axis=1, initial=0),
+            'average_percentile': average_percentile,
+        }, index=pd.Index(ranks['user_ids'], name='user_id'))
+        return frame.sort_values(['current_top3_streak', 'longest_top3_streak'], ascending=False)
+    
+    def pick_consensus(self, outcomes: Dict[int, Dict[str, dict]] = None) -> PickConsensus:
+        """
+        Weekly team consensus and contrarian scores for every user
+        
+        Args:
+            outcomes: Week -> game results (default: data/week_N_game_results.json files)
+        """
+        matrix = PickMatrix.from_rosters(self.get_rosters())
+        if outcomes is None:
+            outcomes = load_game_results(matrix.weeks, config.data_directory)
+        names = {uid: user.get('display_name', 'Unknown') for uid, user in self.get_users().items()}
+        with metrics.span('pick_consensus', users=len(matrix), weeks=len(matrix.weeks)):
+            return PickConsensus(matrix, outcomes, names)
+    
     def generate_full_dashboard(self, output_dir: str = "outputs/analytics") -> None:
         """Generate complete analytics dashboard with all charts and summary"""
         import os
@@ -446,14 +768,17 @@ class SleeperAnalyticsDashboard:
         
         # Extract data and calculate analytics
         print("📊 Extracting player data...")
-        self.extract_player_data()
+        with metrics.span('analytics_extract'):
+            self.extract_player_data()
         
         print("📈 Calculating league analytics...")
-        self.calculate_league_analytics()
+        with metrics.span('analytics_calculate'):
+            self.calculate_league_analytics()
         
         # Generate summary
         print("📝 Generating performance summary...")
-        summary = self.generate_performance_summary()
+        with metrics.span('analytics_summary'):
+            summary = self.generate_performance_summary()
         
         # Save summary to file
         with open(f"{output_dir}/performance_summary.txt", "w") as f:
@@ -471,10 +796,19 @@ class SleeperAnalyticsDashboard:
             "improvement_trends": f"{output_dir}/improvement_trends.png"
         }
         
-        self.create_weekly_trends_chart(chart_paths["weekly_trends"])
-        self.create_score_distribution_chart(chart_paths["score_distribution"])
-        self.create_top_performers_chart(chart_paths["top_performers"])
-        self.create_improvement_trends_chart(chart_paths["improvement_trends"])
+        with metrics.span('chart_rendering', chart='weekly_trends'):
+            self.create_weekly_trends_chart(chart_paths["weekly_trends"])
+        with metrics.span('chart_rendering', chart='score_distribution'):
+            self.create_score_distribution_chart(chart_paths["score_distribution"])
+        with metrics.span('chart_rendering', chart='top_performers'):
+            self.create_top_performers_chart(chart_paths["top_performers"])
+        with metrics.span('chart_rendering', chart='improvement_trends'):
+            self.create_improvement_trends_chart(chart_paths["improvement_trends"])
+        
+        # Pick consensus and contrarian scores
+        consensus = self.pick_consensus()
+        consensus.consensus_table().to_csv(f"{output_dir}/pick_consensus.csv", index=False)
+        consensus.user_scores().to_csv(f"{output_dir}/contrarian_scores.csv")
         
         print(f"✅ Dashboard generated successfully!")
         print(f"📁 Output directory: {output_dir}")
@@ -482,6 +816,7 @@ class SleeperAnalyticsDashboard:
         for name, path in chart_paths.items():
             print(f"   • {name}: {path}")
         print(f"📝 Summary: {output_dir}/performance_summary.txt")
+        print(f"🦄 Pick consensus: {output_dir}/pick_consensus.csv, {output_dir}/contrarian_scores.csv")
 
 
 # Example usage
@@ -492,14 +827,9 @@ if __name__ == "__main__":
     # Generate full dashboard
     dashboard.generate_full_dashboard()
     
-    # Example of individual predictions
+    # League-wide predictions in one pass
     print("\n🔮 PREDICTION EXAMPLES:")
-    users = dashboard.get_users()
-    for user_id in list(users.keys())[:3]:  # Show predictions for first 3 users
-        try:
-            prediction = dashboard.predict_next_week_performance(user_id)
-            user_name = users[user_id]['display_name']
-            print(f"{user_name}: Predicted {prediction['predicted_score']:.2f} "
-                  f"(confidence: {prediction['confidence']:.2f})")
-        except Exception as e:
-            print(f"Error predicting for user {user_id}: {e}")
+    predictions = dashboard.predict_all().sort_values('predicted_score', ascending=False)
+    for _, prediction in predictions.head(3).iterrows():
+        print(f"{prediction['display_name']}: Predicted {prediction['predicted_score']:.2f} "
+              f"(confidence: {prediction['confidence']:.2f})")
@@ -8,7 +8,6 @@ and then send them via iMessage. This runs on your phone!
 
 """
 
-import json
 import os
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -16,22 +15,25 @@ from typing import Dict, List, Optional
 # Handle both relative and absolute imports
 try:
     from .secure_config import config
+    from .results_store import ResultsStore
+    from . import serialization
 except ImportError:
     from secure_config import config
+    from results_store import ResultsStore
+    import serialization
 
 class AppleShortcutsIntegration:
     """Handles Apple Shortcuts integration for iMessage notifications"""
     
     def __init__(self):
         """Initialize Apple Shortcuts integration"""
-        self.results_file = f"{config.data_directory}/{config.results_file}"
+        self.results_file = config.results_path
         print("✅ Apple Shortcuts integration ready")
     
     def get_latest_results(self) -> Optional[Dict]:
         """Get the latest week's results for Apple Shortcuts"""
         try:
-            with open(self.results_file, 'r') as f:
-                results = json.load(f)
+            results = ResultsStore(self.results_file).load()
             
             if not results:
                 return None
@@ -91,7 +93,7 @@ class AppleShortcutsIntegration:
         
         # Format winners
         winners = {
-            'highest': ', '.join(result['winner_names']['high_score']) if result['winner_names'].get('high_score') else 'None',
+            'highest': ', '.join(result['winner_names']['highest']) if result['winner_names'].get('highest') else 'None',
             'second_highest': ', '.join(result['winner_names']['second_highest']) if result['winner_names'].get('second_highest') else 'None',
             'third_highest': ', '.join(result['winner_names']['third_highest']) if result['winner_names'].get('third_highest') else 'None',
             'lowest': ', '.join(result['winner_names']['lowest']) if result['winner_names'].get('lowest') else 'None',
@@ -165,8 +167,7 @@ class AppleShortcutsIntegration:
             # Ensure the directory exists
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
             
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            serialization.dump(data, output_file)
             
             print(f"✅ Shortcuts data saved to {output_file}")
             return True
@@ -184,8 +185,7 @@ class AppleShortcutsIntegration:
             # Ensure the directory exists
             os.makedirs(os.path.dirname(output_file), exist_ok=True)
             
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            serialization.dump(data, output_file)
             
             print(f"✅ Week {week} shortcuts data saved to {output_file}")
             return True
@@ -0,0 +1,75 @@
+"""
+Circuit Breaker for Sleeper API hosts
+Stops hammering a host that keeps failing and lets one trial request through after a cool-down
+"""
+
+import threading
+import time
+from typing import Dict
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is refused because the host's breaker is open"""
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open trial -> closed"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 2, reset_timeout: float = 30.0):
+        """
+        Initialize the breaker
+
+        A weekly run makes about three API calls (league, users, rosters), each
+        only counted once its retries are used up, so two failures in a row
+        already mean the host is down for this run.
+
+        Args:
+            failure_threshold: Consecutive failed requests (after retries) that open the breaker
+            reset_timeout: Seconds to stay open before allowing a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Whether a request may be sent now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True  # the single trial request
+            return False
+
+    def record_success(self):
+        """A request succeeded: close the breaker"""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        """A request failed after its retries: count it and open the breaker if needed"""
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(host: str) -> CircuitBreaker:
+    """Get the process-wide breaker for a host"""
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker()
+        return _breakers[host]
@@ -0,0 +1,272 @@
+"""
+Compact Record Types for rosters and weekly scores
+Slotted, array-backed replacements for the nested roster dicts used in the
+ranking and analytics paths
+"""
+
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+from typing import Dict, Iterable, List, Optional
+
+NFL_TEAMS = [
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB',
+    'HOU', 'IND', 'JAX', 'KC', 'LAC', 'LAR', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+    'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS'
+]
+
+REGULAR_SEASON_PREFIX = 'v1:regular:'
+
+
+def parse_week_key(leg_key: str) -> Optional[int]:
+    """Week number from a "v1:regular:N" key (None for other legs)"""
+    if leg_key.startswith(REGULAR_SEASON_PREFIX):
+        try:
+            return int(leg_key[len(REGULAR_SEASON_PREFIX):])
+        except ValueError:
+            return None
+    return None
+
+
+class TeamCodes:
+    """Interning table mapping team abbreviations to one-byte codes"""
+
+    def __init__(self, teams: Iterable[str] = NFL_TEAMS):
+        self._codes = {}
+        self._teams = []
+        self._lock = threading.Lock()
+        for team in teams:
+            self.code(team)
+
+    def code(self, team: str) -> int:
+        """Code for a team, assigning the next free one for unknown teams"""
+        code = self._codes.get(team)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(team)
+                if code is None:
+                    if len(self._teams) >= 256:
+                        raise ValueError("More than 256 distinct teams cannot be encoded")
+                    code = len(self._teams)
+                    self._teams.append(sys.intern(team))
+                    self._codes[self._teams[code]] = code
+        return code
+
+    def find(self, team: str) -> Optional[int]:
+        """Code for a team already in the table (None for unknown teams; never assigns one)"""
+        return self._codes.get(team)
+
+    def team(self, code: int) -> str:
+        """Team abbreviation for a code"""
+        return self._teams[code]
+
+    def encode(self, teams: Iterable[str]) -> bytes:
+        """Encode a list of picks"""
+        return bytes(self.code(team) for team in teams)
+
+    def decode(self, codes: bytes) -> List[str]:
+        """Decode picks back to team abbreviations"""
+        return [self._teams[code] for code in codes]
+
+    def __len__(self) -> int:
+        return len(self._teams)
+
+
+# Shared table so codes compare equal across leagues in one process
+team_codes = TeamCodes()
+
+
+class WeeklyScores(Mapping):
+    """Read-only week -> score mapping stored as two parallel arrays"""
+
+    __slots__ = ('weeks', 'scores')
+
+    def __init__(self, weeks: Iterable[int] = (), scores: Iterable[float] = ()):
+        pairs = sorted(zip(weeks, scores))
+        self.weeks = array('H', [week for week, _ in pairs])
+        self.scores = array('d', [float(score) for _, score in pairs])
+
+    @classmethod
+    def from_points_by_leg(cls, points_by_leg: dict) -> 'WeeklyScores':
+        """Build from Sleeper's {"v1:regular:N": points} metadata"""
+        weeks = []
+        scores = []
+        for leg_key, points in points_by_leg.items():
+            week = parse_week_key(leg_key)
+            if week is not None:
+                weeks.append(week)
+                scores.append(points)
+        return cls(weeks, scores)
+
+    def __getitem__(self, week: int) -> float:
+        index = bisect_left(self.weeks, week)
+        if index < len(self.weeks) and self.weeks[index] == week:
+            return self.scores[index]
+        raise KeyError(week)
+
+    def __iter__(self):
+        return iter(self.weeks)
+
+    def __len__(self) -> int:
+        return len(self.weeks)
+
+    def __repr__(self) -> str:
+        return f"WeeklyScores({dict(self.items())})"
+
+
+class RosterRecord:
+    """One roster's pick'em data: interned owner id, score vector and encoded picks"""
+
+    __slots__ = ('owner_id', 'points', 'pick_weeks', 'pick_offsets', 'pick_data')
+
+    def __init__(self, owner_id: Optional[str], points: WeeklyScores,
+                 picks_by_week: Dict[int, List[str]] = None, codes: TeamCodes = team_codes):
+        """
+        Initialize a roster record
+
+        Args:
+            owner_id: Sleeper user id of the roster owner
+            points: Weekly scores
+            picks_by_week: Week number -> picked team abbreviations
+            codes: Team code table used to encode the picks
+        """
+        self.owner_id = sys.intern(owner_id) if owner_id else None
+        self.points = points
+
+        # All weeks' picks live in one bytes blob; pick_offsets[i]:pick_offsets[i + 1] is week i
+        self.pick_weeks = array('H')
+        self.pick_offsets = array('I', [0])
+        blob = bytearray()
+        for week in sorted(picks_by_week or {}):
+            blob += codes.encode(picks_by_week[week])
+            self.pick_weeks.append(week)
+            self.pick_offsets.append(len(blob))
+        self.pick_data = bytes(blob)
+
+    @classmethod
+    def from_roster(cls, roster: dict) -> 'RosterRecord':
+        """Build from a Sleeper roster dict (full or compacted)"""
+        metadata = roster.get('metadata') or {}
+        picks_by_week = {}
+        for leg_key, picks in (metadata.get('previous_picks') or {}).items():
+            week = parse_week_key(leg_key)
+            if week is not None:
+                picks_by_week[week] = picks or []
+        return cls(roster.get('owner_id'),
+                   WeeklyScores.from_points_by_leg(metadata.get('points_by_leg') or {}),
+                   picks_by_week)
+
+    def score(self, week: int) -> float:
+        """Score for a week (0 when the week has no entry)"""
+        return self.points.get(week, 0.0)
+
+    def pick_codes(self, week: int) -> bytes:
+        """Encoded picks for a week (empty when none were made)"""
+        index = bisect_left(self.pick_weeks, week)
+        if index < len(self.pick_weeks) and self.pick_weeks[index] == week:
+            return self.pick_data[self.pick_offsets[index]:self.pick_offsets[index + 1]]
+        return b''
+
+    def week_picks(self, week: int, codes: TeamCodes = team_codes) -> List[str]:
+        """Picked team abbreviations for a week"""
+        return codes.decode(self.pick_codes(week))
+
+    def to_roster(self, codes: TeamCodes = team_codes) -> dict:
+        """Sleeper-shaped roster dict with the pick'em metadata"""
+        return {'owner_id': self.owner_id, 'metadata': dict(RosterMetadata(self, codes))}
+
+    def __getitem__(self, key: str):
+        """Dict-style access for code written against roster dicts"""
+        if key == 'owner_id':
+            return self.owner_id
+        if key == 'metadata':
+            return RosterMetadata(self)
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self) -> str:
+        return f"RosterRecord(owner_id={self.owner_id!r}, weeks={len(self.points)})"
+
+
+class RosterMetadata(Mapping):
+    """Read-only view of a record's pick'em metadata; each key is built only when read"""
+
+    __slots__ = ('record', 'codes')
+
+    KEYS = ('points_by_leg', 'previous_picks')
+
+    def __init__(self, record: RosterRecord, codes: TeamCodes = team_codes):
+        self.record = record
+        self.codes = codes
+
+    def __getitem__(self, key: str) -> dict:
+        record = self.record
+        if key == 'points_by_leg':
+            return {f"{REGULAR_SEASON_PREFIX}{week}": score for week, score in record.points.items()}
+        if key == 'previous_picks':
+            return {f"{REGULAR_SEASON_PREFIX}{week}": record.week_picks(week, self.codes)
+                    for week in record.pick_weeks}
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+
+class RosterTable(Sequence):
+    """A league's rosters as RosterRecords with an owner index"""
+
+    __slots__ = ('records', '_by_owner')
+
+    def __init__(self, records: Iterable[RosterRecord] = ()):
+        self.records = list(records)
+        self._by_owner = {record.owner_id: record for record in self.records if record.owner_id}
+
+    @classmethod
+    def from_rosters(cls, rosters: Iterable[dict]) -> 'RosterTable':
+        """Build from Sleeper roster dicts (consumed one at a time)"""
+        return cls(RosterRecord.from_roster(roster) for roster in rosters)
+
+    def owner(self, owner_id: str) -> Optional[RosterRecord]:
+        """Record for an owner (None if they have no roster)"""
+        return self._by_owner.get(owner_id)
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+def perfect_week_winners(rosters: Iterable[RosterRecord], week: int, odds_data: Dict[str, dict],
+                         codes: TeamCodes = team_codes) -> List[str]:
+    """
+    Owners who made a correct pick for every entry in a week's game results
+
+    This is the perfect-week rule process_week applies; analytics use it too
+    so their perfect weeks match the recorded ones.
+    """
+    winning_codes = set()
+    for team, data in odds_data.items():
+        code = codes.find(team)
+        if data.get('won', False) and code is not None:
+            winning_codes.add(code)
+    total_games = len(odds_data)
+
+    winners = []
+    for roster in rosters:
+        if not roster.owner_id:
+            continue
+        picks = roster.pick_codes(week)
+        if len(picks) == total_games and all(code in winning_codes for code in picks):
+            winners.append(roster.owner_id)
+    return winners
@@ -4,29 +4,41 @@ CSV/Excel Export Module for Sleeper Fantasy Pickem Skins Game
 """
 
 import pandas as pd
-import json
 import os
 from datetime import datetime
 from typing import Dict, List, Optional
 from collections import defaultdict
 
+# Handle both relative and absolute imports
+try:
+    from .perf_metrics import metrics
+    from .results_store import ResultsStore, latest_records
+    from .standings import SeasonStandings, build_seasons
+except ImportError:
+    from perf_metrics import metrics
+    from results_store import ResultsStore, latest_records
+    from standings import SeasonStandings, build_seasons
+
 class SkinsGameExporter:
-    def __init__(self, results_file: str = "data/skins_game_results.json"):
+    def __init__(self, results_file: str = "data/skins_game_results.json", pick_consensus=None):
         """
         Initialize the exporter
         
         Args:
             results_file: Path to the results JSON file
+            pick_consensus: PickConsensus for the current season (optional, adds the
+                Pick_Consensus and Contrarian_Scores sheets)
         """
         self.results_file = results_file
+        self.standings = SeasonStandings(results_file)
+        self.pick_consensus = pick_consensus
         self.export_file_csv = "skins_game_season_report.csv"
         self.export_file_xlsx = "skins_game_season_report.xlsx"
     
     def load_results(self) -> List[dict]:
         """Load results from JSON file"""
         try:
-            with open(self.results_file, 'r') as f:
-                return json.load(f)
+            return latest_records(ResultsStore(self.results_file).load())
         except FileNotFoundError:
             print(f"❌ Results file not found: {self.results_file}")
             return []
@@ -34,14 +46,9 @@ class SkinsGameExporter:
     def create_weekly_breakdown(self, results: List[dict]) -> pd.DataFrame:
         """Create weekly breakdown DataFrame"""
         weekly_data = []
-        processed_weeks = set()  # Track processed weeks to avoid duplicates
         
-        for result in results:
-            week_key = (result['week'], result['season'])
-            if week_key in processed_weeks:
-                continue  # Skip duplicates
-            processed_weeks.add(week_key)
-            
+        # A reprocessed week's latest record wins, as in the standings
+        for result in latest_records(results):
             week_data = {
                 'Week': result['week'],
                 'Season': result['season'],
@@ -62,98 +69,65 @@ class SkinsGameExporter:
         
         return pd.DataFrame(weekly_data)
     
-    def create_season_scores(self, results: List[dict]) -> pd.DataFrame:
-        """Create season scores DataFrame with all user scores"""
-        # Collect all unique users across all weeks
-        all_users = set()
-        for result in results:
-            all_users.update(result['rankings']['highest'])
-            all_users.update(result['rankings']['second_highest'])
-            all_users.update(result['rankings']['third_highest'])
-            all_users.update(result['rankings']['lowest'])
-            all_users.update(result['rankings'].get('no_picks', []))
-        
-        # Create DataFrame with users as rows and weeks as columns
-        weeks = sorted([r['week'] for r in results])
+    def season_tables(self, results: Optional[List[dict]] = None) -> Dict[str, dict]:
+        """Standings tables for the given records, or the materialized standings when None"""
+        if results is None:
+            return self.standings.seasons()
+        return build_seasons(latest_records(results))
+    
+    def create_season_scores(self, results: Optional[List[dict]] = None) -> pd.DataFrame:
+        """Create season scores DataFrame with all user scores (one row per user per season)"""
+        seasons = self.season_tables(results)
+        weeks = sorted({week for table in seasons.values() for week in table['weeks']})
         season_data = []
         
-        for user_id in sorted(all_users):
-            user_row = {'User_ID': user_id}
-            
-            # Get user display name from any result
-            display_name = 'Unknown'
-            for result in results:
-                if user_id in result['rankings']['highest']:
-                    display_name = result['winner_names']['highest'][result['rankings']['highest'].index(user_id)]
-                    break
-                elif user_id in result['rankings']['second_highest']:
-                    display_name = result['winner_names']['second_highest'][result['rankings']['second_highest'].index(user_id)]
-                    break
-                elif user_id in result['rankings']['third_highest']:
-                    display_name = result['winner_names']['third_highest'][result['rankings']['third_highest'].index(user_id)]
-                    break
-                elif user_id in result['rankings']['lowest']:
-                    display_name = result['winner_names']['lowest'][result['rankings']['lowest'].index(user_id)]
-                    break
-                elif user_id in result['rankings'].get('no_picks', []):
-                    display_name = result['winner_names']['no_picks'][result['rankings']['no_picks'].index(user_id)]
-                    break
-            
-            user_row['Display_Name'] = display_name
-            
-            # Add scores for each week
-            for week in weeks:
-                week_result = next((r for r in results if r['week'] == week), None)
-                if week_result:
-                    if user_id in week_result['rankings']['highest']:
-                        user_row[f'Week_{week}_Score'] = week_result['scores']['highest']
-                        user_row[f'Week_{week}_Rank'] = '1st'
-                    elif user_id in week_result['rankings']['second_highest']:
-                        user_row[f'Week_{week}_Score'] = week_result['scores']['second_highest']
-                        user_row[f'Week_{week}_Rank'] = '2nd'
-                    elif user_id in week_result['rankings']['third_highest']:
-                        user_row[f'Week_{week}_Score'] = week_result['scores']['third_highest']
-                        user_row[f'Week_{week}_Rank'] = '3rd'
-                    elif user_id in week_result['rankings']['lowest']:
-                        user_row[f'Week_{week}_Score'] = week_result['scores']['lowest']
-                        user_row[f'Week_{week}_Rank'] = 'Last'
-                    elif user_id in week_result['rankings'].get('no_picks', []):
-                        user_row[f'Week_{week}_Score'] = 0
-                        user_row[f'Week_{week}_Rank'] = 'No Picks'
-                    else:
-                        user_row[f'Week_{week}_Score'] = ''
-                        user_row[f'Week_{week}_Rank'] = ''
-                else:
-                    user_row[f'Week_{week}_Score'] = ''
-                    user_row[f'Week_{week}_Rank'] = ''
-            
-            # Calculate season totals
-            total_score = 0
-            wins = 0
-            perfect_weeks = 0
-            
-            for week in weeks:
-                week_result = next((r for r in results if r['week'] == week), None)
-                if week_result and f'Week_{week}_Score' in user_row and user_row[f'Week_{week}_Score'] != '':
-                    total_score += user_row[f'Week_{week}_Score']
-                    if user_row[f'Week_{week}_Rank'] == '1st':
-                        wins += 1
-                    if user_id in week_result['perfect_week_winners']:
-                        perfect_weeks += 1
-            
-            user_row['Total_Score'] = total_score
-            user_row['Total_Wins'] = wins
-            user_row['Perfect_Weeks'] = perfect_weeks
-            
-            season_data.append(user_row)
+        for season in sorted(seasons.keys(), key=int):
+            users = seasons[season]['users']
+            for user_id in sorted(users):
+                user = users[user_id]
+                user_row = {'Season': int(season), 'User_ID': user_id, 'Display_Name': user['name']}
+                
+                # Add scores for each week
+                for week in weeks:
+                    score, rank, _ = user['weeks'].get(str(week), ('', '', 0))
+                    user_row[f'Week_{week}_Score'] = '' if score is None else score
+                    user_row[f'Week_{week}_Rank'] = rank
+                
+                # Season totals come straight from the standings
+                user_row['Total_Score'] = user['total_score']
+                user_row['Total_Wins'] = user['wins']
+                user_row['Perfect_Weeks'] = user['perfect_weeks']
+                
+                season_data.append(user_row)
         
         return pd.DataFrame(season_data)
     
+    def create_summary(self, results: List[dict]) -> pd.DataFrame:
+        """Create the Summary sheet from the season standings"""
+        ranked_users = set()
+        total_perfect_weeks = 0
+        seasons = self.season_tables(results)
+        for table in seasons.values():
+            for user_id, user in table['users'].items():
+                if user['wins'] or user['second_place'] or user['third_place'] or user['lowest']:
+                    ranked_users.add(user_id)
+                total_perfect_weeks += user['perfect_weeks']
+        
+        return pd.DataFrame({
+            'Metric': ['Total Weeks', 'Total Users', 'Total Perfect Weeks', 'Export Date'],
+            'Value': [
+                sum(len(table['weeks']) for table in seasons.values()),
+                len(ranked_users),
+                total_perfect_weeks,
+                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            ]
+        })
+    
     def create_user_picks_data(self, results: List[dict]) -> pd.DataFrame:
         """Create user picks DataFrame (if picks data is available)"""
         picks_data = []
         
-        for result in results:
+        for result in latest_records(results):
             week = result['week']
             season = result['season']
             
@@ -174,6 +148,21 @@ class SkinsGameExporter:
         
         return pd.DataFrame(picks_data)
     
+    def create_pick_consensus(self) -> pd.DataFrame:
+        """Create the per-week team consensus DataFrame"""
+        table = self.pick_consensus.consensus_table()
+        table['share'] = table['share'].round(4)
+        return table.rename(columns={'week': 'Week', 'team': 'Team', 'picks': 'Picks',
+                                     'share': 'Share', 'won': 'Won'})
+    
+    def create_contrarian_scores(self) -> pd.DataFrame:
+        """Create the per-user contrarian score DataFrame"""
+        scores = self.pick_consensus.user_scores().reset_index()
+        return scores.round({'average_rarity': 4, 'contrarian_score': 4}).rename(columns={
+            'user_id': 'User_ID', 'display_name': 'Display_Name', 'picks': 'Picks',
+            'average_rarity': 'Average_Rarity', 'decided_picks': 'Decided_Picks',
+            'correct_picks': 'Correct_Picks', 'contrarian_score': 'Contrarian_Score'})
+    
     def export_to_csv(self, results: List[dict]) -> bool:
         """Export results to CSV file"""
         try:
@@ -190,6 +179,9 @@ class SkinsGameExporter:
                 weekly_df.to_csv(f, index=False)
                 f.write("\n\n=== SEASON SCORES ===\n")
                 season_df.to_csv(f, index=False)
+                if self.pick_consensus is not None:
+                    f.write("\n\n=== CONTRARIAN SCORES ===\n")
+                    self.create_contrarian_scores().to_csv(f, index=False)
             
             print(f"✅ CSV export completed: {self.export_file_csv}")
             return True
@@ -212,17 +204,12 @@ class SkinsGameExporter:
                 season_df.to_excel(writer, sheet_name='Season_Scores', index=False)
                 picks_df.to_excel(writer, sheet_name='User_Picks', index=False)
                 
+                if self.pick_consensus is not None:
+                    self.create_pick_consensus().to_excel(writer, sheet_name='Pick_Consensus', index=False)
+                    self.create_contrarian_scores().to_excel(writer, sheet_name='Contrarian_Scores', index=False)
+                
                 # Add summary sheet
-                summary_data = {
-                    'Metric': ['Total Weeks', 'Total Users', 'Total Perfect Weeks', 'Export Date'],
-                    'Value': [
-                        len(results),
-                        len(set().union(*[r['rankings']['highest'] + r['rankings']['second_highest'] + r['rankings']['third_highest'] + r['rankings']['lowest'] for r in results])),
-                        sum(len(r['perfect_week_winners']) for r in results),
-                        datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    ]
-                }
-                summary_df = pd.DataFrame(summary_data)
+                summary_df = self.create_summary(results)
                 summary_df.to_excel(writer, sheet_name='Summary', index=False)
             
             print(f"✅ Excel export completed: {self.export_file_xlsx}")
@@ -234,7 +221,8 @@ class SkinsGameExporter:
     
     def export_all(self) -> bool:
         """Export both CSV and Excel formats"""
-        results = self.load_results()
+        with metrics.span('export_load'):
+            results = self.load_results()
         
         if not results:
             print("❌ No results to export")
@@ -242,8 +230,10 @@ class SkinsGameExporter:
         
         print(f"📊 Exporting {len(results)} weeks of data...")
         
-        csv_success = self.export_to_csv(results)
-        excel_success = self.export_to_excel(results)
+        with metrics.span('csv_export', weeks=len(results)):
+            csv_success = self.export_to_csv(results)
+        with metrics.span('excel_export', weeks=len(results)):
+            excel_success = self.export_to_excel(results)
         
         return csv_success and excel_success
 
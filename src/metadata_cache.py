@@ -0,0 +1,118 @@
+"""
+Stale-while-revalidate cache for Sleeper league metadata
+Serves the last known value instantly and refreshes it in the background,
+persisting entries to disk so separate CLI invocations share them
+"""
+
+import atexit
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+# Handle both relative and absolute imports
+try:
+    from . import serialization
+except ImportError:
+    import serialization
+
+# Longest a CLI process waits at exit for background refreshes to land on disk
+EXIT_JOIN_TIMEOUT = 5.0
+
+
+class MetadataCache:
+    """Disk-backed stale-while-revalidate cache"""
+
+    def __init__(self, cache_directory: str, soft_ttl: float = 300, hard_ttl: float = 21600):
+        """
+        Initialize the cache
+
+        Args:
+            cache_directory: Directory holding one JSON file per key
+            soft_ttl: Age in seconds after which a cached value is refreshed in the background
+            hard_ttl: Age in seconds after which a cached value is refetched before returning
+        """
+        self.cache_directory = cache_directory
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self._lock = threading.Lock()
+        self._refreshing: Dict[str, threading.Thread] = {}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_directory, re.sub(r'[^A-Za-z0-9_.-]', '_', key) + '.json')
+
+    def _read(self, key: str) -> Optional[dict]:
+        try:
+            entry = serialization.load(self._path(key))
+            return entry if 'fetched_at' in entry and 'value' in entry else None
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, key: str, value: Any):
+        os.makedirs(self.cache_directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        serialization.dump({'fetched_at': time.time(), 'value': value}, tmp_path)
+        os.replace(tmp_path, path)
+
+    def get(self, key: str, loader: Callable[[], Any], revalidate: bool = False) -> Any:
+        """
+        Get a value, loading or refreshing it as its age requires
+
+        Args:
+            key: Cache key, e.g. "api.sleeper.app/league/123"
+            loader: Fetches a fresh value; errors propagate only on a blocking load
+            revalidate: Load before returning regardless of age (for values that drive writes)
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        entry = None if revalidate else self._read(key)
+        age = time.time() - entry['fetched_at'] if entry else None
+
+        if age is None or age >= self.hard_ttl or age < 0:
+            value = loader()
+            self._write(key, value)
+            return value
+
+        if age >= self.soft_ttl:
+            self._refresh_in_background(key, loader)
+        return entry['value']
+
+    def _refresh_in_background(self, key: str, loader: Callable[[], Any]):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            thread = threading.Thread(target=self._refresh, args=(key, loader), daemon=True)
+            self._refreshing[key] = thread
+        _pending.add(thread)
+        thread.start()
+
+    def _refresh(self, key: str, loader: Callable[[], Any]):
+        try:
+            self._write(key, loader())
+        except Exception as e:
+            print(f"⚠️  Background refresh of {key} failed: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.pop(key, None)
+            _pending.discard(threading.current_thread())
+
+    def invalidate(self, key: str):
+        """Drop a cached value so the next get loads it"""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+_pending = set()
+
+
+@atexit.register
+def _wait_for_refreshes():
+    """Give in-flight refreshes a moment to persist before the CLI exits"""
+    deadline = time.monotonic() + EXIT_JOIN_TIMEOUT
+    for thread in list(_pending):
+        thread.join(max(0.0, deadline - time.monotonic()))
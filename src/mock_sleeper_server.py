@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Local Sleeper API Stand-in Server
+=================================
+
+Serves the Sleeper endpoints this project uses from recorded or synthetic
+fixtures so load tests and benchmarks never touch api.sleeper.app.
+
+Usage:
+    python3 -m src.mock_sleeper_server --users 500 --leagues 3 --latency-ms 40
+    python3 -m src.mock_sleeper_server --fixtures data/    # files saved by SleeperAPIExplorer
+
+Then point the league classes at it:
+    export SLEEPER_API_BASE_URL=http://127.0.0.1:8765/v1
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+# Handle both relative and absolute imports
+try:
+    from .synthetic_league import SyntheticLeagueGenerator
+except ImportError:
+    from synthetic_league import SyntheticLeagueGenerator
+
+ROUTES = [
+    ('league', re.compile(r'^/league/(?P<league_id>[^/]+)$')),
+    ('users', re.compile(r'^/league/(?P<league_id>[^/]+)/users$')),
+    ('rosters', re.compile(r'^/league/(?P<league_id>[^/]+)/rosters$')),
+    ('matchups', re.compile(r'^/league/(?P<league_id>[^/]+)/matchups/(?P<week>\d+)$')),
+    ('games', re.compile(r'^/games/nfl/(?P<season>\d+)/(?P<week>\d+)$')),
+]
+
+
+class LeagueFixture:
+    """Payloads for one league, keyed the way the Sleeper API returns them"""
+
+    def __init__(self, league_info: dict, users: List[dict], rosters: List[dict],
+                 matchups: Dict[int, list] = None, games: Dict[int, dict] = None):
+        self.league_info = league_info
+        self.users = users
+        self.rosters = rosters
+        self.matchups = matchups or {}
+        self.games = games or {}
+
+    @property
+    def league_id(self) -> str:
+        return str(self.league_info.get('league_id'))
+
+    @property
+    def season(self) -> int:
+        return int(self.league_info.get('season', 2025))
+
+    @classmethod
+    def from_directory(cls, directory: str, league_id: str = None) -> 'LeagueFixture':
+        """
+        Load a fixture recorded with SleeperAPIExplorer
+
+        Expects league_info.json, users.json and rosters.json, plus any
+        week_N_matchups.json / nfl_games_week_N.json files.
+        """
+        def load(name):
+            with open(os.path.join(directory, name), 'r') as f:
+                return json.load(f)
+
+        league_info = load('league_info.json')
+        if league_id:
+            league_info['league_id'] = league_id
+
+        matchups = {}
+        games = {}
+        for filename in os.listdir(directory):
+            matchup_match = re.match(r'^week_(\d+)_matchups\.json$', filename)
+            games_match = re.match(r'^nfl_games_week_(\d+)\.json$', filename)
+            if matchup_match:
+                matchups[int(matchup_match.group(1))] = load(filename)
+            elif games_match:
+                games[int(games_match.group(1))] = load(filename)
+
+        return cls(league_info, load('users.json'), load('rosters.json'), matchups, games)
+
+    @classmethod
+    def synthetic(cls, league_id: str, num_users: int = 12, weeks: int = 17,
+                  season: int = 2025, seed: int = None) -> 'LeagueFixture':
+        """Build a pick'em league with SyntheticLeagueGenerator"""
+        generator = SyntheticLeagueGenerator(seed=seed)
+        league = generator.generate_league(league_id, num_users, season, weeks_played=weeks)
+        return cls(league['league_info'], league['users'], league['rosters'], games=league['games'])
+
+
+class MockSleeperServer:
+    """Threaded HTTP server that answers Sleeper API routes from fixtures"""
+
+    def __init__(self, leagues: List[LeagueFixture], host: str = '127.0.0.1', port: int = 0,
+                 latency: float = 0.0, latency_jitter: float = 0.0, error_rate: float = 0.0,
+                 error_status: int = 500, seed: int = None):
+        """
+        Initialize the stand-in server
+
+        Args:
+            leagues: League fixtures to serve
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Base delay added to every response, in seconds
+            latency_jitter: Extra uniformly random delay, in seconds
+            error_rate: Fraction of requests answered with error_status
+            error_status: HTTP status used for injected errors (e.g. 500, 503 or 429)
+            seed: Seed for latency and error injection
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.request_counts = Counter()
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+        self._payloads = {}
+        for league in leagues:
+            self.add_league(league)
+
+    def add_league(self, league: LeagueFixture):
+        """Register a league and pre-encode its payloads"""
+        encode = lambda data: json.dumps(data).encode('utf-8')
+        league_id = league.league_id
+        self._payloads[('league', league_id)] = encode(league.league_info)
+        self._payloads[('users', league_id)] = encode(league.users)
+        self._payloads[('rosters', league_id)] = encode(league.rosters)
+        for week, matchups in league.matchups.items():
+            self._payloads[('matchups', league_id, int(week))] = encode(matchups)
+        for week, games in league.games.items():
+            self._payloads[('games', league.season, int(week))] = encode(games)
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to hand to SleeperClient / SLEEPER_API_BASE_URL"""
+        return f"http://{self.host}:{self.port}/v1"
+
+    def resolve(self, path: str) -> Optional[bytes]:
+        """Map a request path to a pre-encoded payload (None if unknown)"""
+        path = path.split('?', 1)[0].rstrip('/')
+        if path.startswith('/v1/'):
+            path = path[3:]
+
+        for route, pattern in ROUTES:
+            match = pattern.match(path)
+            if not match:
+                continue
+            params = match.groupdict()
+            if route == 'matchups':
+                return self._payloads.get((route, params['league_id'], int(params['week'])), b'[]')
+            if route == 'games':
+                return self._payloads.get((route, int(params['season']), int(params['week'])), b'{}')
+            return self._payloads.get((route, params['league_id']))
+        return None
+
+    def _next_delay_and_error(self):
+        with self._lock:
+            delay = self.latency + (self._rng.uniform(0, self.latency_jitter) if self.latency_jitter else 0)
+            failed = self.error_rate > 0 and self._rng.random() < self.error_rate
+        return delay, failed
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                with server._lock:
+                    server.request_counts[self.path] += 1
+
+                delay, failed = server._next_delay_and_error()
+                if delay:
+                    time.sleep(delay)
+
+                if failed:
+                    self._reply(server.error_status, b'{"error": "injected failure"}')
+                    return
+
+                body = server.resolve(self.path)
+                if body is None:
+                    self._reply(404, b'null')
+                else:
+                    self._reply(200, body)
+
+            def _reply(self, status: int, body: bytes):
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if status == 429:
+                    self.send_header('Retry-After', '1')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output clean
+
+        return Handler
+
+    def start(self) -> str:
+        """Start serving in a background thread and return the base URL"""
+        self._httpd = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """Shut the server down"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    """Run the stand-in server from the command line"""
+    parser = argparse.ArgumentParser(description="Local stand-in for the Sleeper API")
+    parser.add_argument('--fixtures', type=str, help='Directory of recorded JSON fixtures (SleeperAPIExplorer output)')
+    parser.add_argument('--league-id', type=str, default='1000000000000000000', help='League ID (first league when synthetic)')
+    parser.add_argument('--leagues', type=int, default=1, help='Number of synthetic leagues to serve')
+    parser.add_argument('--users', type=int, default=12, help='Users per synthetic league')
+    parser.add_argument('--weeks', type=int, default=17, help='Completed weeks per synthetic league')
+    parser.add_argument('--season', type=int, default=2025, help='Season for synthetic leagues')
+    parser.add_argument('--host', type=str, default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Base response latency in milliseconds')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Random extra latency in milliseconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests that fail (0-1)')
+    parser.add_argument('--error-status', type=int, default=500, help='HTTP status for injected failures')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        leagues = [LeagueFixture.from_directory(args.fixtures, args.league_id)]
+    else:
+        first_id = int(args.league_id)
+        leagues = [
+            LeagueFixture.synthetic(str(first_id + i), args.users, args.weeks, args.season, args.seed)
+            for i in range(args.leagues)
+        ]
+
+    server = MockSleeperServer(
+        leagues, host=args.host, port=args.port,
+        latency=args.latency_ms / 1000, latency_jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate, error_status=args.error_status, seed=args.seed
+    )
+    base_url = server.start()
+
+    print("🧪 SLEEPER API STAND-IN SERVER")
+    print(f"   Serving {len(leagues)} league(s): {', '.join(league.league_id for league in leagues)}")
+    print(f"   export SLEEPER_API_BASE_URL={base_url}")
+    print("   Press Ctrl+C to stop")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+        print("\n👋 Server stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Run Metrics for Sleeper Skins Game Automation
+Lightweight stage timing spans and counters with JSON and Prometheus reports
+"""
+
+import os
+import re
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+# Handle both relative and absolute imports
+try:
+    from . import serialization
+except ImportError:
+    import serialization
+
+
+class RunMetrics:
+    """Collects timing spans and counters for one run"""
+
+    def __init__(self):
+        """Initialize an empty metrics collector"""
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        """Start a fresh run"""
+        with self._lock:
+            self.run_id = uuid.uuid4().hex[:12]
+            self.started_at = datetime.now()
+            self._started = time.perf_counter()
+            self.spans = []
+            self.counters = defaultdict(float)
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """
+        Time a stage of the run
+
+        Args:
+            name: Stage name, e.g. "api_fetch" or "excel_export"
+            **attrs: Extra details stored with the span (week, rows, ...)
+
+        Usage:
+            with metrics.span('ranking', week=week):
+                ...
+        """
+        stack = self._stack()
+        path = '/'.join(stack + [name])
+        stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            with self._lock:
+                self.spans.append({
+                    'name': name,
+                    'path': path,
+                    'start_offset': round(start - self._started, 6),
+                    'duration_seconds': round(duration, 6),
+                    'attrs': attrs,
+                })
+
+    def incr(self, name: str, value: float = 1):
+        """Increment a counter such as http_bytes, cache_hits or http_retries"""
+        with self._lock:
+            self.counters[name] += value
+
+    def stage_totals(self) -> Dict[str, dict]:
+        """Total time and call count per stage name"""
+        totals = {}
+        with self._lock:
+            for span in self.spans:
+                total = totals.setdefault(span['name'], {'count': 0, 'seconds': 0.0})
+                total['count'] += 1
+                total['seconds'] += span['duration_seconds']
+        for total in totals.values():
+            total['seconds'] = round(total['seconds'], 6)
+        return totals
+
+    def report(self) -> dict:
+        """Build the per-run timing report"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span['start_offset'])
+            counters = dict(self.counters)
+        return {
+            'run_id': self.run_id,
+            'started_at': self.started_at.isoformat(),
+            'duration_seconds': round(time.perf_counter() - self._started, 6),
+            'stage_totals': self.stage_totals(),
+            'counters': counters,
+            'spans': spans,
+        }
+
+    def write_report(self, output_dir: str = "outputs/metrics") -> str:
+        """
+        Save the JSON timing report
+
+        Returns:
+            Path of the written report
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        path = os.path.join(output_dir, f"run_{self.started_at.strftime('%Y%m%d_%H%M%S')}_{self.run_id}.json")
+        serialization.dump(self.report(), path, pretty=True)
+        return path
+
+    def to_prometheus(self, prefix: str = "pickem") -> str:
+        """Render the run as Prometheus text exposition format"""
+        report = self.report()
+        lines = [
+            f"# HELP {prefix}_run_duration_seconds Wall time of the last run",
+            f"# TYPE {prefix}_run_duration_seconds gauge",
+            f"{prefix}_run_duration_seconds {report['duration_seconds']}",
+            f"# HELP {prefix}_run_timestamp_seconds Start time of the last run",
+            f"# TYPE {prefix}_run_timestamp_seconds gauge",
+            f"{prefix}_run_timestamp_seconds {self.started_at.timestamp():.0f}",
+            f"# HELP {prefix}_stage_seconds Time spent per stage in the last run",
+            f"# TYPE {prefix}_stage_seconds gauge",
+        ]
+        for stage, total in sorted(report['stage_totals'].items()):
+            lines.append(f'{prefix}_stage_seconds{{stage="{stage}"}} {total["seconds"]}')
+        lines += [
+            f"# HELP {prefix}_stage_calls Number of spans per stage in the last run",
+            f"# TYPE {prefix}_stage_calls gauge",
+        ]
+        for stage, total in sorted(report['stage_totals'].items()):
+            lines.append(f'{prefix}_stage_calls{{stage="{stage}"}} {total["count"]}')
+        for counter, value in sorted(report['counters'].items()):
+            metric = f"{prefix}_{re.sub(r'[^a-zA-Z0-9_]', '_', counter)}"
+            lines += [f"# TYPE {metric} gauge", f"{metric} {value:g}"]
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str, prefix: str = "pickem") -> str:
+        """
+        Write a node exporter textfile-collector file
+
+        The file is written next to its destination and renamed so the
+        exporter never scrapes a half-written file.
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(self.to_prometheus(prefix))
+        os.replace(tmp_path, path)
+        return path
+
+    def print_summary(self):
+        """Print stage timings for the console"""
+        totals = self.stage_totals()
+        if not totals:
+            return
+        print("\n⏱️  STAGE TIMINGS")
+        for stage, total in sorted(totals.items(), key=lambda item: item[1]['seconds'], reverse=True):
+            print(f"   {stage}: {total['seconds']:.3f}s ({total['count']}x)")
+        for counter, value in sorted(self.counters.items()):
+            print(f"   {counter}: {value:g}")
+
+
+# Global metrics instance for the current run
+metrics = RunMetrics()
@@ -0,0 +1,319 @@
+"""
+Pick Analytics for the pick'em league
+Season-wide pick matrices built from the rosters' previous_picks, with
+vectorized pick-similarity (who picks like whom) and pick consensus /
+contrarian scoring
+"""
+
+import os
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Handle both relative and absolute imports
+try:
+    from .compact_records import TeamCodes, team_codes
+    from . import serialization
+except ImportError:
+    from compact_records import TeamCodes, team_codes
+    import serialization
+
+# Upper bound on uint64 words ANDed at once when comparing users (rows x users x words)
+BLOCK_WORDS = 4_000_000
+
+if hasattr(np, 'bitwise_count'):
+    _popcount = np.bitwise_count
+else:
+    _BYTE_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+    def _popcount(words: np.ndarray) -> np.ndarray:
+        """Set bits per uint64 word (numpy < 2.0 has no bitwise_count)"""
+        counts = _BYTE_POPCOUNT[words.view(np.uint8)]
+        return counts.reshape(words.shape + (8,)).sum(axis=-1, dtype=np.uint8)
+
+
+class PickMatrix:
+    """Every user's season of picks as one bitset over (week, team code) slots"""
+
+    def __init__(self, owner_ids: List[str], weeks: np.ndarray, bits: np.ndarray, codes: TeamCodes = team_codes):
+        """
+        Initialize from prebuilt bitsets (see from_rosters)
+
+        Args:
+            owner_ids: Row order
+            weeks: Week numbers, in slot order
+            bits: users x words uint64; bit (w * len(codes) + c) is set when team
+                code c was picked in weeks[w]
+            codes: Team code table the bits refer to
+        """
+        self.owner_ids = owner_ids
+        self.weeks = weeks
+        self.bits = bits
+        self.codes = codes
+        self.team_count = len(codes)
+        self.pick_counts = self.unpack().sum(axis=2, dtype=np.int32)  # users x weeks
+
+    @classmethod
+    def from_rosters(cls, rosters: Iterable, weeks: Iterable[int] = None,
+                     codes: TeamCodes = team_codes) -> 'PickMatrix':
+        """
+        Build from RosterRecords (e.g. a RosterTable)
+
+        Args:
+            rosters: Records with owner_id, pick_weeks, pick_offsets and pick_data
+            weeks: Weeks to include (default: every week anyone picked)
+            codes: Team code table the records were encoded with
+        """
+        records = [roster for roster in rosters if roster.owner_id]
+        if weeks is None:
+            week_set = set()
+            for record in records:
+                week_set.update(record.pick_weeks)
+            weeks = sorted(week_set)
+        weeks = np.asarray(sorted(weeks), dtype=np.int64)
+        team_count = len(codes)
+
+        # Flatten every (user, week, team code) pick straight from the encoded records
+        user_index, slot_index = [], []
+        for row, record in enumerate(records):
+            if not record.pick_data:
+                continue
+            picks = np.frombuffer(record.pick_data, dtype=np.uint8)
+            per_week = np.diff(np.asarray(record.pick_offsets))
+            pick_weeks = np.asarray(record.pick_weeks, dtype=np.int64)
+            columns = np.searchsorted(weeks, pick_weeks)
+            in_range = columns < len(weeks)
+            in_range[in_range] = weeks[columns[in_range]] == pick_weeks[in_range]
+            wanted = np.repeat(in_range, per_week)
+            user_index.append(np.full(int(wanted.sum()), row))
+            slot_index.append(np.repeat(columns, per_week)[wanted] * team_count + picks[wanted])
+
+        words = max(1, (len(weeks) * team_count + 63) // 64)
+        picked = np.zeros((len(records), words * 64), dtype=bool)
+        if user_index:
+            picked[np.concatenate(user_index), np.concatenate(slot_index)] = True
+        bits = np.packbits(picked, axis=1, bitorder='little').view('<u8').astype(np.uint64, copy=False)
+        return cls([record.owner_id for record in records], weeks, bits, codes)
+
+    def unpack(self) -> np.ndarray:
+        """Boolean users x weeks x teams view of the picks"""
+        picked = np.unpackbits(self.bits.view(np.uint8), axis=1, bitorder='little')
+        slots = len(self.weeks) * self.team_count
+        return picked[:, :slots].reshape(len(self.owner_ids), len(self.weeks), self.team_count).astype(bool)
+
+    def __len__(self) -> int:
+        return len(self.owner_ids)
+
+
+class PickSimilarity:
+    """Pairwise season-long pick similarity (Jaccard over all weekly picks)"""
+
+    def __init__(self, matrix: PickMatrix):
+        """
+        Initialize the similarity engine
+
+        Args:
+            matrix: Season pick matrix
+        """
+        self.matrix = matrix
+        self.total_picks = matrix.pick_counts.sum(axis=1)
+
+    def _blocks(self) -> Iterable[Tuple[int, np.ndarray, np.ndarray]]:
+        """Yield (first row, shared picks, Jaccard) for blocks of users against everyone"""
+        bits = self.matrix.bits
+        users, words = bits.shape
+        block = max(1, BLOCK_WORDS // max(1, users * words))
+        for start in range(0, users, block):
+            rows = bits[start:start + block]
+            shared = _popcount(rows[:, None] & bits[None]).sum(axis=2, dtype=np.int32)
+            union = self.total_picks[start:start + block, None] + self.total_picks[None, :] - shared
+            with np.errstate(divide='ignore', invalid='ignore'):
+                jaccard = np.where(union > 0, shared / union, 0.0)
+            yield start, shared, jaccard
+
+    def pairwise(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Full users x users matrices, rows and columns in matrix.owner_ids order
+
+        Returns:
+            (shared, jaccard): identical picks summed over the season, and
+            shared / (picks in either user's sets)
+        """
+        users = len(self.matrix)
+        shared = np.zeros((users, users), dtype=np.int32)
+        jaccard = np.zeros((users, users))
+        for start, block_shared, block_jaccard in self._blocks():
+            shared[start:start + len(block_shared)] = block_shared
+            jaccard[start:start + len(block_jaccard)] = block_jaccard
+        return shared, jaccard
+
+    def nearest(self, k: int = 5) -> pd.DataFrame:
+        """
+        Each user's k most similar pickers, without building the full matrix
+
+        Returns:
+            DataFrame with user_id, rank, neighbor_id, jaccard and shared_picks
+        """
+        owner_ids = np.array(self.matrix.owner_ids, dtype=object)
+        k = min(k, len(owner_ids) - 1)
+        if k < 1:
+            return pd.DataFrame(columns=['user_id', 'rank', 'neighbor_id', 'jaccard', 'shared_picks'])
+
+        frames = []
+        for start, shared, jaccard in self._blocks():
+            rows = np.arange(len(jaccard))
+            jaccard[rows, start + rows] = -1.0  # never your own neighbour
+            top = np.argpartition(-jaccard, k - 1, axis=1)[:, :k]
+            order = np.argsort(-np.take_along_axis(jaccard, top, axis=1), axis=1, kind='stable')
+            top = np.take_along_axis(top, order, axis=1)
+            frames.append(pd.DataFrame({
+                'user_id': np.repeat(owner_ids[start:start + len(jaccard)], k),
+                'rank': np.tile(np.arange(1, k + 1), len(jaccard)),
+                'neighbor_id': owner_ids[top].ravel(),
+                'jaccard': np.take_along_axis(jaccard, top, axis=1).ravel(),
+                'shared_picks': np.take_along_axis(shared, top, axis=1).ravel(),
+            }))
+        return pd.concat(frames, ignore_index=True)
+
+
+def load_game_results(weeks: Iterable[int], data_directory: str = "data") -> Dict[int, Dict[str, dict]]:
+    """
+    Read data/week_N_game_results.json for each week that has one
+
+    Args:
+        weeks: Weeks to look for
+        data_directory: Directory holding the game results files
+
+    Returns:
+        Week -> odds/results dictionary (team -> {'won': ..., ...})
+    """
+    outcomes = {}
+    for week in weeks:
+        path = os.path.join(data_directory, f"week_{int(week)}_game_results.json")
+        if os.path.exists(path):
+            outcomes[int(week)] = serialization.load(path)
+    return outcomes
+
+
+class PickConsensus:
+    """Per-week consensus share of every team and per-user contrarian scores"""
+
+    def __init__(self, matrix: PickMatrix, outcomes: Dict[int, Dict[str, dict]] = None,
+                 names: Dict[str, str] = None):
+        """
+        Score every user and week at once
+
+        A pick's rarity is 1 - the share of that week's pickers who took the
+        same team. The contrarian score is the average rarity of a user's picks
+        counting only the ones that won, so fading the crowd and losing scores 0.
+
+        Args:
+            matrix: Season pick matrix
+            outcomes: Week -> game results in the week_N_game_results.json format;
+                weeks without results get no contrarian score
+            names: Owner id -> display name for the output tables
+        """
+        self.matrix = matrix
+        self.names = names or {}
+        picked = matrix.unpack().astype(np.float64)
+
+        # weeks x teams
+        self.team_picks = picked.sum(axis=0).astype(np.int32)
+        self.pickers = np.count_nonzero(matrix.pick_counts, axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.shares = np.where(self.pickers[:, None] > 0, self.team_picks / self.pickers[:, None], 0.0)
+        self.won, self.decided = self._outcome_matrix(outcomes or {})
+
+        # users x weeks
+        rarity = 1.0 - self.shares
+        won = self.won.astype(np.float64)
+        self.rarity_sums = np.einsum('uwt,wt->uw', picked, rarity)
+        self.winning_rarity_sums = np.einsum('uwt,wt->uw', picked, rarity * won)
+        self.correct_picks = np.einsum('uwt,wt->uw', picked, won).round().astype(np.int32)
+
+    def _outcome_matrix(self, outcomes: Dict[int, Dict[str, dict]]) -> Tuple[np.ndarray, np.ndarray]:
+        """(weeks x teams winners, weeks with results) aligned with the pick matrix"""
+        won = np.zeros((len(self.matrix.weeks), self.matrix.team_count), dtype=bool)
+        decided = np.zeros(len(self.matrix.weeks), dtype=bool)
+        for col, week in enumerate(self.matrix.weeks):
+            results = outcomes.get(int(week))
+            if not results:
+                continue
+            decided[col] = True
+            for team, data in results.items():
+                # Teams nobody could have picked have no column; looking them up must not add codes
+                code = self.matrix.codes.find(team)
+                if data.get('won', False) and code is not None and code < self.matrix.team_count:
+                    won[col, code] = True
+        return won, decided
+
+    def _names(self, owner_ids) -> List[str]:
+        return [self.names.get(owner_id, 'Unknown') for owner_id in owner_ids]
+
+    def consensus_table(self) -> pd.DataFrame:
+        """
+        Every picked team's share of each week's pickers
+
+        Returns:
+            DataFrame with week, team, picks, share and won (NA until the
+            week's results are in), most popular pick first within each week
+        """
+        cols, codes = np.nonzero(self.team_picks)
+        won = pd.array(self.won[cols, codes], dtype='boolean')
+        won[~self.decided[cols]] = pd.NA
+        table = pd.DataFrame({
+            'week': self.matrix.weeks[cols],
+            'team': [self.matrix.codes.team(code) for code in codes],
+            'picks': self.team_picks[cols, codes],
+            'share': self.shares[cols, codes],
+            'won': won,
+        })
+        return table.sort_values(['week', 'share'], ascending=[True, False], kind='stable').reset_index(drop=True)
+
+    def weekly_scores(self) -> pd.DataFrame:
+        """
+        Contrarian score for every user and week they picked
+
+        Returns:
+            Long DataFrame with user_id, display_name, week, picks, average_rarity,
+            correct_picks and contrarian_score (NaN for weeks without results)
+        """
+        rows, cols = np.nonzero(self.matrix.pick_counts)
+        picks = self.matrix.pick_counts[rows, cols]
+        owner_ids = np.array(self.matrix.owner_ids, dtype=object)[rows]
+        decided = self.decided[cols]
+        return pd.DataFrame({
+            'user_id': owner_ids,
+            'display_name': self._names(owner_ids),
+            'week': self.matrix.weeks[cols],
+            'picks': picks,
+            'average_rarity': self.rarity_sums[rows, cols] / picks,
+            'correct_picks': np.where(decided, self.correct_picks[rows, cols], np.nan),
+            'contrarian_score': np.where(decided, self.winning_rarity_sums[rows, cols] / picks, np.nan),
+        })
+
+    def user_scores(self) -> pd.DataFrame:
+        """
+        Season contrarian score per user over the weeks with results
+
+        Returns:
+            DataFrame indexed by user_id with display_name, picks, average_rarity,
+            decided_picks, correct_picks and contrarian_score, most contrarian first
+        """
+        counts = self.matrix.pick_counts
+        picks = counts.sum(axis=1)
+        decided_picks = counts[:, self.decided].sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            average_rarity = np.where(picks > 0, self.rarity_sums.sum(axis=1) / picks, np.nan)
+            contrarian = np.where(decided_picks > 0,
+                                  self.winning_rarity_sums[:, self.decided].sum(axis=1) / decided_picks, np.nan)
+        frame = pd.DataFrame({
+            'display_name': self._names(self.matrix.owner_ids),
+            'picks': picks,
+            'average_rarity': average_rarity,
+            'decided_picks': decided_picks,
+            'correct_picks': self.correct_picks[:, self.decided].sum(axis=1),
+            'contrarian_score': contrarian,
+        }, index=pd.Index(self.matrix.owner_ids, name='user_id'))
+        return frame.sort_values(['contrarian_score', 'average_rarity'], ascending=False, na_position='last')
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Running Player Statistics for the analytics dashboard
+=====================================================
+
+Per-player accumulators (count, Welford mean/M2 and the regression sums) kept
+next to the results file as <results>_player_stats.json. process_week adds the
+week it just scored, so consistency and improvement trend come from a few
+numbers per player instead of a pass over every week played. The file records
+the results file's size and mtime, so readers can tell when it is out of date.
+
+Usage:
+    python3 -m src.player_stats rebuild      # recompute the current season from the rosters
+"""
+
+import math
+import os
+import sys
+from typing import Dict, Iterable, List, Optional
+
+# Handle both relative and absolute imports
+try:
+    from . import serialization
+except ImportError:
+    import serialization
+
+STATS_VERSION = 1
+
+
+class RunningStats:
+    """Online mean/variance (Welford) plus least-squares sums for score vs week"""
+
+    __slots__ = ('count', 'mean', 'm2', 'sum_x', 'sum_y', 'sum_xy', 'sum_xx')
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0, sum_x: float = 0.0,
+                 sum_y: float = 0.0, sum_xy: float = 0.0, sum_xx: float = 0.0):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.sum_x = sum_x
+        self.sum_y = sum_y
+        self.sum_xy = sum_xy
+        self.sum_xx = sum_xx
+
+    @classmethod
+    def from_scores(cls, weeks: Iterable[float], scores: Iterable[float]) -> 'RunningStats':
+        """Accumulate a whole score history"""
+        stats = cls()
+        for week, score in zip(weeks, scores):
+            stats.update(week, score)
+        return stats
+
+    def update(self, week: float, score: float):
+        """Add one week's score"""
+        self.count += 1
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (score - self.mean)
+        self.sum_x += week
+        self.sum_y += score
+        self.sum_xy += week * score
+        self.sum_xx += week * week
+
+    def std(self) -> float:
+        """Population standard deviation (same as np.std)"""
+        return math.sqrt(self.m2 / self.count) if self.count else 0.0
+
+    def slope(self) -> float:
+        """Least-squares slope of score against week (0 when undefined)"""
+        denominator = self.count * self.sum_xx - self.sum_x * self.sum_x
+        if self.count < 2 or denominator == 0:
+            return 0.0
+        return (self.count * self.sum_xy - self.sum_x * self.sum_y) / denominator
+
+    def consistency_score(self) -> float:
+        """1 / (std + 1), as the dashboard defines it"""
+        return 1 / (self.std() + 1) if self.count > 1 else 1
+
+    def improvement_trend(self) -> float:
+        """Slope of scores over time, as the dashboard defines it"""
+        return self.slope() if self.count > 1 else 0
+
+    def to_list(self) -> list:
+        return [self.count, self.mean, self.m2, self.sum_x, self.sum_y, self.sum_xy, self.sum_xx]
+
+    @classmethod
+    def from_list(cls, values: list) -> 'RunningStats':
+        return cls(*values)
+
+    def __repr__(self) -> str:
+        return f"RunningStats(count={self.count}, mean={self.mean:.3f}, std={self.std():.3f})"
+
+
+def stats_path(results_file: str) -> str:
+    """Player stats file kept next to a results file"""
+    return f"{os.path.splitext(results_file)[0]}_player_stats.json"
+
+
+class PlayerStatsStore:
+    """Per-season running stats for every player, persisted as JSON"""
+
+    def __init__(self, results_file: str):
+        """
+        Initialize the store
+
+        Args:
+            results_file: Results file the stats live next to
+        """
+        self.results_file = results_file
+        self.path = stats_path(results_file)
+
+    def _results_stamp(self) -> Optional[List[int]]:
+        try:
+            stat = os.stat(self.results_file)
+        except FileNotFoundError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _read_document(self) -> dict:
+        try:
+            document = serialization.load(self.path)
+        except (FileNotFoundError, ValueError):
+            document = None
+        if not document or document.get('schema_version') != STATS_VERSION:
+            document = {'schema_version': STATS_VERSION, 'seasons': {}}
+        return document
+
+    def _write_document(self, document: dict):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        document['results_stamp'] = self._results_stamp()
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        serialization.dump(document, tmp_path)
+        os.replace(tmp_path, self.path)
+
+    def is_current(self) -> bool:
+        """Whether the stats were written after the results file last changed"""
+        return self._read_document().get('results_stamp') == self._results_stamp()
+
+    def season(self, season) -> Dict[str, RunningStats]:
+        """Owner id -> running stats for a season (empty if nothing was recorded)"""
+        players = self._read_document()['seasons'].get(str(season), {}).get('players', {})
+        return {owner_id: RunningStats.from_list(values) for owner_id, values in players.items()}
+
+    def weeks(self, season) -> list:
+        """Weeks already folded into a season's stats"""
+        return self._read_document()['seasons'].get(str(season), {}).get('weeks', [])
+
+    def apply_week(self, season, week: int, scores: Dict[str, float]) -> bool:
+        """
+        Add one week's scores to the running stats
+
+        A week that was already applied is skipped (use rebuild after score
+        corrections).
+
+        Args:
+            season: Season year
+            week: Week number
+            scores: Owner id -> score for every player with a score that week
+
+        Returns:
+            True if the week was added
+        """
+        document = self._read_document()
+        table = document['seasons'].setdefault(str(season), {'weeks': [], 'players': {}})
+        if week in table['weeks']:
+            return False
+
+        players = table['players']
+        for owner_id, score in scores.items():
+            stats = RunningStats.from_list(players[owner_id]) if owner_id in players else RunningStats()
+            stats.update(week, score)
+            players[owner_id] = stats.to_list()
+        table['weeks'] = sorted(table['weeks'] + [week])
+        self._write_document(document)
+        return True
+
+    def rebuild(self, season, rosters) -> Dict[str, RunningStats]:
+        """
+        Recompute a season's stats from full roster histories
+
+        Args:
+            season: Season year
+            rosters: RosterRecords (or anything with owner_id and a WeeklyScores points)
+        """
+        document = self._read_document()
+        players = {}
+        weeks = set()
+        for roster in rosters:
+            if roster.owner_id and len(roster.points):
+                stats = RunningStats.from_scores(roster.points.weeks, roster.points.scores)
+                players[roster.owner_id] = stats.to_list()
+                weeks.update(roster.points.weeks)
+        document['seasons'][str(season)] = {'weeks': sorted(weeks), 'players': players}
+        self._write_document(document)
+        return {owner_id: RunningStats.from_list(values) for owner_id, values in players.items()}
+
+
+def main():
+    """Rebuild the current season's player stats from the command line"""
+    if len(sys.argv) < 2 or sys.argv[1] != 'rebuild':
+        print("Usage: python3 -m src.player_stats rebuild")
+        return
+
+    # Handle both relative and absolute imports
+    try:
+        from .skins_game_mvp import SleeperSkinsGameMVP
+    except ImportError:
+        from skins_game_mvp import SleeperSkinsGameMVP
+
+    game = SleeperSkinsGameMVP()
+    season = int(game.get_league_info().get('season', 2025))
+    stats = PlayerStatsStore(game.results_file).rebuild(season, game.get_rosters())
+    print(f"📈 Rebuilt {season} stats for {len(stats)} players in {stats_path(game.results_file)}")
+
+
+if __name__ == "__main__":
+    main()
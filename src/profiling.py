@@ -0,0 +1,102 @@
+"""
+Profiling support for the command-line tools
+Wraps a run in cProfile (and optionally tracemalloc) and saves the results
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Optional
+
+
+class ProfileSession:
+    """Context manager that profiles everything run inside it"""
+
+    def __init__(self, label: str = "run", output_dir: str = "outputs/profiles",
+                 top_n: int = 25, trace_memory: bool = False):
+        """
+        Initialize a profiling session
+
+        Args:
+            label: Name used in the output file names (e.g. the CLI command)
+            output_dir: Directory for the .pstats and summary files
+            top_n: Number of hot functions / allocation sites to list in the summary
+            trace_memory: Also trace allocations with tracemalloc (slower)
+        """
+        self.label = ''.join(c if c.isalnum() or c in '-_' else '_' for c in label) or 'run'
+        self.output_dir = output_dir
+        self.top_n = top_n
+        self.trace_memory = trace_memory
+        self.profiler = cProfile.Profile()
+        self.stats_path = None
+        self.summary_path = None
+        self._memory_snapshot = None
+        self._memory_peak = 0
+        self._wall_time = 0.0
+
+    def __enter__(self):
+        if self.trace_memory:
+            tracemalloc.start(10)
+        self._started = time.perf_counter()
+        self.profiler.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.disable()
+        self._wall_time = time.perf_counter() - self._started
+        if self.trace_memory:
+            self._memory_snapshot = tracemalloc.take_snapshot()
+            self._memory_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        self.save()
+        return False
+
+    def save(self):
+        """Write the pstats file and the text summary"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"{self.label}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        self.stats_path = f"{base}.pstats"
+        self.summary_path = f"{base}.txt"
+
+        self.profiler.dump_stats(self.stats_path)
+        with open(self.summary_path, 'w') as f:
+            f.write(self.summary())
+
+        print(f"\n🔬 Profile saved: {self.stats_path}")
+        print(f"📝 Hot-function summary: {self.summary_path}")
+
+    def summary(self) -> str:
+        """Top-N hot functions (and allocation sites when tracing memory)"""
+        text = f"PROFILE: {self.label}\n"
+        text += f"Wall time: {self._wall_time:.3f}s\n"
+
+        for sort_key, title in (('cumulative', 'CUMULATIVE TIME'), ('tottime', 'OWN TIME')):
+            stream = io.StringIO()
+            stats = pstats.Stats(self.profiler, stream=stream)
+            stats.strip_dirs().sort_stats(sort_key).print_stats(self.top_n)
+            text += f"\n{'=' * 60}\nTOP {self.top_n} BY {title}\n{'=' * 60}\n{stream.getvalue()}"
+
+        if self._memory_snapshot is not None:
+            snapshot = self._memory_snapshot.filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ])
+            text += f"\n{'=' * 60}\nTOP {self.top_n} ALLOCATION SITES\n{'=' * 60}\n"
+            text += f"Peak traced memory: {self._memory_peak / 1024 / 1024:.1f} MiB\n"
+            for stat in snapshot.statistics('lineno')[:self.top_n]:
+                frame = stat.traceback[0]
+                text += (f"{stat.size / 1024:10.1f} KiB {stat.count:8d} blocks  "
+                         f"{frame.filename}:{frame.lineno}\n")
+
+        return text
+
+
+def print_profile_hint(session: Optional[ProfileSession]):
+    """Remind the user how to dig into a saved profile"""
+    if session and session.stats_path:
+        print(f"💡 Explore with: python -m pstats {session.stats_path}")
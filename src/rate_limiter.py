@@ -0,0 +1,165 @@
+"""
+Client-side Rate Limiter for Sleeper API calls
+Token bucket whose state is shared by every process on the machine through a lock file
+"""
+
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to a per-process bucket
+    fcntl = None
+
+# Published Sleeper guidance: stay under 1000 calls per minute per IP
+DEFAULT_REQUESTS_PER_MINUTE = 1000
+DEFAULT_BURST = 20
+# One bucket per local user, so other accounts can neither drain nor corrupt it
+DEFAULT_STATE_FILE = os.path.join(
+    tempfile.gettempdir(),
+    f"sleeper_api_rate_limit.{os.getuid() if hasattr(os, 'getuid') else 'default'}.state",
+)
+
+_STATE = struct.Struct('dd')  # tokens, last refill (epoch seconds)
+
+
+class RateLimitTimeout(Exception):
+    """Raised when a token could not be acquired within the timeout"""
+
+
+class TokenBucketRateLimiter:
+    """Token bucket limiter that can be shared across threads and worker processes"""
+
+    def __init__(self, requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+                 burst: float = DEFAULT_BURST, state_file: Optional[str] = DEFAULT_STATE_FILE):
+        """
+        Initialize the rate limiter
+
+        Args:
+            requests_per_minute: Sustained request budget (0 disables limiting)
+            burst: Maximum tokens that can accumulate while idle
+            state_file: File holding the shared bucket (None keeps the bucket in this process only)
+        """
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1.0, float(burst))
+        self.state_file = state_file if fcntl is not None else None
+        self._thread_lock = threading.Lock()
+        self._local_state = (self.capacity, time.time())
+        self._fd = None
+        self._pid = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def _open(self) -> int:
+        # flock locks belong to the open file, so a forked worker needs its own descriptor
+        if self._fd is not None and self._pid != os.getpid():
+            os.close(self._fd)
+            self._fd = None
+        if self._fd is None:
+            self._pid = os.getpid()
+            directory = os.path.dirname(self.state_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT | getattr(os, 'O_NOFOLLOW', 0), 0o600)
+            if os.fstat(fd).st_uid != os.getuid():
+                # Someone else created the path first; never share a bucket they control
+                os.close(fd)
+                raise PermissionError(f"Rate limit state file {self.state_file} belongs to another user")
+            self._fd = fd
+        return self._fd
+
+    def _read_state(self):
+        if not self.state_file:
+            return self._local_state
+        data = os.pread(self._fd, _STATE.size, 0)
+        if len(data) < _STATE.size:
+            return self.capacity, time.time()
+        return _STATE.unpack(data)
+
+    def _write_state(self, tokens: float, updated: float):
+        if not self.state_file:
+            self._local_state = (tokens, updated)
+        else:
+            os.pwrite(self._fd, _STATE.pack(tokens, updated), 0)
+
+    def _try_take(self, tokens: float) -> float:
+        """Take tokens if available; otherwise return how long to wait"""
+        with self._thread_lock:
+            if self.state_file:
+                fcntl.flock(self._open(), fcntl.LOCK_EX)
+            try:
+                available, updated = self._read_state()
+                now = time.time()
+                available = min(self.capacity, available + max(0.0, now - updated) * self.rate)
+
+                if available >= tokens:
+                    self._write_state(available - tokens, now)
+                    return 0.0
+
+                self._write_state(available, now)
+                return (tokens - available) / self.rate
+            finally:
+                if self.state_file:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> float:
+        """
+        Block until tokens are available
+
+        Args:
+            tokens: Tokens to take (one per request)
+            timeout: Give up after this many seconds (None waits indefinitely)
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket can ever hold
+        """
+        if not self.enabled:
+            return 0.0
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity:g}")
+
+        started = time.monotonic()
+        while True:
+            wait = self._try_take(tokens)
+            if wait <= 0:
+                return time.monotonic() - started
+            if timeout is not None and time.monotonic() - started + wait > timeout:
+                raise RateLimitTimeout(f"Sleeper rate limit: no capacity within {timeout}s")
+            time.sleep(wait)
+
+    def close(self):
+        """Release the state file handle"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+_default_limiter = None
+_default_lock = threading.Lock()
+
+
+def get_default_rate_limiter() -> TokenBucketRateLimiter:
+    """
+    Get the process-wide limiter used by SleeperClient
+
+    Configured with SLEEPER_RATE_LIMIT_PER_MINUTE (0 disables), SLEEPER_RATE_LIMIT_BURST
+    and SLEEPER_RATE_LIMIT_STATE_FILE.
+    """
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = TokenBucketRateLimiter(
+                requests_per_minute=float(os.getenv('SLEEPER_RATE_LIMIT_PER_MINUTE', DEFAULT_REQUESTS_PER_MINUTE)),
+                burst=float(os.getenv('SLEEPER_RATE_LIMIT_BURST', DEFAULT_BURST)),
+                state_file=os.getenv('SLEEPER_RATE_LIMIT_STATE_FILE', DEFAULT_STATE_FILE),
+            )
+        return _default_limiter
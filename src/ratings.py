@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Elo Ratings for the pick'em league
+==================================
+
+Each week is a multi-player contest: every player who picked is compared
+with every other player that week (win, tie or loss by score), and ratings
+move by K * (actual - expected) averaged over the opponents. The rating
+state lives next to the results file as <results>_ratings.json and
+process_week applies only the week it just scored.
+
+Ratings carry over between seasons. The state keeps each season's starting
+ratings, so a season can be replayed from its roster score histories
+without touching earlier seasons.
+
+Usage:
+    python3 -m src.ratings rebuild      # replay the current season from the rosters
+    python3 -m src.ratings show         # print the current leaderboard
+"""
+
+import os
+import sys
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+# Handle both relative and absolute imports
+try:
+    from . import serialization
+except ImportError:
+    import serialization
+
+RATINGS_VERSION = 1
+INITIAL_RATING = 1500.0
+K_FACTOR = 32.0
+
+# Upper bound on pairwise expected scores held in memory at once (rows x players)
+BLOCK_ELEMENTS = 4_000_000
+
+
+def ratings_path(results_file: str) -> str:
+    """Ratings file kept next to a results file"""
+    return f"{os.path.splitext(results_file)[0]}_ratings.json"
+
+
+def expected_scores(ratings: np.ndarray) -> np.ndarray:
+    """
+    Each player's expected head-to-head wins against the rest of the field
+
+    Args:
+        ratings: Ratings of the week's players
+
+    Returns:
+        Sum over opponents j of 1 / (1 + 10 ** ((r_j - r_i) / 400))
+    """
+    # 1 / (1 + 10 ** ((r_j - r_i) / 400)) == q_i / (q_i + q_j) with q = 10 ** (r / 400)
+    strength = 10.0 ** ((ratings - ratings.mean()) / 400.0) if len(ratings) else ratings
+    players = len(ratings)
+    expected = np.empty(players)
+    block = max(1, BLOCK_ELEMENTS // max(1, players))
+    for start in range(0, players, block):
+        rows = strength[start:start + block, None]
+        expected[start:start + block] = (rows / (rows + strength[None, :])).sum(axis=1)
+    return expected - 0.5  # drop each player's game against themselves
+
+
+def actual_scores(scores: np.ndarray) -> np.ndarray:
+    """Head-to-head wins against the rest of the field (ties count half)"""
+    ordered = np.sort(scores)
+    below = np.searchsorted(ordered, scores, side='left')
+    at_or_below = np.searchsorted(ordered, scores, side='right')
+    return below + 0.5 * (at_or_below - below - 1)
+
+
+def rate_week(ratings: np.ndarray, scores: np.ndarray, k_factor: float = K_FACTOR) -> np.ndarray:
+    """
+    New ratings after one week's contest
+
+    Args:
+        ratings: Current ratings of the week's players
+        scores: Their scores that week
+        k_factor: Largest possible rating change in one week
+
+    Returns:
+        Updated ratings, same order
+    """
+    if len(ratings) < 2:
+        return ratings.copy()
+    return ratings + k_factor * (actual_scores(scores) - expected_scores(ratings)) / (len(ratings) - 1)
+
+
+class EloRatingStore:
+    """Persisted Elo ratings updated one processed week at a time"""
+
+    def __init__(self, results_file: str, k_factor: float = K_FACTOR, initial_rating: float = INITIAL_RATING):
+        """
+        Initialize the store
+
+        Args:
+            results_file: Results file the ratings live next to
+            k_factor: Largest possible rating change in one week
+            initial_rating: Rating of a player's first week
+        """
+        self.path = ratings_path(results_file)
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+
+    def _read_document(self) -> dict:
+        try:
+            document = serialization.load(self.path)
+        except (FileNotFoundError, ValueError):
+            document = None
+        if not document or document.get('schema_version') != RATINGS_VERSION:
+            document = {'schema_version': RATINGS_VERSION, 'players': {}, 'seasons': {}}
+        return document
+
+    def _write_document(self, document: dict):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        serialization.dump(document, tmp_path)
+        os.replace(tmp_path, self.path)
+
+    def ratings(self) -> Dict[str, Tuple[float, int]]:
+        """Owner id -> (rating, weeks rated)"""
+        return {owner_id: (rating, weeks) for owner_id, (rating, weeks) in self._read_document()['players'].items()}
+
+    def weeks(self, season) -> List[int]:
+        """Weeks of a season already applied"""
+        return self._read_document()['seasons'].get(str(season), {}).get('weeks', [])
+
+    def leaderboard(self) -> List[Tuple[str, float, int]]:
+        """(owner id, rating, weeks rated), highest rating first"""
+        players = self.ratings()
+        return sorted(((owner_id, rating, weeks) for owner_id, (rating, weeks) in players.items()),
+                      key=lambda item: item[1], reverse=True)
+
+    def _apply(self, document: dict, season, week: int, scores: Dict[str, float]) -> bool:
+        table = document['seasons'].get(str(season))
+        if table is None:
+            # Remember where the season started so it can be replayed on its own
+            table = document['seasons'][str(season)] = {'weeks': [], 'start': dict(document['players'])}
+        if week in table['weeks']:
+            return False
+
+        players = document['players']
+        owner_ids = list(scores)
+        current = np.array([players.get(owner_id, (self.initial_rating, 0))[0] for owner_id in owner_ids])
+        updated = rate_week(current, np.array([scores[owner_id] for owner_id in owner_ids], dtype=float),
+                            self.k_factor)
+        for owner_id, rating in zip(owner_ids, updated.tolist()):
+            players[owner_id] = [rating, players.get(owner_id, (0, 0))[1] + 1]
+        table['weeks'] = sorted(table['weeks'] + [week])
+        return True
+
+    def apply_week(self, season, week: int, scores: Dict[str, float]) -> bool:
+        """
+        Rate one week's contest
+
+        A week that was already applied is skipped (use rebuild after score
+        corrections).
+
+        Args:
+            season: Season year
+            week: Week number
+            scores: Owner id -> score for every player who picked that week
+
+        Returns:
+            True if the week was applied
+        """
+        document = self._read_document()
+        if not self._apply(document, season, week, scores):
+            return False
+        self._write_document(document)
+        return True
+
+    def rebuild(self, season, rosters: Iterable) -> Dict[str, Tuple[float, int]]:
+        """
+        Replay a season in week order from full roster histories
+
+        Starts from the ratings the season began with. Only the latest season
+        can be replayed, since later seasons build on its final ratings. A week
+        with 0 points and no picks doesn't count as played.
+
+        Args:
+            season: Season year
+            rosters: RosterRecords (owner_id, points and pick_codes)
+        """
+        weekly = {}
+        for roster in rosters:
+            if not roster.owner_id:
+                continue
+            for week, score in zip(roster.points.weeks, roster.points.scores):
+                if score == 0 and not roster.pick_codes(week):
+                    continue
+                weekly.setdefault(week, {})[roster.owner_id] = score
+
+        document = self._read_document()
+        later = [other for other in document['seasons'] if int(other) > int(season)]
+        if later:
+            raise ValueError(f"Cannot replay {season}: ratings for {', '.join(sorted(later))} build on it")
+        table = document['seasons'].pop(str(season), None)
+        if table is not None:
+            document['players'] = dict(table['start'])
+        document['seasons'][str(season)] = {'weeks': [], 'start': dict(document['players'])}
+        for week in sorted(weekly):
+            self._apply(document, season, week, weekly[week])
+        self._write_document(document)
+        return self.ratings()
+
+
+def main():
+    """Rebuild or show the ratings from the command line"""
+    if len(sys.argv) < 2 or sys.argv[1] not in ('rebuild', 'show'):
+        print("Usage: python3 -m src.ratings rebuild|show")
+        return
+
+    # Handle both relative and absolute imports
+    try:
+        from .skins_game_mvp import SleeperSkinsGameMVP
+    except ImportError:
+        from skins_game_mvp import SleeperSkinsGameMVP
+
+    game = SleeperSkinsGameMVP()
+    store = EloRatingStore(game.results_file)
+    if sys.argv[1] == 'rebuild':
+        season = int(game.get_league_info().get('season', 2025))
+        ratings = store.rebuild(season, game.get_rosters())
+        print(f"🏅 Replayed {season} ({len(store.weeks(season))} weeks) for {len(ratings)} players "
+              f"in {ratings_path(game.results_file)}")
+        return
+
+    users = game.get_users()
+    print("🏅 ELO RATINGS:")
+    for rank, (owner_id, rating, weeks) in enumerate(store.leaderboard(), 1):
+        name = users.get(owner_id, {}).get('display_name', 'Unknown')
+        print(f"   {rank:2d}. {name}: {rating:.0f} ({weeks} weeks)")
+
+
+if __name__ == "__main__":
+    main()
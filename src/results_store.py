@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Results Store for the skins game
+================================
+
+Reads and writes skins_game_results.json in the compact v2 schema:
+
+    {
+      "schema_version": 2,
+      "tiers": ["highest", "second_highest", "third_highest", "lowest", "no_picks", "perfect_week"],
+      "seasons": {
+        "2025": {
+          "users": [["<owner_id>", "<display name>"], ...],
+          "weeks": [
+            {"week": 3, "date_processed": "...", "tiers": [[0, 4], [1], [], [7], [], []],
+             "scores": [15, 14, 12, 3]}
+          ]
+        }
+      }
+    }
+
+Each season stores its users once; tiers are index arrays into that list and
+scores follow the scored tiers in order. Readers get the same week records
+process_week returns (rankings, scores, perfect_week_winners, winner_names),
+so nothing downstream needs to know the file layout.
+
+Version 1 files (a plain list of week records, including the older
+high_score/underdog format) are upgraded once, keeping a .v1.bak copy.
+
+Usage:
+    python3 -m src.results_store upgrade [data/skins_game_results.json]
+"""
+
+import os
+import shutil
+import sys
+from typing import Dict, Iterable, List
+
+# Handle both relative and absolute imports
+try:
+    from . import serialization
+    from .secure_config import config
+except ImportError:
+    import serialization
+    from secure_config import config
+
+SCHEMA_VERSION = 2
+RANKING_TIERS = ['highest', 'second_highest', 'third_highest', 'lowest', 'no_picks']
+TIERS = RANKING_TIERS + ['perfect_week']
+SCORED_TIERS = ['highest', 'second_highest', 'third_highest', 'lowest']
+
+# Fields of the pre-tier format that have no tier equivalent; kept verbatim
+LEGACY_FIELDS = ('underdog_winners', 'underdog_correct', 'underdog_percentage', 'total_underdog_games')
+
+
+def upgrade_record(record: dict) -> dict:
+    """
+    Convert an old high_score/underdog record to the tiered record shape
+
+    Records written before seasons were tracked are filed under the configured
+    current season (CURRENT_SEASON).
+    """
+    if 'rankings' in record:
+        if record.get('season') is None:
+            record = {**record, 'season': config.current_season}
+        return record
+
+    names = record.get('winner_names', {})
+    high_score_winners = record.get('high_score_winners', [])
+    upgraded = {
+        'week': record['week'],
+        'season': record['season'] if record.get('season') is not None else config.current_season,
+        'date_processed': record.get('date_processed', ''),
+        'rankings': {tier: [] for tier in RANKING_TIERS},
+        'scores': {tier: 0 for tier in SCORED_TIERS},
+        'perfect_week_winners': record.get('perfect_week_winners', []),
+        'winner_names': {tier: [] for tier in TIERS},
+    }
+    upgraded['rankings']['highest'] = list(high_score_winners)
+    upgraded['scores']['highest'] = record.get('high_score', 0)
+    upgraded['scores']['no_picks'] = 0
+    upgraded['winner_names']['highest'] = list(names.get('high_score', []))
+    upgraded['winner_names']['perfect_week'] = list(names.get('perfect_week', []))
+    legacy = {field: record[field] for field in LEGACY_FIELDS if field in record}
+    if 'underdog' in names:
+        legacy['underdog_names'] = names['underdog']
+    if legacy:
+        upgraded['legacy'] = legacy
+    return upgraded
+
+
+def encode_results(records: Iterable[dict]) -> dict:
+    """Build a v2 document from week records (either record format)"""
+    seasons = {}
+    user_index = {}
+
+    for record in records:
+        record = upgrade_record(record)
+        season_key = str(record['season'])
+        season = seasons.setdefault(season_key, {'users': [], 'weeks': []})
+        index = user_index.setdefault(season_key, {})
+
+        names = record.get('winner_names', {})
+        tiers = []
+        for tier in TIERS:
+            owner_ids = record['perfect_week_winners'] if tier == 'perfect_week' else record['rankings'].get(tier, [])
+            tier_names = names.get(tier, [])
+            positions = []
+            for position, owner_id in enumerate(owner_ids):
+                name = tier_names[position] if position < len(tier_names) else 'Unknown'
+                if owner_id not in index:
+                    index[owner_id] = len(season['users'])
+                    season['users'].append([owner_id, name])
+                elif name != 'Unknown':
+                    season['users'][index[owner_id]][1] = name  # latest display name wins
+                positions.append(index[owner_id])
+            tiers.append(positions)
+
+        week = {
+            'week': record['week'],
+            'date_processed': record.get('date_processed', ''),
+            'tiers': tiers,
+            'scores': [record['scores'].get(tier, 0) for tier in SCORED_TIERS],
+        }
+        if 'legacy' in record:
+            week['legacy'] = record['legacy']
+        season['weeks'].append(week)
+
+    return {'schema_version': SCHEMA_VERSION, 'tiers': TIERS, 'seasons': seasons}
+
+
+def decode_results(document: dict) -> List[dict]:
+    """Expand a v2 document into week records, season by season"""
+    if document.get('schema_version') != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported results schema version: {document.get('schema_version')}")
+
+    tier_order = document.get('tiers', TIERS)
+    records = []
+    for season_key, season in document['seasons'].items():
+        season_value = int(season_key) if season_key.isdigit() else season_key
+        user_ids = [user[0] for user in season['users']]
+        user_names = [user[1] for user in season['users']]
+
+        for week in season['weeks']:
+            tiers = dict(zip(tier_order, week['tiers']))
+            scores = dict(zip(SCORED_TIERS, week['scores']))
+            scores['no_picks'] = 0
+            record = {
+                'week': week['week'],
+                'season': season_value,
+                'date_processed': week.get('date_processed', ''),
+                'rankings': {tier: [user_ids[i] for i in tiers.get(tier, [])] for tier in RANKING_TIERS},
+                'scores': scores,
+                'perfect_week_winners': [user_ids[i] for i in tiers.get('perfect_week', [])],
+                'winner_names': {tier: [user_names[i] for i in tiers.get(tier, [])] for tier in TIERS},
+            }
+            if 'legacy' in week:
+                record['legacy'] = week['legacy']
+            records.append(record)
+    return records
+
+
+def latest_records(records: Iterable[dict]) -> List[dict]:
+    """Week records with each reprocessed week's latest record in place of the earlier ones"""
+    positions = {}
+    latest = []
+    for record in records:
+        key = (str(record['season']), record['week'])
+        if key in positions:
+            latest[positions[key]] = record
+        else:
+            positions[key] = len(latest)
+            latest.append(record)
+    return latest
+
+
+class ResultsStore:
+    """Loads and saves the results file in the v2 schema"""
+
+    def __init__(self, path: str):
+        """
+        Initialize the store
+
+        Args:
+            path: Results file path (e.g. data/skins_game_results.json)
+        """
+        self.path = path
+
+    def _read_document(self) -> dict:
+        """Read the file as a v2 document, upgrading a v1 file in place first"""
+        data = serialization.load(self.path)
+        if isinstance(data, list):
+            data = self.upgrade(data)
+        return data
+
+    def upgrade(self, records: List[dict] = None) -> dict:
+        """
+        Rewrite a v1 results file in the v2 schema
+
+        The original file is kept next to it as <name>.v1.bak.
+
+        Returns:
+            The v2 document
+        """
+        if records is None:
+            records = serialization.load(self.path)
+            if not isinstance(records, list):
+                return records
+        backup_path = f"{self.path}.v1.bak"
+        if not os.path.exists(backup_path):
+            shutil.copy2(self.path, backup_path)
+        document = encode_results(records)
+        self._write_document(document)
+        print(f"🔄 Upgraded {self.path} to results schema v{SCHEMA_VERSION} (backup: {backup_path})")
+        return document
+
+    def _write_document(self, document: dict):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        serialization.dump(document, tmp_path)
+        os.replace(tmp_path, self.path)
+
+    def load(self) -> List[dict]:
+        """Load every stored week record (raises FileNotFoundError if there is no file)"""
+        return decode_results(self._read_document())
+
+    def save(self, records: List[dict]):
+        """Replace the stored results"""
+        self._write_document(encode_results(records))
+
+    def append(self, record: dict):
+        """Add one week record without expanding the stored history (a stored week is replaced)"""
+        try:
+            document = self._read_document()
+        except FileNotFoundError:
+            document = encode_results([])
+
+        addition = encode_results([record])
+        for season_key, new_season in addition['seasons'].items():
+            season = document['seasons'].setdefault(season_key, {'users': [], 'weeks': []})
+            index = {user[0]: i for i, user in enumerate(season['users'])}
+            remap = []
+            for owner_id, name in new_season['users']:
+                if owner_id not in index:
+                    index[owner_id] = len(season['users'])
+                    season['users'].append([owner_id, name])
+                elif name != 'Unknown':
+                    season['users'][index[owner_id]][1] = name
+                remap.append(index[owner_id])
+            positions = {week['week']: i for i, week in enumerate(season['weeks'])}
+            for week in new_season['weeks']:
+                week['tiers'] = [[remap[i] for i in tier] for tier in week['tiers']]
+                if week['week'] in positions:
+                    season['weeks'][positions[week['week']]] = week
+                else:
+                    season['weeks'].append(week)
+
+        self._write_document(document)
+
+
+def main():
+    """Upgrade a results file from the command line"""
+    if len(sys.argv) < 2 or sys.argv[1] != 'upgrade':
+        print("Usage: python3 -m src.results_store upgrade [results_file]")
+        return
+
+    path = sys.argv[2] if len(sys.argv) > 2 else "data/skins_game_results.json"
+    store = ResultsStore(path)
+    data = serialization.load(path)
+    if isinstance(data, list):
+        before = os.path.getsize(path)
+        store.upgrade(data)
+        print(f"📦 {before / 1024:.1f} KiB -> {os.path.getsize(path) / 1024:.1f} KiB")
+    else:
+        print(f"✅ {path} is already schema v{data.get('schema_version')}")
+
+
+if __name__ == "__main__":
+    main()
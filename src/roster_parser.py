@@ -0,0 +1,64 @@
+"""
+Compact Rosters Parsing for Sleeper API responses
+Keeps only the fields the skins game reads from each roster
+"""
+
+import io
+import json
+import sys
+from typing import BinaryIO, Iterator, List, Union
+
+try:
+    import ijson  # Optional: incremental parsing, never builds the full rosters list
+except ImportError:
+    ijson = None
+
+# Roster metadata the skins game and analytics actually use
+ROSTER_METADATA_FIELDS = ('points_by_leg', 'previous_picks')
+
+
+def _intern(value):
+    # Week keys and team abbreviations repeat in every roster; share one copy of each
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _intern(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_intern(item) for item in value]
+    return value
+
+
+def compact_roster(roster: dict) -> dict:
+    """Strip a roster down to owner_id and the pick'em metadata"""
+    metadata = roster.get('metadata') or {}
+    return {
+        'owner_id': roster.get('owner_id'),
+        'metadata': {field: _intern(metadata[field]) for field in ROSTER_METADATA_FIELDS if field in metadata},
+    }
+
+
+def iter_compact_rosters(source: Union[bytes, BinaryIO]) -> Iterator[dict]:
+    """
+    Parse a /league/{id}/rosters body one roster at a time
+
+    With ijson installed only one full roster is alive at any point; without
+    it the body is parsed with json and compacted afterwards.
+
+    Args:
+        source: Response body bytes or a binary file object
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+
+    if ijson is not None:
+        rosters = ijson.items(source, 'item', use_float=True)
+    else:
+        rosters = json.load(source)
+
+    for roster in rosters:
+        yield compact_roster(roster)
+
+
+def parse_rosters(source: Union[bytes, BinaryIO]) -> List[dict]:
+    """Parse a rosters body into a list of compact rosters"""
+    return list(iter_compact_rosters(source))
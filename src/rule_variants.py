@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+What-If Rescoring under alternate skins rules
+=============================================
+
+Replays every week of a season under several rule variants at once: the
+high-score skin with tie carryover, the raw-count underdog skin
+(SleeperSkinsGame.calculate_underdog_winners), the percentage underdog
+system (tests/system_comparison.py) and split tier payouts. Scores and picks
+come from the interned roster records, so every variant is a handful of
+array operations over the same users x weeks matrices.
+
+Usage:
+    python3 -m src.rule_variants      # compare the default variants for the current season
+"""
+
+import os
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Handle both relative and absolute imports
+try:
+    from .compact_records import TeamCodes, team_codes
+    from .pick_analytics import PickMatrix, load_game_results
+except ImportError:
+    from compact_records import TeamCodes, team_codes
+    from pick_analytics import PickMatrix, load_game_results
+
+METRICS = ('score', 'underdog_count', 'underdog_pct')
+
+
+@dataclass(frozen=True)
+class RuleVariant:
+    """One set of skins rules to replay history under"""
+    name: str
+    metric: str = 'score'                          # what the skin is won on (see METRICS)
+    tier_payouts: Tuple[float, ...] = (10.0,)      # paid to the 1st, 2nd, ... distinct values
+    carry_over: bool = False                       # a tie for 1st rolls its pot into next week
+    lowest_penalty: float = 0.0                    # paid by each player in the bottom tier
+    perfect_week_bonus: float = 0.0                # paid to each player with a perfect week
+
+
+DEFAULT_VARIANTS = (
+    RuleVariant('high_score_carry', tier_payouts=(10.0,), carry_over=True, perfect_week_bonus=40.0),
+    RuleVariant('underdog_count', metric='underdog_count', tier_payouts=(3.0,), carry_over=True),
+    RuleVariant('underdog_pct', metric='underdog_pct', tier_payouts=(3.0,), carry_over=True),
+    RuleVariant('tiers_split', tier_payouts=(10.0, 6.0, 3.0), lowest_penalty=5.0, perfect_week_bonus=40.0),
+)
+
+
+def dense_tiers(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Dense rank of every column, from the top and from the bottom
+
+    Args:
+        values: players x weeks, NaN where a player isn't eligible
+
+    Returns:
+        (tier, bottom): tier 1 is the highest value in the week (ties share a
+        tier, 0 where NaN); bottom marks players on the week's lowest value
+    """
+    eligible = ~np.isnan(values)
+    order = np.argsort(np.where(eligible, values, -np.inf), axis=0, kind='stable')
+    ordered = np.take_along_axis(np.where(eligible, values, -np.inf), order, axis=0)
+    new_level = np.ones(ordered.shape, dtype=bool)
+    new_level[1:] = ordered[1:] != ordered[:-1]
+    level = np.empty(ordered.shape, dtype=np.int64)
+    np.put_along_axis(level, order, np.cumsum(new_level, axis=0), axis=0)
+
+    ineligible = (~eligible).any(axis=0)
+    tier = np.where(eligible, level.max(axis=0, initial=0) - level + 1, 0)
+    bottom = eligible & (level == 1 + ineligible)
+    return tier, bottom
+
+
+def run_lengths(flags: np.ndarray) -> np.ndarray:
+    """Length of the run of True ending at each position of the last axis"""
+    counts = np.cumsum(flags, axis=-1)
+    return counts - np.maximum.accumulate(np.where(flags, 0, counts), axis=-1)
+
+
+class WhatIfEngine:
+    """Season-long winners and payouts under several rule variants"""
+
+    def __init__(self, rosters: Iterable, outcomes: Dict[int, Dict[str, dict]] = None,
+                 names: Dict[str, str] = None, codes: TeamCodes = team_codes):
+        """
+        Build the users x weeks matrices every variant is computed from
+
+        Args:
+            rosters: RosterRecords for the season (e.g. a RosterTable)
+            outcomes: Week -> game results in the week_N_game_results.json format;
+                the underdog metrics and perfect weeks need these
+            names: Owner id -> display name for the output tables
+            codes: Team code table the records were encoded with
+        """
+        records = [roster for roster in rosters if roster.owner_id]
+        outcomes = outcomes or {}
+        self.names = names or {}
+        weeks = sorted({int(week) for record in records for week in record.points.weeks})
+        self.matrix = PickMatrix.from_rosters(records, weeks=weeks, codes=codes)
+        self.owner_ids = self.matrix.owner_ids
+        self.weeks = self.matrix.weeks
+
+        # Scores, and who took part (a 0 with no picks sits the week out, as in the skins game)
+        self.scores = np.full((len(records), len(weeks)), np.nan)
+        for row, record in enumerate(records):
+            cols = np.searchsorted(self.weeks, np.asarray(record.points.weeks, dtype=np.int64))
+            self.scores[row, cols] = record.points.scores
+        pick_counts = self.matrix.pick_counts
+        self.scores[(self.scores == 0) & (pick_counts == 0)] = np.nan
+        self.playing = ~np.isnan(self.scores)
+
+        # Per-week team flags from the game results
+        team_count = self.matrix.team_count
+        won = np.zeros((len(weeks), team_count), dtype=bool)
+        underdog = np.zeros((len(weeks), team_count), dtype=bool)
+        self.decided = np.zeros(len(weeks), dtype=bool)
+        for col, week in enumerate(weeks):
+            for team, data in outcomes.get(week, {}).items():
+                code = codes.code(team)
+                if code < team_count:
+                    self.decided[col] = True
+                    won[col, code] = bool(data.get('won', False))
+                    underdog[col, code] = bool(data.get('is_underdog', False))
+
+        picked = self.matrix.unpack().astype(np.float64)
+        self.correct = np.einsum('uwt,wt->uw', picked, won)
+        self.underdog_picks = np.einsum('uwt,wt->uw', picked, underdog)
+        self.underdog_correct = np.einsum('uwt,wt->uw', picked, underdog & won)
+        games = won.sum(axis=1)
+        self.perfect = (self.playing & self.decided & (games > 0)
+                        & (self.correct == games) & (pick_counts == games))
+        self._metrics = {}
+
+    def metric(self, name: str) -> np.ndarray:
+        """players x weeks values a skin is won on (NaN = not eligible that week)"""
+        if name not in METRICS:
+            raise ValueError(f"Unknown metric '{name}' (expected one of {', '.join(METRICS)})")
+        if name not in self._metrics:
+            if name == 'score':
+                values = self.scores
+            else:
+                eligible = self.playing & self.decided
+                if name == 'underdog_count':
+                    values = self.underdog_correct
+                else:
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        values = np.where(self.underdog_picks > 0, self.underdog_correct / self.underdog_picks, 0.0)
+                values = np.where(eligible, values, np.nan)
+            self._metrics[name] = (values,) + dense_tiers(values)
+        return self._metrics[name][0]
+
+    def payouts(self, variant: RuleVariant) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Winnings of every player in every week under one variant
+
+        Weeks where nobody is eligible (e.g. underdog metrics without game
+        results) are skipped: they neither pay nor add to a carried pot.
+
+        Returns:
+            (payouts, pots): players x weeks money won (penalties negative), and
+            the 1st-tier pot each week (NaN for skipped weeks; a week whose pot
+            wasn't won by exactly one player carried it over when carry_over is set)
+        """
+        values = self.metric(variant.metric)
+        _, tier, bottom = self._metrics[variant.metric]
+        contested = (~np.isnan(values)).any(axis=0)
+        payouts = np.zeros(tier.shape)
+        first = variant.tier_payouts[0] if variant.tier_payouts else 0.0
+        pots = np.where(contested, first, np.nan)
+
+        for position, amount in enumerate(variant.tier_payouts, 1):
+            winners = tier == position
+            count = winners.sum(axis=0)
+            if position == 1 and variant.carry_over:
+                # Each pot is the base plus every carried week right before it (contested weeks only)
+                carried = (count != 1)[contested]
+                before = np.concatenate([[0], run_lengths(carried)[:-1]])
+                pots[contested] = amount * (1 + before)
+                payouts += np.where(winners & (count == 1), np.nan_to_num(pots), 0.0)
+            else:
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    payouts += np.where(winners, amount / count, 0.0)
+
+        payouts -= np.where(bottom, variant.lowest_penalty, 0.0)
+        payouts += np.where(self.perfect, variant.perfect_week_bonus, 0.0)
+        return payouts, pots
+
+    def compare(self, variants: Iterable[RuleVariant] = DEFAULT_VARIANTS) -> pd.DataFrame:
+        """
+        Season winnings per player under each variant
+
+        Returns:
+            DataFrame indexed by user_id with display_name and one column of net
+            winnings per variant, sorted by the first variant
+        """
+        variants = list(variants)
+        data = {'display_name': [self.names.get(owner_id, 'Unknown') for owner_id in self.owner_ids]}
+        for variant in variants:
+            data[variant.name] = self.payouts(variant)[0].sum(axis=1)
+        frame = pd.DataFrame(data, index=pd.Index(self.owner_ids, name='user_id'))
+        return frame.sort_values(variants[0].name, ascending=False) if variants else frame
+
+    def summary(self, variants: Iterable[RuleVariant] = DEFAULT_VARIANTS) -> pd.DataFrame:
+        """
+        One row per variant: money paid, weeks carried over and who benefits
+
+        Returns:
+            DataFrame indexed by variant with metric, total_paid, total_penalties,
+            weeks_contested, weeks_carried, unpaid_pot, distinct_winners,
+            top_earner and top_earnings
+        """
+        rows = []
+        for variant in variants:
+            payouts, pots = self.payouts(variant)
+            totals = payouts.sum(axis=1)
+            top = int(np.argmax(totals)) if len(totals) else None
+            contested = ~np.isnan(pots)
+            first_tier = self._metrics[variant.metric][1] == 1
+            carried = contested & (first_tier.sum(axis=0) != 1) if variant.carry_over else np.zeros_like(contested)
+            last = np.flatnonzero(contested)
+            rows.append({
+                'variant': variant.name,
+                'metric': variant.metric,
+                'total_paid': payouts[payouts > 0].sum(),
+                'total_penalties': np.abs(payouts[payouts < 0]).sum(),
+                'weeks_contested': int(contested.sum()),
+                'weeks_carried': int(carried.sum()),
+                'unpaid_pot': pots[last[-1]] if len(last) and carried[last[-1]] else 0.0,
+                'distinct_winners': int(np.count_nonzero((payouts > 0).any(axis=1))),
+                'top_earner': self.names.get(self.owner_ids[top], 'Unknown') if top is not None else '',
+                'top_earnings': totals[top] if top is not None else 0.0,
+            })
+        return pd.DataFrame(rows).set_index('variant')
+
+
+def main():
+    """Compare the default rule variants for the current season"""
+    # Handle both relative and absolute imports
+    try:
+        from .skins_game_mvp import SleeperSkinsGameMVP
+        from .secure_config import config
+    except ImportError:
+        from skins_game_mvp import SleeperSkinsGameMVP
+        from secure_config import config
+
+    game = SleeperSkinsGameMVP()
+    rosters = game.get_rosters()
+    weeks = sorted({int(week) for roster in rosters for week in roster.points.weeks})
+    names = {uid: user.get('display_name', 'Unknown') for uid, user in game.get_users().items()}
+    engine = WhatIfEngine(rosters, load_game_results(weeks, config.data_directory), names)
+
+    print(f"🔀 WHAT-IF RULES ({len(engine.weeks)} weeks, {int(engine.decided.sum())} with game results)")
+    print(engine.summary().to_string(float_format=lambda value: f"{value:,.2f}"))
+
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else "outputs/analytics"
+    os.makedirs(output_dir, exist_ok=True)
+    engine.compare().to_csv(f"{output_dir}/what_if_rules.csv")
+    print(f"💾 Per-player comparison saved to: {output_dir}/what_if_rules.csv")
+
+
+if __name__ == "__main__":
+    main()
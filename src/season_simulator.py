@@ -0,0 +1,209 @@
+"""
+Monte Carlo Season Simulator for the skins game
+Estimates who takes the highest-score skin, the lowest-score penalty and the
+perfect-week bonus over the rest of the season by resampling each player's
+own weekly results. A tied top score carries the skin over, so a simulated
+week only counts toward highest when one player holds the top score alone.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Handle both relative and absolute imports
+try:
+    from .perf_metrics import metrics
+    from .secure_config import config
+    from .compact_records import perfect_week_winners
+    from .pick_analytics import load_game_results
+except ImportError:
+    from perf_metrics import metrics
+    from secure_config import config
+    from compact_records import perfect_week_winners
+    from pick_analytics import load_game_results
+
+TIERS = ('highest', 'lowest', 'perfect_week')
+
+# Upper bound on simulated scores held in memory per chunk (sims x weeks x players)
+CHUNK_ELEMENTS = 4_000_000
+
+
+def _simulate_chunk(values: np.ndarray, perfect: np.ndarray, counts: np.ndarray, width: int,
+                    weeks: int, sims: int, seed_sequence: np.random.SeedSequence) -> Dict[str, np.ndarray]:
+    """
+    Simulate a block of seasons
+
+    Args:
+        values: Flattened players x width matrix of past weekly scores (NaN = no picks)
+        perfect: Same layout; whether that past week was perfect
+        counts: Number of real samples per player
+        width: Row length of the flattened matrices
+        weeks: Weeks left in the season
+        sims: Seasons to simulate in this block
+        seed_sequence: Independent RNG stream for this block
+
+    Returns:
+        Per tier, the number of simulated seasons each player took the tier at
+        least once ('<tier>_seasons') and the total weeks taken ('<tier>_weeks')
+    """
+    rng = np.random.default_rng(seed_sequence)
+    players = len(counts)
+
+    # Draw a past week per player per simulated week, as flat indexes into values
+    draws = (rng.random((sims, weeks, players), dtype=np.float32) * counts.astype(np.float32)).astype(np.int32)
+    np.minimum(draws, (counts - 1).astype(np.int32), out=draws)
+    draws += (np.arange(players) * width).astype(np.int32)
+    scores = values[draws]
+
+    # fmax/fmin skip NaN, and NaN never equals the extreme, so no-pick weeks drop out
+    top = scores == np.fmax.reduce(scores, axis=2, keepdims=True)
+    taken = {
+        # A shared top score carries the skin, so only a sole leader takes it
+        'highest': top & (np.count_nonzero(top, axis=2) == 1)[:, :, None],
+        # Everyone tied for the lowest score is in the lowest tier, as in calculate_week_rankings
+        'lowest': scores == np.fmin.reduce(scores, axis=2, keepdims=True),
+        'perfect_week': perfect[draws],
+    }
+
+    totals = {}
+    for tier, won in taken.items():
+        per_season = won.sum(axis=1)
+        totals[f'{tier}_seasons'] = np.count_nonzero(per_season, axis=0)
+        totals[f'{tier}_weeks'] = per_season.sum(axis=0)
+    return totals
+
+
+class SeasonSimulator:
+    """Vectorized Monte Carlo simulation of the remaining skins weeks"""
+
+    def __init__(self, dashboard, season_weeks: int = 18, seed: int = None,
+                 game_results: Dict[int, Dict[str, dict]] = None):
+        """
+        Initialize the simulator
+
+        Args:
+            dashboard: SleeperAnalyticsDashboard to take player history from
+            season_weeks: Regular-season length (remaining weeks = this - last played week)
+            seed: Seed for reproducible results
+            game_results: Week -> game results used to spot past perfect weeks
+                (default: the week_N_game_results.json files in the data directory)
+        """
+        self.dashboard = dashboard
+        self.season_weeks = season_weeks
+        self.seed = seed
+        self.game_results = game_results
+        self._pool = None
+
+    def build_pool(self) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, int, int]:
+        """
+        Each player's empirical weekly distribution as padded arrays
+
+        A past week counts as perfect by the rule process_week applies
+        (perfect_week_winners); weeks without game results have none.
+
+        Returns:
+            (user_ids, values, perfect, counts, width, last_week) with values and
+            perfect flattened from players x width matrices
+        """
+        if self._pool is not None:
+            return self._pool
+
+        user_ids, weeks, scores, mask = self.dashboard.score_matrix()
+        rosters = self.dashboard.get_rosters()
+
+        pick_counts = np.zeros(scores.shape, dtype=np.int32)
+        for row, user_id in enumerate(user_ids):
+            roster = rosters.owner(user_id)
+            if roster is not None:
+                for col, week in enumerate(weeks):
+                    pick_counts[row, col] = len(roster.pick_codes(int(week)))
+
+        no_picks = mask & (scores == 0) & (pick_counts == 0)
+
+        game_results = self.game_results
+        if game_results is None:
+            game_results = load_game_results(weeks, config.data_directory)
+        rows = {user_id: row for row, user_id in enumerate(user_ids)}
+        perfect = np.zeros(scores.shape, dtype=bool)
+        for col, week in enumerate(weeks):
+            results = game_results.get(int(week))
+            if results:
+                for owner_id in perfect_week_winners(rosters, int(week), results):
+                    if owner_id in rows:
+                        perfect[rows[owner_id], col] = True
+        perfect &= mask
+
+        # Left-pack each player's scored weeks so draws index 0..count-1
+        counts = mask.sum(axis=1)
+        width = max(int(counts.max(initial=0)), 1)
+        order = np.argsort(~mask, axis=1, kind='stable')[:, :width]
+        values = np.take_along_axis(np.where(no_picks, np.nan, scores), order, axis=1).astype(np.float32)
+        perfect = np.take_along_axis(perfect, order, axis=1)
+
+        last_week = int(weeks.max()) if len(weeks) else 0
+        self._pool = (user_ids, values.ravel(), perfect.ravel(), counts, width, last_week)
+        return self._pool
+
+    def simulate(self, sims: int = 100_000, weeks: int = None, processes: int = 1) -> pd.DataFrame:
+        """
+        Simulate the rest of the season
+
+        Results depend only on the seed and sims, not on the number of processes.
+
+        Args:
+            sims: Number of seasons to simulate
+            weeks: Weeks left to simulate (default: season_weeks - last played week)
+            processes: Worker processes to spread the chunks across
+
+        Returns:
+            DataFrame indexed by user_id with, for each tier, the probability of
+            taking it at least once ('<tier>_prob') and the expected number of
+            weeks taken ('<tier>_expected'), sorted by highest_prob
+        """
+        user_ids, values, perfect, counts, width, last_week = self.build_pool()
+        if weeks is None:
+            weeks = max(self.season_weeks - last_week, 0)
+        if not user_ids or weeks == 0:
+            raise ValueError("Nothing to simulate: no player history or no weeks left in the season")
+
+        chunk = max(1, CHUNK_ELEMENTS // (weeks * len(user_ids)))
+        sizes = [min(chunk, sims - start) for start in range(0, sims, chunk)]
+        seeds = np.random.SeedSequence(self.seed).spawn(len(sizes))
+        jobs = [(values, perfect, counts, width, weeks, size, seed) for size, seed in zip(sizes, seeds)]
+
+        with metrics.span('season_simulation', sims=sims, weeks=weeks, players=len(user_ids)):
+            if processes > 1 and len(jobs) > 1:
+                with ProcessPoolExecutor(max_workers=processes) as executor:
+                    parts = list(executor.map(_simulate_chunk, *zip(*jobs)))
+            else:
+                parts = [_simulate_chunk(*job) for job in jobs]
+
+        totals = {key: sum(part[key] for part in parts) for key in parts[0]}
+        users = self.dashboard.get_users()
+        data = {'display_name': [users.get(uid, {}).get('display_name', 'Unknown') for uid in user_ids]}
+        for tier in TIERS:
+            data[f'{tier}_prob'] = totals[f'{tier}_seasons'] / sims
+            data[f'{tier}_expected'] = totals[f'{tier}_weeks'] / sims
+        frame = pd.DataFrame(data, index=pd.Index(user_ids, name='user_id'))
+        frame.attrs.update(sims=sims, weeks=weeks, seed=self.seed)
+        return frame.sort_values('highest_prob', ascending=False)
+
+
+def format_simulation(frame: pd.DataFrame, top_n: int = 5) -> str:
+    """Text report of the most likely winners for each tier"""
+    labels = {
+        'highest': '🥇 HIGHEST SCORE SKIN',
+        'lowest': '📉 LOWEST SCORE PENALTY',
+        'perfect_week': '🎯 PERFECT WEEK BONUS',
+    }
+    lines = [f"🎲 SEASON SIMULATION ({frame.attrs.get('sims', 0):,} seasons, "
+             f"{frame.attrs.get('weeks', 0)} weeks left)"]
+    for tier in TIERS:
+        lines.append(f"\n{labels[tier]}:")
+        ranked = frame.sort_values(f'{tier}_prob', ascending=False).head(top_n)
+        for _, row in ranked.iterrows():
+            lines.append(f"  {row['display_name']}: {row[f'{tier}_prob']:.1%} "
+                         f"(expected {row[f'{tier}_expected']:.2f} weeks)")
+    return "\n".join(lines)
@@ -79,6 +79,11 @@ class SecureConfig:
         """Get results file name."""
         return os.getenv('RESULTS_FILE', 'skins_game_results.json')
     
+    @property
+    def results_path(self) -> str:
+        """Get path of the results file process_week writes (and the stores kept next to it)."""
+        return f"{self.data_directory}/{self.results_file}"
+    
     @property
     def current_season(self) -> int:
         """Get current season year."""
@@ -89,6 +94,31 @@ class SecureConfig:
         """Get league name."""
         return os.getenv('LEAGUE_NAME', 'Fantasy League')
     
+    @property
+    def metrics_directory(self) -> str:
+        """Get directory for per-run timing reports."""
+        return os.getenv('METRICS_DIRECTORY', 'outputs/metrics')
+    
+    @property
+    def prometheus_textfile(self) -> Optional[str]:
+        """Get node exporter textfile path for run metrics, if enabled."""
+        return os.getenv('PROMETHEUS_TEXTFILE') or None
+    
+    @property
+    def cache_directory(self) -> str:
+        """Get directory for cached Sleeper league metadata."""
+        return os.getenv('CACHE_DIRECTORY', 'outputs/cache')
+    
+    @property
+    def metadata_soft_ttl(self) -> int:
+        """Get seconds after which league metadata is refreshed in the background."""
+        return int(os.getenv('METADATA_SOFT_TTL', '300'))
+    
+    @property
+    def metadata_hard_ttl(self) -> int:
+        """Get seconds after which league metadata must be refetched before use."""
+        return int(os.getenv('METADATA_HARD_TTL', '21600'))
+    
     def get_all_config(self) -> Dict[str, Any]:
         """Get all configuration as a dictionary."""
         return {
@@ -0,0 +1,86 @@
+"""
+JSON Serialization for persisted artifacts
+Uses orjson or msgspec when installed and falls back to the standard library
+"""
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson  # Optional: fastest encode/decode
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec  # Optional: used when orjson is missing
+except ImportError:
+    msgspec = None
+
+BACKENDS = ('orjson', 'msgspec', 'json')
+
+
+def _select_backend() -> str:
+    """Pick the backend from JSON_BACKEND (auto by default)"""
+    requested = os.getenv('JSON_BACKEND', 'auto').lower()
+    available = {'orjson': orjson is not None, 'msgspec': msgspec is not None, 'json': True}
+    if requested in available:
+        if not available[requested]:
+            raise ValueError(f"JSON_BACKEND={requested} but {requested} is not installed")
+        return requested
+    return next(name for name in BACKENDS if available[name])
+
+
+backend = _select_backend()
+
+
+def _default(obj: Any) -> Any:
+    """Convert numpy scalars and arrays (anything with tolist) to plain Python values"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Encode an object as UTF-8 JSON
+
+    Numpy scalars and arrays encode as plain numbers and lists with every
+    backend.
+
+    Args:
+        obj: Data to encode
+        pretty: Indent with two spaces (for files people read or edit by hand)
+    """
+    if backend == 'orjson':
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    if backend == 'msgspec':
+        data = msgspec.json.encode(obj, enc_hook=_default)
+        return msgspec.json.format(data, indent=2) if pretty else data
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_default).encode('utf-8')
+
+
+def loads(data) -> Any:
+    """Decode JSON from bytes or str"""
+    if backend == 'orjson':
+        return orjson.loads(data)
+    if backend == 'msgspec':
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def dump(obj: Any, path: str, pretty: bool = False):
+    """Write an object to a JSON file"""
+    with open(path, 'wb') as f:
+        f.write(dumps(obj, pretty))
+
+
+def load(path: str) -> Any:
+    """Read a JSON file (raises FileNotFoundError like open)"""
+    with open(path, 'rb') as f:
+        return loads(f.read())
@@ -1,75 +1,136 @@
-import requests
-import json
+import threading
 import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
+from urllib.parse import urlparse
 
 # Handle both relative and absolute imports
 try:
     from .secure_config import config
+    from .sleeper_client import SleeperClient
+    from .roster_parser import iter_compact_rosters
+    from .compact_records import RosterTable, perfect_week_winners
+    from .results_store import ResultsStore
+    from .standings import SeasonStandings
+    from .player_stats import PlayerStatsStore
+    from .ratings import EloRatingStore
+    from .perf_metrics import metrics
+    from .metadata_cache import MetadataCache
 except ImportError:
     from secure_config import config
+    from sleeper_client import SleeperClient
+    from roster_parser import iter_compact_rosters
+    from compact_records import RosterTable, perfect_week_winners
+    from results_store import ResultsStore
+    from standings import SeasonStandings
+    from player_stats import PlayerStatsStore
+    from ratings import EloRatingStore
+    from perf_metrics import metrics
+    from metadata_cache import MetadataCache
 
 class SleeperSkinsGameMVP:
-    def __init__(self, league_id: str = None):
+    def __init__(self, league_id: str = None, base_url: str = None,
+                 metadata_cache: Optional[MetadataCache] = None):
         """
         Minimal MVP for Sleeper Skins Game automation
         
         Args:
             league_id: Your Sleeper league ID (optional, will use config if not provided)
+            base_url: Sleeper API root URL (optional, e.g. a local stand-in server for benchmarks)
+            metadata_cache: Stale-while-revalidate store for league info (optional, built from config)
         """
         self.league_id = league_id or config.sleeper_league_id
-        self.base_url = "https://api.sleeper.app/v1"
-        self.results_file = f"{config.data_directory}/{config.results_file}"
+        self.client = SleeperClient(base_url, cache_directory=config.cache_directory)
+        self.base_url = self.client.base_url
+        self.metadata_cache = metadata_cache or MetadataCache(
+            config.cache_directory, config.metadata_soft_ttl, config.metadata_hard_ttl
+        )
+        self.results_file = config.results_path
         
         # Cache for API data
         self._users_cache = None
         self._rosters_cache = None
         self._league_info_cache = None
+        self._cache_lock = threading.RLock()  # One fetch per cache when shared across threads
     
-    def get_league_info(self) -> dict:
-        """Get league information including current week"""
-        if self._league_info_cache is None:
-            url = f"{self.base_url}/league/{self.league_id}"
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                self._league_info_cache = response.json()
+    @classmethod
+    def from_league(cls, league: dict, **kwargs) -> 'SleeperSkinsGameMVP':
+        """
+        Game over league payloads fetched elsewhere, without any API calls
+
+        Args:
+            league: Dict with 'league_info', 'users' and 'rosters' payloads (e.g. from SyntheticLeagueGenerator)
+            **kwargs: Passed to the constructor
+        """
+        game = cls(league['league_info']['league_id'], **kwargs)
+        game._league_info_cache = league['league_info']
+        game._users_cache = {user['user_id']: user for user in league['users']}
+        game._rosters_cache = RosterTable.from_rosters(league['rosters'])
+        return game
+    
+    def get_league_info(self, revalidate: bool = False) -> dict:
+        """
+        Get league information including current week (stale-while-revalidate across runs)
+
+        Args:
+            revalidate: Fetch from the API even if a cached copy is fresh enough to serve
+        """
+        with self._cache_lock:
+            if self._league_info_cache is None or revalidate:
+                cache_key = f"{urlparse(self.base_url).netloc}/league/{self.league_id}"
+                self._league_info_cache = self.metadata_cache.get(cache_key, self._fetch_league_info, revalidate)
             else:
-                raise Exception(f"Failed to get league info: {response.status_code}")
+                metrics.incr('cache_hits')
         
         return self._league_info_cache
     
+    def _fetch_league_info(self) -> dict:
+        response = self.client.get(f"/league/{self.league_id}")
+        
+        if response.status_code == 200:
+            return response.json()
+        raise Exception(f"Failed to get league info: {response.status_code}")
+    
     def get_users(self) -> Dict[str, dict]:
         """Get all users in the league with caching"""
-        if self._users_cache is None:
-            url = f"{self.base_url}/league/{self.league_id}/users"
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                users = response.json()
-                self._users_cache = {user['user_id']: user for user in users}
+        with self._cache_lock:
+            if self._users_cache is None:
+                response = self.client.get(f"/league/{self.league_id}/users")
+                
+                if response.status_code == 200:
+                    users = response.json()
+                    self._users_cache = {user['user_id']: user for user in users}
+                else:
+                    raise Exception(f"Failed to get league users: {response.status_code}")
             else:
-                raise Exception(f"Failed to get league users: {response.status_code}")
+                metrics.incr('cache_hits')
         
         return self._users_cache
     
-    def get_rosters(self) -> List[dict]:
-        """Get all rosters data with caching"""
-        if self._rosters_cache is None:
-            url = f"{self.base_url}/league/{self.league_id}/rosters"
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                self._rosters_cache = response.json()
+    def get_rosters(self) -> RosterTable:
+        """Get all rosters as compact RosterRecords with caching"""
+        with self._cache_lock:
+            if self._rosters_cache is None:
+                # Parse the body as it arrives so the full payload is never held in memory
+                with self.client.stream(f"/league/{self.league_id}/rosters") as (status_code, body):
+                    if status_code == 200:
+                        self._rosters_cache = RosterTable.from_rosters(iter_compact_rosters(body))
+                    else:
+                        raise Exception(f"Failed to get rosters: {status_code}")
             else:
-                raise Exception(f"Failed to get rosters: {response.status_code}")
+                metrics.incr('cache_hits')
         
         return self._rosters_cache
     
-    def get_current_week(self) -> int:
-        """Get current week from league info"""
-        league_info = self.get_league_info()
+    def get_current_week(self, revalidate: bool = False) -> int:
+        """
+        Get current week from league info
+
+        Args:
+            revalidate: Read the week pointer from the API rather than the cache; use
+                this when the week decides what gets processed
+        """
+        league_info = self.get_league_info(revalidate)
         current_leg = league_info.get('metadata', {}).get('current_pickem_leg_id', '')
         
         if current_leg:
@@ -83,18 +144,15 @@ class SleeperSkinsGameMVP:
     def calculate_highest_scorer(self, week: int) -> Tuple[List[str], float]:
         """Calculate the highest scoring user(s) for a specific week"""
         rosters = self.get_rosters()
-        week_key = f"v1:regular:{week}"
         
         user_scores = {}
         
         for roster in rosters:
-            owner_id = roster.get('owner_id')
+            owner_id = roster.owner_id
             if not owner_id:
                 continue
             
-            points_by_leg = roster.get('metadata', {}).get('points_by_leg', {})
-            week_score = points_by_leg.get(week_key, 0)
-            user_scores[owner_id] = float(week_score)
+            user_scores[owner_id] = roster.score(week)
         
         if not user_scores:
             return [], 0
@@ -107,18 +165,15 @@ class SleeperSkinsGameMVP:
     def get_week_picks(self, week: int) -> Dict[str, List[str]]:
         """Get all user picks for a specific week"""
         rosters = self.get_rosters()
-        week_key = f"v1:regular:{week}"
         
         user_picks = {}
         
         for roster in rosters:
-            owner_id = roster.get('owner_id')
+            owner_id = roster.owner_id
             if not owner_id:
                 continue
             
-            previous_picks = roster.get('metadata', {}).get('previous_picks', {})
-            week_picks = previous_picks.get(week_key, [])
-            user_picks[owner_id] = week_picks
+            user_picks[owner_id] = roster.week_picks(week)
         
         return user_picks
     
@@ -139,24 +194,17 @@ class SleeperSkinsGameMVP:
             }
         """
         rosters = self.get_rosters()
-        week_key = f"v1:regular:{week}"
         
         user_scores = {}
-        user_picks = {}
+        user_pick_counts = {}
         
         for roster in rosters:
-            owner_id = roster.get('owner_id')
+            owner_id = roster.owner_id
             if not owner_id:
                 continue
             
-            points_by_leg = roster.get('metadata', {}).get('points_by_leg', {})
-            week_score = points_by_leg.get(week_key, 0)
-            user_scores[owner_id] = float(week_score)
-            
-            # Get picks for this user
-            previous_picks = roster.get('metadata', {}).get('previous_picks', {})
-            week_picks = previous_picks.get(week_key, [])
-            user_picks[owner_id] = week_picks
+            user_scores[owner_id] = roster.score(week)
+            user_pick_counts[owner_id] = len(roster.pick_codes(week))
         
         if not user_scores:
             return {'highest': [], 'second_highest': [], 'third_highest': [], 'lowest': [], 'no_picks': []}
@@ -166,7 +214,7 @@ class SleeperSkinsGameMVP:
         users_no_picks = []
         
         for owner_id, score in user_scores.items():
-            if score == 0 and len(user_picks.get(owner_id, [])) == 0:
+            if score == 0 and user_pick_counts.get(owner_id, 0) == 0:
                 users_no_picks.append(owner_id)
             else:
                 users_with_picks[owner_id] = score
@@ -196,34 +244,18 @@ class SleeperSkinsGameMVP:
     
     def check_perfect_week(self, week: int, odds_data: Dict[str, dict]) -> List[str]:
         """Check if any user had a perfect week"""
-        user_picks = self.get_week_picks(week)
-        
-        # Get all winning teams
-        winning_teams = [team for team, data in odds_data.items() if data.get('won', False)]
-        total_games = len(odds_data)
-        
-        perfect_week_users = []
-        
-        for owner_id, picks in user_picks.items():
-            # Check if all picks were correct
-            correct_picks = len([pick for pick in picks if pick in winning_teams])
-            if correct_picks == total_games and len(picks) == total_games:
-                perfect_week_users.append(owner_id)
-        
-        return perfect_week_users
+        return perfect_week_winners(self.get_rosters(), week, odds_data)
     
     def load_results(self) -> List[dict]:
         """Load existing results from storage"""
         try:
-            with open(self.results_file, 'r') as f:
-                return json.load(f)
+            return ResultsStore(self.results_file).load()
         except FileNotFoundError:
             return []
     
     def save_results(self, results: List[dict]):
         """Save results to storage"""
-        with open(self.results_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        ResultsStore(self.results_file).save(results)
     
     def process_week(self, week: int, odds_data: Dict[str, dict] = None, season: int = None):
         """
@@ -250,22 +282,23 @@ class SleeperSkinsGameMVP:
         users = self.get_users()
         
         # Calculate rankings
-        rankings = self.calculate_week_rankings(week)
-        
-        # Get scores for each ranking group
-        scores = {}
-        for ranking_type, owner_ids in rankings.items():
-            if ranking_type == 'no_picks':
-                scores[ranking_type] = 0  # No picks users always have 0 points
-            elif owner_ids:
-                scores[ranking_type] = self.get_user_score_for_week(owner_ids[0], week)
-            else:
-                scores[ranking_type] = 0
-        
-        # Check for perfect week if odds data is provided
-        perfect_week_winners = []
-        if odds_data:
-            perfect_week_winners = self.check_perfect_week(week, odds_data)
+        with metrics.span('ranking', week=week):
+            rankings = self.calculate_week_rankings(week)
+            
+            # Get scores for each ranking group
+            scores = {}
+            for ranking_type, owner_ids in rankings.items():
+                if ranking_type == 'no_picks':
+                    scores[ranking_type] = 0  # No picks users always have 0 points
+                elif owner_ids:
+                    scores[ranking_type] = self.get_user_score_for_week(owner_ids[0], week)
+                else:
+                    scores[ranking_type] = 0
+            
+            # Check for perfect week if odds data is provided
+            perfect_week_winners = []
+            if odds_data:
+                perfect_week_winners = self.check_perfect_week(week, odds_data)
         
         # Create result record
         result = {
@@ -285,10 +318,21 @@ class SleeperSkinsGameMVP:
             }
         }
         
-        # Load existing results and add new one
-        results = self.load_results()
-        results.append(result)
-        self.save_results(results)
+        # Add the new week to stored results and fold it into the season standings
+        with metrics.span('persist', week=week):
+            SeasonStandings(self.results_file, self.league_id).record_week(result)
+            
+            # Fold this week into each player's running stats for the dashboard
+            week_scores = {roster.owner_id: roster.points[week] for roster in self.get_rosters()
+                           if roster.owner_id and week in roster.points}
+            player_stats = PlayerStatsStore(self.results_file)
+            if not player_stats.apply_week(season, week, week_scores):
+                # Reprocessing picks up score corrections, which running sums cannot take back out
+                player_stats.rebuild(season, self.get_rosters())
+            
+            # Rate the week as one contest among everyone who picked
+            contest = {uid: score for uid, score in week_scores.items() if uid not in rankings['no_picks']}
+            EloRatingStore(self.results_file).apply_week(season, week, contest)
         
         return result
     
@@ -318,15 +362,8 @@ class SleeperSkinsGameMVP:
     
     def get_user_score_for_week(self, owner_id: str, week: int) -> float:
         """Get a specific user's score for a specific week"""
-        rosters = self.get_rosters()
-        week_key = f"v1:regular:{week}"
-        
-        for roster in rosters:
-            if roster.get('owner_id') == owner_id:
-                points_by_leg = roster.get('metadata', {}).get('points_by_leg', {})
-                return float(points_by_leg.get(week_key, 0))
-        
-        return 0.0
+        roster = self.get_rosters().owner(owner_id)
+        return roster.score(week) if roster else 0.0
     
     
     def view_all_results(self):
@@ -341,31 +378,21 @@ class SleeperSkinsGameMVP:
         for result in results:
             print(f"\nWeek {result['week']} ({result['season']}):")
             
-            # Handle new format
-            if 'rankings' in result:
-                print(f"  🥇 Highest: {', '.join(result['winner_names']['highest'])} - {result['scores']['highest']} pts")
-                if result['rankings']['second_highest']:
-                    print(f"  🥈 Second: {', '.join(result['winner_names']['second_highest'])} - {result['scores']['second_highest']} pts")
-                if result['rankings']['third_highest']:
-                    print(f"  🥉 Third: {', '.join(result['winner_names']['third_highest'])} - {result['scores']['third_highest']} pts")
-                print(f"  📉 Lowest: {', '.join(result['winner_names']['lowest'])} - {result['scores']['lowest']} pts")
-                
-                if result['rankings'].get('no_picks'):
-                    print(f"  ❌ No Picks: {', '.join(result['winner_names']['no_picks'])}")
-                
-                # Always show perfect week line, even if empty
-                if result['perfect_week_winners']:
-                    print(f"  🎯 Perfect Week: {', '.join(result['winner_names']['perfect_week'])}")
-                else:
-                    print(f"  🎯 Perfect Week: ")
+            print(f"  🥇 Highest: {', '.join(result['winner_names']['highest'])} - {result['scores']['highest']} pts")
+            if result['rankings']['second_highest']:
+                print(f"  🥈 Second: {', '.join(result['winner_names']['second_highest'])} - {result['scores']['second_highest']} pts")
+            if result['rankings']['third_highest']:
+                print(f"  🥉 Third: {', '.join(result['winner_names']['third_highest'])} - {result['scores']['third_highest']} pts")
+            print(f"  📉 Lowest: {', '.join(result['winner_names']['lowest'])} - {result['scores']['lowest']} pts")
             
-            # Handle old format for backward compatibility
+            if result['rankings'].get('no_picks'):
+                print(f"  ❌ No Picks: {', '.join(result['winner_names']['no_picks'])}")
+            
+            # Always show perfect week line, even if empty
+            if result['perfect_week_winners']:
+                print(f"  🎯 Perfect Week: {', '.join(result['winner_names']['perfect_week'])}")
             else:
-                print(f"  High Score: {', '.join(result['winner_names']['high_score'])} - {result['high_score']} pts")
-                if 'underdog_percentage' in result:
-                    print(f"  Underdog: {', '.join(result['winner_names']['underdog'])} - {result['underdog_percentage']:.1f}% correct")
-                else:
-                    print(f"  Underdog: {', '.join(result['winner_names']['underdog'])} - {result.get('underdog_correct', 0)}/{result['total_underdog_games']} correct")
+                print(f"  🎯 Perfect Week: ")
 
 
 def main():
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Skins Carryover Ledger
+======================
+
+An append-only, event-sourced record of every weekly skins settlement: who
+was paid, which skins tied and carried over, and perfect-week bonuses. Each
+event is one JSON line in <data>_ledger.jsonl and carries the pot it leaves
+for next week, so replaying the log never needs the payout settings.
+
+Current pots and per-user winnings come from a snapshot of the replayed state
+(<ledger>.snapshot.json) plus whatever events were appended after it, so
+reading them does not scan the log. replay() rebuilds the state as of any
+week.
+
+Usage:
+    python3 -m src.skins_ledger show [ledger.jsonl]
+    python3 -m src.skins_ledger replay <season> <week> [ledger.jsonl]
+"""
+
+import copy
+import os
+import sys
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are not serialized across processes
+    fcntl = None
+
+# Handle both relative and absolute imports
+try:
+    from . import serialization
+except ImportError:
+    import serialization
+
+LEDGER_VERSION = 1
+PERFECT_WEEK = 'perfect_week'
+
+
+def skins_ledger_path(data_file: str) -> str:
+    """Ledger kept next to a data file"""
+    return f"{os.path.splitext(data_file)[0]}_ledger.jsonl"
+
+
+def week_key(season, week) -> str:
+    return f"{int(season)}:{int(week)}"
+
+
+def new_state(base_pots: Dict[str, float]) -> dict:
+    """State of a ledger with no events"""
+    return {'pots': dict(base_pots), 'winnings': {}, 'wins': {}, 'weeks': {}, 'last_week': None, 'events': 0}
+
+
+def apply_event(state: dict, event: dict):
+    """Fold one ledger event into the state"""
+    kind, skin = event['type'], event['skin']
+    if kind == 'pot_opened':
+        # Starting pot carried in from an earlier record (no week is settled)
+        state['pots'][skin] = event['next_pot']
+        state['events'] += 1
+        return
+    settlement = state['weeks'].setdefault(week_key(event['season'], event['week']), {})
+
+    if kind == 'skin_paid':
+        winner = event['winner']
+        state['winnings'][winner] = state['winnings'].get(winner, 0) + event['amount']
+        wins = state['wins'].setdefault(skin, {})
+        wins[winner] = wins.get(winner, 0) + 1
+        state['pots'][skin] = event['next_pot']
+        settlement[skin] = {'pot': event['amount'], 'winners': [winner], 'carried': False,
+                            'next_pot': event['next_pot']}
+    elif kind == 'skin_carried':
+        state['pots'][skin] = event['next_pot']
+        settlement[skin] = {'pot': event['amount'], 'winners': event['tied'], 'carried': True,
+                            'next_pot': event['next_pot']}
+    elif kind == 'bonus_paid':
+        for winner in event['winners']:
+            state['winnings'][winner] = state['winnings'].get(winner, 0) + event['amount']
+            wins = state['wins'].setdefault(skin, {})
+            wins[winner] = wins.get(winner, 0) + 1
+        settlement[skin] = {'pot': event['amount'], 'winners': event['winners'], 'carried': False}
+    else:
+        raise ValueError(f"Unknown ledger event type: {kind}")
+
+    state['last_week'] = [event['season'], event['week']]
+    state['events'] += 1
+
+
+class SkinsLedger:
+    """Append-only skins ledger with a cached current-balance snapshot"""
+
+    def __init__(self, path: str, base_pots: Dict[str, float], perfect_week_payout: float = 0.0):
+        """
+        Open (or start) a ledger
+
+        Args:
+            path: Ledger file (see skins_ledger_path)
+            base_pots: Skin -> amount added each week (e.g. {'high_score': 10, 'underdog': 3})
+            perfect_week_payout: Bonus paid to each perfect-week winner
+        """
+        self.path = path
+        self.snapshot_path = f"{path}.snapshot.json"
+        self.base_pots = dict(base_pots)
+        self.perfect_week_payout = perfect_week_payout
+        self.state, self._offset = self._load()
+
+    def _read_events(self, offset: int = 0) -> Iterator[Tuple[int, dict]]:
+        """Yield (end offset, event) for complete lines from a byte offset"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break  # torn write at the end; ignore the partial event
+                    offset += len(line)
+                    yield offset, serialization.loads(line)
+        except FileNotFoundError:
+            return
+
+    def _load(self) -> Tuple[dict, int]:
+        """Snapshot state plus any events appended after it"""
+        state, offset = None, 0
+        try:
+            snapshot = serialization.load(self.snapshot_path)
+            if snapshot.get('schema_version') == LEDGER_VERSION and snapshot['offset'] <= self._size():
+                state, offset = snapshot['state'], snapshot['offset']
+        except (FileNotFoundError, ValueError):
+            pass
+        if state is None:
+            state, offset = new_state(self.base_pots), 0
+
+        for offset, event in self._read_events(offset):
+            apply_event(state, event)
+        return state, offset
+
+    def _size(self) -> int:
+        try:
+            return os.path.getsize(self.path)
+        except FileNotFoundError:
+            return 0
+
+    def _write_snapshot(self):
+        tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        serialization.dump({'schema_version': LEDGER_VERSION, 'offset': self._offset, 'state': self.state}, tmp_path)
+        os.replace(tmp_path, self.snapshot_path)
+
+    def pot(self, skin: str) -> float:
+        """Amount up for grabs in a skin's next settlement"""
+        return self.state['pots'].get(skin, self.base_pots.get(skin, 0))
+
+    def pots(self) -> Dict[str, float]:
+        """Every skin's current pot"""
+        return {skin: self.pot(skin) for skin in self.base_pots}
+
+    def winnings(self, owner_id: str) -> float:
+        """Total paid to a user so far"""
+        return self.state['winnings'].get(owner_id, 0)
+
+    def balances(self) -> Dict[str, float]:
+        """Owner id -> total paid so far"""
+        return dict(self.state['winnings'])
+
+    def wins(self, skin: str, owner_id: str) -> int:
+        """Times a user won a skin (or the perfect-week bonus)"""
+        return self.state['wins'].get(skin, {}).get(owner_id, 0)
+
+    def settlement(self, season, week) -> dict:
+        """A settled week's skins (pot, winners, carried, next_pot), or None"""
+        return copy.deepcopy(self.state['weeks'].get(week_key(season, week)))
+
+    def settle_week(self, season: int, week: int, skin_winners: Dict[str, List[str]],
+                    perfect_week_winners: List[str] = ()) -> dict:
+        """
+        Pay or carry every skin for a week and append the events
+
+        A skin is paid when exactly one user wins it; otherwise the pot carries
+        over and grows by its base amount. Settling a week twice returns the
+        recorded settlement without appending anything.
+
+        Args:
+            season: Season year
+            week: Week number
+            skin_winners: Skin -> owner ids with the best result that week
+            perfect_week_winners: Owner ids with a perfect week
+
+        Returns:
+            Skin -> {'pot', 'winners', 'carried', 'next_pot'}, plus 'perfect_week'
+            -> {'pot', 'winners', 'carried'} when anyone had a perfect week
+
+        Raises:
+            ValueError: If a later week has already been settled
+        """
+        existing = self.settlement(season, week)
+        if existing is not None:
+            return existing
+        last_week = self.state['last_week']
+        if last_week is not None and (season, week) < tuple(last_week):
+            # Pots carry forward, so an earlier week cannot be settled after a later one
+            raise ValueError(f"Cannot settle {season} week {week} after {last_week[0]} week {last_week[1]}")
+
+        events = []
+        for skin, winners in skin_winners.items():
+            pot = self.pot(skin)
+            base = self.base_pots.get(skin, 0)
+            if len(winners) == 1:
+                events.append({'type': 'skin_paid', 'season': season, 'week': week, 'skin': skin,
+                               'amount': pot, 'winner': winners[0], 'next_pot': base})
+            else:
+                events.append({'type': 'skin_carried', 'season': season, 'week': week, 'skin': skin,
+                               'amount': pot, 'tied': list(winners), 'next_pot': pot + base})
+        if perfect_week_winners:
+            events.append({'type': 'bonus_paid', 'season': season, 'week': week, 'skin': PERFECT_WEEK,
+                           'amount': self.perfect_week_payout, 'winners': list(perfect_week_winners)})
+
+        self.append(events)
+        return self.settlement(season, week)
+
+    def open_pots(self, season: int, week: int, pots: Dict[str, float]):
+        """Start an empty ledger from pots recorded elsewhere (e.g. the old Skins_Tracking sheet)"""
+        if self.state['events']:
+            raise ValueError("Pots can only be opened on an empty ledger")
+        self.append([{'type': 'pot_opened', 'season': season, 'week': week, 'skin': skin, 'next_pot': amount}
+                     for skin, amount in pots.items()])
+
+    def append(self, events: List[dict]):
+        """Append events to the log, fold them into the state and refresh the snapshot"""
+        if not events:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = b''.join(serialization.dumps(event) + b'\n' for event in events)
+        with open(self.path, 'ab') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                # Catch up on events other processes appended, then drop a torn
+                # final write so the new events start on a clean line
+                for self._offset, event in self._read_events(self._offset):
+                    apply_event(self.state, event)
+                if os.fstat(f.fileno()).st_size > self._offset:
+                    f.truncate(self._offset)
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        for event in events:
+            apply_event(self.state, event)
+        self._offset += len(data)
+        self._write_snapshot()
+
+    def events(self) -> Iterator[dict]:
+        """Every event in the log, oldest first"""
+        for _, event in self._read_events():
+            yield event
+
+    def replay(self, season: int = None, week: int = None) -> dict:
+        """
+        Rebuild the state from the log
+
+        Args:
+            season: Stop after this season (default: replay everything)
+            week: Stop after this week of the season (default: the whole season)
+
+        Returns:
+            State dict with pots, winnings, wins, weeks and last_week
+        """
+        state = new_state(self.base_pots)
+        for event in self.events():
+            if season is not None and (event['season'], event['week']) > (season, week if week is not None else 10 ** 6):
+                continue
+            apply_event(state, event)
+        return state
+
+    def rebuild_snapshot(self) -> dict:
+        """Replay the whole log and rewrite the snapshot"""
+        self.state = self.replay()
+        self._offset = self._size()
+        self._write_snapshot()
+        return copy.deepcopy(self.state)
+
+
+def main():
+    """Show the ledger or replay it to a week from the command line"""
+    if len(sys.argv) < 2 or sys.argv[1] not in ('show', 'replay') or (sys.argv[1] == 'replay' and len(sys.argv) < 4):
+        print("Usage: python3 -m src.skins_ledger show [ledger.jsonl]")
+        print("       python3 -m src.skins_ledger replay <season> <week> [ledger.jsonl]")
+        return
+
+    args = sys.argv[2:] if sys.argv[1] == 'show' else sys.argv[4:]
+    path = args[0] if args else skins_ledger_path("skins_game_data.xlsx")
+    ledger = SkinsLedger(path, {})
+    if sys.argv[1] == 'show':
+        state = ledger.rebuild_snapshot()
+        title = "CURRENT"
+    else:
+        state = ledger.replay(int(sys.argv[2]), int(sys.argv[3]))
+        title = f"AS OF {sys.argv[2]} WEEK {sys.argv[3]}"
+
+    print(f"📒 SKINS LEDGER {title} ({state['events']} events)")
+    for skin, pot in sorted(state['pots'].items()):
+        print(f"   💰 {skin}: ${pot:g}")
+    for owner_id, amount in sorted(state['winnings'].items(), key=lambda item: item[1], reverse=True):
+        print(f"   {owner_id}: ${amount:g}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,24 @@
-import requests
 import json
 from datetime import datetime
 from typing import Dict, List, Optional
 
+# Handle both relative and absolute imports
+try:
+    from .sleeper_client import SleeperClient
+    from .snapshot_archive import SnapshotArchive
+    from . import serialization
+except ImportError:
+    from sleeper_client import SleeperClient
+    from snapshot_archive import SnapshotArchive
+    import serialization
+
 class SleeperAPIExplorer:
-    def __init__(self, league_id: str):
+    def __init__(self, league_id: str, base_url: str = None, snapshot_archive: str = None):
         self.league_id = league_id
-        self.base_url = "https://api.sleeper.app/v1"
+        self.client = SleeperClient(base_url)
+        self.base_url = self.client.base_url
+        # Every rosters poll is appended here as a compressed delta when set
+        self.snapshot_archive = SnapshotArchive(snapshot_archive) if snapshot_archive else None
         
     def pretty_print(self, data, title: str):
         """Pretty print JSON data with a title"""
@@ -18,8 +30,7 @@ class SleeperAPIExplorer:
     
     def save_to_file(self, data, filename: str):
         """Save data to a JSON file for detailed inspection"""
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        serialization.dump(data, filename, pretty=True)
         print(f"Data saved to {filename}")
     
     def explore_league_info(self):
@@ -27,7 +38,7 @@ class SleeperAPIExplorer:
         print("🏈 EXPLORING LEAGUE INFO...")
         
         url = f"{self.base_url}/league/{self.league_id}"
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code == 200:
             league_data = response.json()
@@ -53,7 +64,7 @@ class SleeperAPIExplorer:
         print("\n👥 EXPLORING LEAGUE USERS...")
         
         url = f"{self.base_url}/league/{self.league_id}/users"
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code == 200:
             users_data = response.json()
@@ -74,12 +85,15 @@ class SleeperAPIExplorer:
         print("\n📋 EXPLORING ROSTERS...")
         
         url = f"{self.base_url}/league/{self.league_id}/rosters"
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code == 200:
             rosters_data = response.json()
             self.pretty_print(rosters_data, "ROSTERS")
             self.save_to_file(rosters_data, "rosters.json")
+            if self.snapshot_archive is not None:
+                index = self.snapshot_archive.append(rosters_data)
+                print(f"📸 Rosters snapshot {index} archived to {self.snapshot_archive.path}")
             
             return rosters_data
         else:
@@ -91,7 +105,7 @@ class SleeperAPIExplorer:
         print(f"\n🏆 EXPLORING WEEK {week} MATCHUPS...")
         
         url = f"{self.base_url}/league/{self.league_id}/matchups/{week}"
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code == 200:
             matchups_data = response.json()
@@ -116,7 +130,7 @@ class SleeperAPIExplorer:
         print("\n🏆 EXPLORING PLAYOFF BRACKET...")
         
         url = f"{self.base_url}/league/{self.league_id}/bracket/1"  # 1 is winners bracket
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code == 200:
             bracket_data = response.json()
@@ -132,7 +146,7 @@ class SleeperAPIExplorer:
         print("\n💰 EXPLORING TRANSACTIONS...")
         
         url = f"{self.base_url}/league/{self.league_id}/transactions/1"  # Week 1, adjust as needed
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code == 200:
             transactions_data = response.json()
@@ -159,7 +173,7 @@ class SleeperAPIExplorer:
         for endpoint in potential_endpoints:
             url = f"{self.base_url}{endpoint}"
             print(f"Trying: {url}")
-            response = requests.get(url)
+            response = self.client.get(url)
             
             if response.status_code == 200:
                 data = response.json()
@@ -178,7 +192,7 @@ class SleeperAPIExplorer:
         print(f"\n🏈 EXPLORING NFL GAMES - WEEK {week}, SEASON {season}...")
         
         url = f"{self.base_url}/games/nfl/{season}/{week}"
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code == 200:
             games_data = response.json()
@@ -204,7 +218,7 @@ class SleeperAPIExplorer:
         print(f"\n📅 EXPLORING NFL STATE FOR SEASON {season}...")
         
         url = f"{self.base_url}/games/nfl/{season}"
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code == 200:
             state_data = response.json()
@@ -269,9 +283,10 @@ class SleeperAPIExplorer:
 if __name__ == "__main__":
     # Get league ID from secure configuration
     from .secure_config import config
+    from .snapshot_archive import default_archive_path
     league_id = config.sleeper_league_id
     
-    explorer = SleeperAPIExplorer(league_id)
+    explorer = SleeperAPIExplorer(league_id, snapshot_archive=default_archive_path(config.data_directory, league_id))
     
     # Run full exploration
     explorer.full_exploration(weeks_to_check=[1, 2, 3, 4])
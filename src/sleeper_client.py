@@ -0,0 +1,334 @@
+"""
+Sleeper API Client
+Shared HTTP access to the Sleeper API for every league class
+"""
+
+import io
+import os
+import random
+import re
+import threading
+import time
+import requests
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import BinaryIO, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+# Handle both relative and absolute imports
+try:
+    from .perf_metrics import metrics
+    from .rate_limiter import TokenBucketRateLimiter, get_default_rate_limiter
+    from .circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+except ImportError:
+    from perf_metrics import metrics
+    from rate_limiter import TokenBucketRateLimiter, get_default_rate_limiter
+    from circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker
+
+DEFAULT_BASE_URL = "https://api.sleeper.app/v1"
+DEFAULT_CACHE_DIRECTORY = "outputs/cache"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# GETs currently on the wire, keyed by URL, so concurrent callers share one fetch
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+
+class _Flight:
+    """One in-progress GET whose result is handed to every waiting caller"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+def last_good_path(cache_directory: str, url: str) -> str:
+    """File holding the last successful body for a URL"""
+    key = re.sub(r'[^A-Za-z0-9_.-]', '_', url.split('://', 1)[-1])
+    return os.path.join(cache_directory, 'last_good', key)
+
+
+def _remember(path: str, body: bytes):
+    """Persist a successful body so later runs can fall back to it"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+
+
+def _last_good_response(path: str, url: str) -> Optional[requests.Response]:
+    """Rebuild a 200 response from a persisted body (None if there is none)"""
+    try:
+        with open(path, 'rb') as f:
+            body = f.read()
+    except OSError:
+        return None
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.encoding = 'utf-8'
+    response.headers['Content-Type'] = 'application/json'
+    response._content = body
+    return response
+
+
+class _SavingReader(io.RawIOBase):
+    """Reads a streamed body and copies it to the URL's last-good file as it goes"""
+
+    def __init__(self, raw, path: str):
+        self.raw = raw
+        self.path = path
+        self.bytes_read = 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self._copy = open(self._tmp_path, 'wb')
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self.raw.read(len(buffer))
+        count = len(data)
+        buffer[:count] = data
+        self._copy.write(data)
+        self.bytes_read += count
+        return count
+
+    def commit(self):
+        """Read whatever the parser left and keep the copy as the last good body"""
+        while self.read(1 << 16):
+            pass
+        self._copy.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self):
+        if not self._copy.closed:
+            self._copy.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+def _saved_at(path: str) -> str:
+    return datetime.fromtimestamp(os.path.getmtime(path)).strftime('%Y-%m-%d %H:%M')
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class SleeperClient:
+    """Thin wrapper around requests that owns the Sleeper base URL"""
+
+    def __init__(self, base_url: str = None, session: Optional[requests.Session] = None,
+                 timeout: float = 30.0, rate_limiter: Optional[TokenBucketRateLimiter] = None,
+                 max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 circuit_breaker: Optional[CircuitBreaker] = None, cache_directory: str = None):
+        """
+        Initialize the Sleeper client
+
+        Args:
+            base_url: API root URL (optional, falls back to SLEEPER_API_BASE_URL, then the public API)
+            session: requests session to reuse connections with (optional)
+            timeout: Per-request timeout in seconds
+            rate_limiter: Token bucket every request waits on (defaults to the machine-wide limiter)
+            max_retries: Retries for 429/5xx responses and connection errors
+            backoff_base: First retry delay in seconds (doubles per attempt, full jitter)
+            backoff_max: Upper bound for a single retry delay, including Retry-After
+            circuit_breaker: Breaker to use (defaults to the shared breaker for the API host)
+            cache_directory: Where last-good bodies are kept for outages (optional, falls back
+                to CACHE_DIRECTORY, then outputs/cache)
+        """
+        self.base_url = (base_url or os.getenv('SLEEPER_API_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(urlparse(self.base_url).netloc)
+        self.cache_directory = cache_directory or os.getenv('CACHE_DIRECTORY') or DEFAULT_CACHE_DIRECTORY
+
+    def url(self, path: str) -> str:
+        """Build an absolute URL for an API path such as "/league/123/rosters" """
+        if path.startswith(('http://', 'https://')):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def get(self, path: str) -> requests.Response:
+        """
+        Issue a GET request for an API path (or an absolute URL built from base_url)
+
+        Concurrent requests for the same URL are coalesced: the first caller
+        fetches and the others wait for and share its response (or error).
+        Retries 429/5xx responses and connection errors with jittered exponential
+        backoff, honoring Retry-After. When the host's circuit breaker is open, or
+        every retry failed, the last successful response for the URL is returned
+        if there is one. Successful bodies are kept on disk under cache_directory,
+        so a fresh run can fall back to what an earlier run fetched.
+
+        Raises:
+            CircuitOpenError: If the breaker is open and nothing is cached for the URL
+        """
+        url = self.url(path)
+        with _in_flight_lock:
+            flight = _in_flight.get(url)
+            leader = flight is None
+            if leader:
+                flight = _in_flight[url] = _Flight()
+
+        if not leader:
+            metrics.incr('http_coalesced')
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            flight.response = self._fetch(path, url)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with _in_flight_lock:
+                del _in_flight[url]
+            flight.done.set()
+        return flight.response
+
+    @contextmanager
+    def stream(self, path: str) -> Iterator[Tuple[int, Optional[BinaryIO]]]:
+        """
+        GET an API path and read its body incrementally instead of holding it in memory
+
+        Same retries, circuit breaker and last-good fallback as get(), but
+        concurrent calls are not coalesced. A 200 body is copied to the
+        last-good file while it is read.
+
+        Yields:
+            (status_code, body): body is a binary file object for a 200 (or the
+            saved last-good body during an outage), None for other statuses
+
+        Raises:
+            CircuitOpenError: If the breaker is open and nothing is saved for the URL
+        """
+        url = self.url(path)
+        saved_path = last_good_path(self.cache_directory, url)
+        response, error, failed = self._request(path, url, stream=True)
+
+        if failed:
+            if response is not None:
+                response.close()
+            try:
+                body = open(saved_path, 'rb')
+            except OSError:
+                if error is not None:
+                    raise error
+                yield response.status_code, None
+                return
+            metrics.incr('http_stale_fallbacks')
+            print(f"⚠️  Sleeper API unavailable, using last good response for {url} (saved {_saved_at(saved_path)})")
+            with body:
+                yield 200, body
+            return
+
+        body = None
+        try:
+            if response.status_code != 200:
+                yield response.status_code, None
+                return
+            response.raw.decode_content = True
+            body = _SavingReader(response.raw, saved_path)
+            yield 200, body
+            body.commit()
+            metrics.incr('http_bytes', body.bytes_read)
+        finally:
+            if body is not None:
+                body.discard()
+            response.close()
+
+    def _fetch(self, path: str, url: str) -> requests.Response:
+        response, error, failed = self._request(path, url)
+        if failed:
+            return self._fallback(url, error, response)
+
+        if response.status_code == 200:
+            try:
+                _remember(last_good_path(self.cache_directory, url), response.content)
+            except OSError as e:
+                print(f"⚠️  Could not save last good response for {url}: {e}")
+        return response
+
+    def _request(self, path: str, url: str, stream: bool = False):
+        """Send with retries; returns (response, error, failed) where failed means fall back"""
+        if not self.circuit_breaker.allow_request():
+            return None, CircuitOpenError(f"Circuit open for {urlparse(url).netloc}"), True
+
+        response = None
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                metrics.incr('http_retries')
+                delay = self._retry_delay(attempt, response)
+                if stream and response is not None:
+                    response.close()
+                time.sleep(delay)
+
+            response, error = self._send(path, url, stream)
+            if error is None and response.status_code not in RETRY_STATUSES:
+                break
+        else:
+            self.circuit_breaker.record_failure()
+            return response, error, True
+
+        self.circuit_breaker.record_success()
+        return response, None, False
+
+    def _send(self, path: str, url: str, stream: bool = False):
+        waited = self.rate_limiter.acquire()
+        if waited > 0.001:
+            metrics.incr('rate_limit_waits')
+            metrics.incr('rate_limit_wait_seconds', waited)
+
+        try:
+            with metrics.span('http_get', path=path):
+                response = self.session.get(url, timeout=self.timeout, stream=stream)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            metrics.incr('http_errors')
+            return None, e
+        metrics.incr('http_requests')
+        if not stream:
+            metrics.incr('http_bytes', len(response.content))
+        return response, None
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    def _fallback(self, url: str, error: Optional[Exception],
+                  response: Optional[requests.Response] = None) -> requests.Response:
+        path = last_good_path(self.cache_directory, url)
+        cached = _last_good_response(path, url)
+        if cached is not None:
+            metrics.incr('http_stale_fallbacks')
+            print(f"⚠️  Sleeper API unavailable, using last good response for {url} (saved {_saved_at(path)})")
+            return cached
+        if error is not None:
+            raise error
+        return response
@@ -1,4 +1,4 @@
-import requests
+import os
 import pandas as pd
 import json
 from datetime import datetime
@@ -6,18 +6,31 @@ from typing import Dict, List, Tuple, Optional
 from twilio.rest import Client
 import schedule
 import time
+import threading
+
+# Handle both relative and absolute imports
+try:
+    from .sleeper_client import SleeperClient
+    from .roster_parser import parse_rosters
+    from .skins_ledger import SkinsLedger, skins_ledger_path, PERFECT_WEEK
+except ImportError:
+    from sleeper_client import SleeperClient
+    from roster_parser import parse_rosters
+    from skins_ledger import SkinsLedger, skins_ledger_path, PERFECT_WEEK
 
 class SleeperSkinsGame:
-    def __init__(self, league_id: str, config_file: str = "config.json"):
+    def __init__(self, league_id: str, config_file: str = "config.json", base_url: str = None):
         """
         Initialize the Sleeper Skins Game automation
         
         Args:
             league_id: Your Sleeper league ID
             config_file: Path to configuration file
+            base_url: Sleeper API root URL (optional, e.g. a local stand-in server)
         """
         self.league_id = league_id
-        self.base_url = "https://api.sleeper.app/v1"
+        self.client = SleeperClient(base_url)
+        self.base_url = self.client.base_url
         self.data_file = "skins_game_data.xlsx"
         
         # Load configuration
@@ -38,9 +51,19 @@ class SleeperSkinsGame:
         # Initialize data storage
         self.init_data_storage()
         
+        # Payouts, ties and carryovers live in an append-only ledger
+        self.ledger = SkinsLedger(
+            skins_ledger_path(self.data_file),
+            {'high_score': self.weekly_high_score_payout, 'underdog': self.weekly_underdog_payout},
+            self.perfect_week_payout
+        )
+        if not self.ledger.state['events']:
+            self.import_skins_tracking()
+        
         # Cache for user data
         self._users_cache = None
         self._rosters_cache = None
+        self._cache_lock = threading.RLock()  # One fetch per cache when shared across threads
     
     def load_config(self, config_file: str) -> dict:
         """Load configuration from JSON file"""
@@ -110,7 +133,7 @@ class SleeperSkinsGame:
     def get_league_info(self) -> dict:
         """Get league information including current week"""
         url = f"{self.base_url}/league/{self.league_id}"
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code == 200:
             return response.json()
@@ -119,28 +142,31 @@ class SleeperSkinsGame:
     
     def get_users(self) -> Dict[str, dict]:
         """Get all users in the league with caching"""
-        if self._users_cache is None:
-            url = f"{self.base_url}/league/{self.league_id}/users"
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                users = response.json()
-                self._users_cache = {user['user_id']: user for user in users}
-            else:
-                raise Exception(f"Failed to get league users: {response.status_code}")
+        with self._cache_lock:
+            if self._users_cache is None:
+                url = f"{self.base_url}/league/{self.league_id}/users"
+                response = self.client.get(url)
+                
+                if response.status_code == 200:
+                    users = response.json()
+                    self._users_cache = {user['user_id']: user for user in users}
+                else:
+                    raise Exception(f"Failed to get league users: {response.status_code}")
         
         return self._users_cache
     
     def get_rosters(self) -> List[dict]:
-        """Get all rosters data with caching"""
-        if self._rosters_cache is None:
-            url = f"{self.base_url}/league/{self.league_id}/rosters"
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                self._rosters_cache = response.json()
-            else:
-                raise Exception(f"Failed to get rosters: {response.status_code}")
+        """Get all rosters (owner_id and pick'em metadata only) with caching"""
+        with self._cache_lock:
+            if self._rosters_cache is None:
+                url = f"{self.base_url}/league/{self.league_id}/rosters"
+                
+                # Parse the body as it arrives so the full payload is never held in memory
+                with self.client.stream(url) as (status_code, body):
+                    if status_code == 200:
+                        self._rosters_cache = parse_rosters(body)
+                    else:
+                        raise Exception(f"Failed to get rosters: {status_code}")
         
         return self._rosters_cache
     
@@ -258,21 +284,25 @@ class SleeperSkinsGame:
         
         return perfect_week_users
     
-    def load_current_skins(self) -> Dict[str, float]:
-        """Load current skin amounts"""
+    def import_skins_tracking(self):
+        """Carry the latest Skins_Tracking amounts into a new ledger"""
         try:
             skins_df = pd.read_excel(self.data_file, sheet_name='Skins_Tracking')
-            
-            if skins_df.empty:
-                return {'high_score': self.weekly_high_score_payout, 'underdog': self.weekly_underdog_payout}
-            
-            latest = skins_df.iloc[-1]
-            return {
-                'high_score': latest.get('high_score_skin_amount', self.weekly_high_score_payout),
-                'underdog': latest.get('underdog_skin_amount', self.weekly_underdog_payout)
-            }
-        except:
-            return {'high_score': self.weekly_high_score_payout, 'underdog': self.weekly_underdog_payout}
+        except Exception:
+            return
+        if skins_df.empty:
+            return
+        
+        latest = skins_df.iloc[-1]
+        self.ledger.open_pots(int(latest['season']), int(latest['week']), {
+            'high_score': float(latest.get('high_score_skin_amount', self.weekly_high_score_payout)),
+            'underdog': float(latest.get('underdog_skin_amount', self.weekly_underdog_payout))
+        })
+        print(f"📒 Imported skin amounts for week {int(latest['week'])} into {self.ledger.path}")
+    
+    def load_current_skins(self) -> Dict[str, float]:
+        """Load current skin amounts"""
+        return self.ledger.pots()
     
     def process_week(self, week: int, odds_data: Dict[str, dict], season: int = 2025):
         """
@@ -297,21 +327,17 @@ class SleeperSkinsGame:
         underdog_winners, underdog_correct, total_underdog_games = self.calculate_underdog_winners(week, odds_data)
         perfect_week_winners = self.check_perfect_week(week, odds_data)
         
-        # Get current skin amounts
-        current_skins = self.load_current_skins()
-        
-        # Determine payouts and carry-overs
-        high_score_payout = current_skins['high_score']
-        underdog_payout = current_skins['underdog']
-        
-        # Handle ties (carry over skins)
-        high_score_carried = len(high_score_winners) != 1
-        underdog_carried = len(underdog_winners) != 1
+        # Pay or carry each skin; the ledger owns the carryover math
+        settlement = self.ledger.settle_week(
+            season, week, {'high_score': high_score_winners, 'underdog': underdog_winners}, perfect_week_winners
+        )
         
-        next_high_score_skin = (high_score_payout + self.weekly_high_score_payout 
-                               if high_score_carried else self.weekly_high_score_payout)
-        next_underdog_skin = (underdog_payout + self.weekly_underdog_payout 
-                             if underdog_carried else self.weekly_underdog_payout)
+        high_score_payout = settlement['high_score']['pot']
+        underdog_payout = settlement['underdog']['pot']
+        high_score_carried = settlement['high_score']['carried']
+        underdog_carried = settlement['underdog']['carried']
+        next_high_score_skin = settlement['high_score']['next_pot']
+        next_underdog_skin = settlement['underdog']['next_pot']
         
         # Save results
         self.save_week_results(
@@ -325,14 +351,14 @@ class SleeperSkinsGame:
                               high_score_carried, underdog_carried)
         
         # Update user stats
-        self.update_user_stats(high_score_winners, underdog_winners, perfect_week_winners,
-                              high_score_payout, underdog_payout, users)
+        self.update_user_stats(high_score_winners, underdog_winners, perfect_week_winners, settlement, users)
         
         # Send notifications
         self.send_notifications(week, season, high_score_winners, high_score, 
                               underdog_winners, underdog_correct, perfect_week_winners,
                               high_score_payout, underdog_payout, high_score_carried, 
-                              underdog_carried, users, total_underdog_games)
+                              underdog_carried, users, total_underdog_games,
+                              next_high_score_skin, next_underdog_skin)
         
         print(f"Week {week} processing complete!")
     
@@ -385,8 +411,7 @@ class SleeperSkinsGame:
             skins_df.to_excel(writer, sheet_name='Skins_Tracking', index=False)
     
     def update_user_stats(self, high_score_winners: List[str], underdog_winners: List[str],
-                         perfect_week_winners: List[str], high_score_payout: float,
-                         underdog_payout: float, users: Dict[str, dict]):
+                         perfect_week_winners: List[str], settlement: dict, users: Dict[str, dict]):
         """Update cumulative user statistics"""
         
         users_df = pd.read_excel(self.data_file, sheet_name='User_Stats')
@@ -416,18 +441,13 @@ class SleeperSkinsGame:
             else:
                 user_idx = user_row.index[0]
             
-            # Update stats
-            if owner_id in high_score_winners and len(high_score_winners) == 1:
-                users_df.at[user_idx, 'total_high_score_wins'] += 1
-                users_df.at[user_idx, 'total_winnings'] += high_score_payout
-            
-            if owner_id in underdog_winners and len(underdog_winners) == 1:
-                users_df.at[user_idx, 'total_underdog_wins'] += 1
-                users_df.at[user_idx, 'total_winnings'] += underdog_payout
-            
-            if owner_id in perfect_week_winners:
-                users_df.at[user_idx, 'perfect_weeks'] += 1
-                users_df.at[user_idx, 'total_winnings'] += self.perfect_week_payout
+            # Update stats from what the ledger paid this week
+            for skin, column in (('high_score', 'total_high_score_wins'), ('underdog', 'total_underdog_wins'),
+                                 (PERFECT_WEEK, 'perfect_weeks')):
+                paid = settlement.get(skin)
+                if paid and not paid['carried'] and owner_id in paid['winners']:
+                    users_df.at[user_idx, column] += 1
+                    users_df.at[user_idx, 'total_winnings'] += paid['pot']
         
         # Save updated stats
         with pd.ExcelWriter(self.data_file, engine='openpyxl', mode='a', if_sheet_exists='replace') as writer:
@@ -437,7 +457,8 @@ class SleeperSkinsGame:
                           high_score: float, underdog_winners: List[str], underdog_correct: int,
                           perfect_week_winners: List[str], high_score_payout: float,
                           underdog_payout: float, high_score_carried: bool, 
-                          underdog_carried: bool, users: Dict[str, dict], total_underdog_games: int):
+                          underdog_carried: bool, users: Dict[str, dict], total_underdog_games: int,
+                          next_high_score_skin: float, next_underdog_skin: float):
         """Send text message notifications"""
         
         if not self.config.get('twilio'):
@@ -454,7 +475,7 @@ class SleeperSkinsGame:
             message += f"Score: {high_score} points\nPayout: ${high_score_payout}\n\n"
         elif high_score_carried:
             message += f"🔄 HIGH SCORE TIE ({len(high_score_winners)} players at {high_score} pts)\n"
-            message += f"Skin carries over! Next week: ${high_score_payout + self.weekly_high_score_payout}\n\n"
+            message += f"Skin carries over! Next week: ${next_high_score_skin}\n\n"
         
         # Underdog Results
         if underdog_winners and not underdog_carried:
@@ -463,7 +484,7 @@ class SleeperSkinsGame:
             message += f"Correct underdogs: {underdog_correct}/{total_underdog_games}\nPayout: ${underdog_payout}\n\n"
         elif underdog_carried:
             message += f"🔄 UNDERDOG TIE ({len(underdog_winners)} players with {underdog_correct} correct)\n"
-            message += f"Skin carries over! Next week: ${underdog_payout + self.weekly_underdog_payout}\n\n"
+            message += f"Skin carries over! Next week: ${next_underdog_skin}\n\n"
         
         # Perfect Week
         if perfect_week_winners:
@@ -472,10 +493,7 @@ class SleeperSkinsGame:
             message += f"Payout: ${self.perfect_week_payout}\n\n"
         
         # Next week info
-        next_high = high_score_payout + self.weekly_high_score_payout if high_score_carried else self.weekly_high_score_payout
-        next_under = underdog_payout + self.weekly_underdog_payout if underdog_carried else self.weekly_underdog_payout
-        
-        message += f"NEXT WEEK SKINS:\n💰 High Score: ${next_high}\n🐕 Underdog: ${next_under}"
+        message += f"NEXT WEEK SKINS:\n💰 High Score: ${next_high_score_skin}\n🐕 Underdog: ${next_underdog_skin}"
         
         # Send notifications
         for phone_number in self.config['twilio'].get('to_numbers', []):
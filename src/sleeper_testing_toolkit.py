@@ -1,14 +1,28 @@
-import requests
 import json
 from datetime import datetime
 import pandas as pd
 from typing import Dict, List
 import os
 
+# Handle both relative and absolute imports
+try:
+    from .sleeper_client import SleeperClient
+    from .roster_parser import iter_compact_rosters
+    from .compact_records import RosterTable
+    from .pick_analytics import PickMatrix, PickSimilarity
+    from . import serialization
+except ImportError:
+    from sleeper_client import SleeperClient
+    from roster_parser import iter_compact_rosters
+    from compact_records import RosterTable
+    from pick_analytics import PickMatrix, PickSimilarity
+    import serialization
+
 class SleeperTestingToolkit:
-    def __init__(self, league_id: str):
+    def __init__(self, league_id: str, base_url: str = None):
         self.league_id = league_id
-        self.base_url = "https://api.sleeper.app/v1"
+        self.client = SleeperClient(base_url)
+        self.base_url = self.client.base_url
     
     def test_league_connection(self):
         """Test basic connection and get league overview"""
@@ -18,7 +32,7 @@ class SleeperTestingToolkit:
         try:
             # Test league info
             league_url = f"{self.base_url}/league/{self.league_id}"
-            league_response = requests.get(league_url)
+            league_response = self.client.get(league_url)
             
             if league_response.status_code != 200:
                 print(f"❌ Failed to connect to league: {league_response.status_code}")
@@ -54,7 +68,7 @@ class SleeperTestingToolkit:
         print("\n📊 ANALYZING ROSTER DATA STRUCTURE...")
         
         url = f"{self.base_url}/league/{self.league_id}/rosters"
-        response = requests.get(url)
+        response = self.client.get(url)
         
         if response.status_code != 200:
             print(f"❌ Failed to get rosters: {response.status_code}")
@@ -110,11 +124,11 @@ class SleeperTestingToolkit:
         
         # Get users
         users_url = f"{self.base_url}/league/{self.league_id}/users"
-        users_response = requests.get(users_url)
+        users_response = self.client.get(users_url)
         
         # Get rosters
         rosters_url = f"{self.base_url}/league/{self.league_id}/rosters"
-        rosters_response = requests.get(rosters_url)
+        rosters_response = self.client.get(rosters_url)
         
         if users_response.status_code != 200 or rosters_response.status_code != 200:
             print("❌ Failed to get user or roster data")
@@ -143,8 +157,7 @@ class SleeperTestingToolkit:
             })
         
         # Save to both JSON and Excel for easy viewing
-        with open('user_mapping.json', 'w') as f:
-            json.dump(mapping, f, indent=2)
+        serialization.dump(mapping, 'user_mapping.json', pretty=True)
         
         df = pd.DataFrame(mapping)
         df.to_excel('user_mapping.xlsx', index=False)
@@ -163,7 +176,7 @@ class SleeperTestingToolkit:
         print(f"\n🔍 DETAILED ANALYSIS - WEEK {week}")
         
         rosters_url = f"{self.base_url}/league/{self.league_id}/rosters"
-        rosters_response = requests.get(rosters_url)
+        rosters_response = self.client.get(rosters_url)
         
         if rosters_response.status_code != 200:
             print(f"❌ Failed to get rosters")
@@ -233,10 +246,39 @@ class SleeperTestingToolkit:
         
         return week_data
     
+    def analyze_pick_similarity(self, k: int = 3):
+        """Show who picks like whom across every week of the season"""
+        print(f"\n🤝 PICK SIMILARITY - TOP {k} PER USER")
+        
+        rosters_url = f"{self.base_url}/league/{self.league_id}/rosters"
+        with self.client.stream(rosters_url) as (status_code, body):
+            if status_code != 200:
+                print(f"❌ Failed to get rosters")
+                return None
+            rosters = RosterTable.from_rosters(iter_compact_rosters(body))
+        
+        users = self.get_users_dict()
+        matrix = PickMatrix.from_rosters(rosters)
+        print(f"   {len(matrix)} users, weeks {', '.join(str(w) for w in matrix.weeks)}")
+        
+        neighbors = PickSimilarity(matrix).nearest(k)
+        names = {uid: info.get('display_name', 'Unknown') for uid, info in users.items()}
+        neighbors.insert(1, 'display_name', neighbors['user_id'].map(names))
+        neighbors.insert(4, 'neighbor_name', neighbors['neighbor_id'].map(names))
+        
+        for user_id, group in neighbors.groupby('user_id', sort=False):
+            matches = ', '.join(f"{row.neighbor_name} ({row.jaccard:.0%})" for row in group.itertuples())
+            print(f"   {names.get(user_id, 'Unknown')}: {matches}")
+        
+        neighbors.to_csv('pick_similarity.csv', index=False)
+        print(f"\n💾 Pick similarity saved to pick_similarity.csv")
+        
+        return neighbors
+    
     def get_users_dict(self) -> Dict[str, dict]:
         """Get users as a dictionary keyed by user_id"""
         users_url = f"{self.base_url}/league/{self.league_id}/users"
-        response = requests.get(users_url)
+        response = self.client.get(users_url)
         
         if response.status_code == 200:
             users = response.json()
@@ -281,7 +323,7 @@ class SleeperTestingToolkit:
         
         # Try to get NFL games data (might have some info)
         nfl_url = f"{self.base_url}/games/nfl/2025/{week}"
-        response = requests.get(nfl_url)
+        response = self.client.get(nfl_url)
         
         if response.status_code == 200:
             games_data = response.json()
@@ -323,7 +365,7 @@ class SleeperTestingToolkit:
         print(f"\n⚡ QUICK OVERVIEW - WEEK {week}")
         
         rosters_url = f"{self.base_url}/league/{self.league_id}/rosters"
-        response = requests.get(rosters_url)
+        response = self.client.get(rosters_url)
         
         if response.status_code != 200:
             print(f"❌ Failed to get rosters")
@@ -374,7 +416,7 @@ class SleeperTestingToolkit:
     def get_users_dict(self) -> Dict[str, dict]:
         """Get users dictionary"""
         users_url = f"{self.base_url}/league/{self.league_id}/users"
-        response = requests.get(users_url)
+        response = self.client.get(users_url)
         
         if response.status_code == 200:
             users = response.json()
@@ -393,7 +435,7 @@ class SleeperTestingToolkit:
             
             if week_input.lower() == 'current':
                 league_info_url = f"{self.base_url}/league/{self.league_id}"
-                response = requests.get(league_info_url)
+                response = self.client.get(league_info_url)
                 if response.status_code == 200:
                     league_data = response.json()
                     latest_leg = league_data.get('metadata', {}).get('latest_report_leg_id', '')
@@ -554,9 +596,10 @@ def main():
         print("5. Validate odds file")
         print("6. Process completed week")
         print("7. Quick week overview")
-        print("8. Exit")
+        print("8. Pick similarity (who picks like whom)")
+        print("9. Exit")
         
-        choice = input("\nEnter choice (1-8): ").strip()
+        choice = input("\nEnter choice (1-9): ").strip()
         
         if choice == '1':
             toolkit.analyze_roster_data()
@@ -593,6 +636,9 @@ def main():
                 print("Invalid week number")
         
         elif choice == '8':
+            toolkit.analyze_pick_similarity()
+        
+        elif choice == '9':
             print("👋 Goodbye!")
             break
         
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Rosters Snapshot Archive
+========================
+
+Keeps every polled /rosters payload so score changes can be audited, at a
+fraction of the size of full JSON dumps. Each snapshot is stored as a JSON
+patch against the previous one (with a full keyframe every N snapshots) and
+compressed with zstd when the zstandard package is installed, zlib otherwise.
+Any snapshot can be read back by index or by time.
+
+Usage:
+    python3 -m src.snapshot_archive poll --interval 300      # append a snapshot every 5 minutes
+    python3 -m src.snapshot_archive list
+    python3 -m src.snapshot_archive show 42 --output rosters_42.json
+"""
+
+import argparse
+import os
+import struct
+import time
+import zlib
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, Iterator, List
+
+try:
+    import zstandard  # Optional: better ratio and speed than zlib
+except ImportError:
+    zstandard = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are not serialized across processes
+    fcntl = None
+
+# Handle both relative and absolute imports
+try:
+    from . import serialization
+except ImportError:
+    import serialization
+
+MAGIC = b'PKSNAP1\n'
+KEYFRAME = 0
+DELTA = 1
+CODEC_ZLIB = 0
+CODEC_ZSTD = 1
+_HEADER = struct.Struct('<BBdI')  # kind, codec, timestamp, payload length
+
+
+def default_archive_path(data_directory: str, league_id: str) -> str:
+    """Where a league's rosters snapshots are kept (data/snapshots/rosters_<league>.pksnap)"""
+    return os.path.join(data_directory, 'snapshots', f"rosters_{league_id}.pksnap")
+
+
+def make_patch(old: Any, new: Any, path: list = None) -> List[list]:
+    """
+    Operations turning old into new
+
+    Dicts are compared key by key and equal-length lists item by item;
+    anything else that differs is replaced. Operations are ["s", path, value]
+    (set) and ["d", path] (delete).
+    """
+    path = path or []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key, value in new.items():
+            if key not in old:
+                ops.append(['s', path + [key], value])
+            elif old[key] != value:
+                ops.extend(make_patch(old[key], value, path + [key]))
+        ops.extend(['d', path + [key]] for key in old if key not in new)
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            if old_item != new_item:
+                ops.extend(make_patch(old_item, new_item, path + [index]))
+        return ops
+    return [] if old == new else [['s', path, new]]
+
+
+def apply_patch(document: Any, ops: List[list]) -> Any:
+    """Apply make_patch operations (document is modified in place when possible)"""
+    for op in ops:
+        path = op[1]
+        if not path:
+            document = op[2]
+            continue
+        parent = document
+        for key in path[:-1]:
+            parent = parent[key]
+        if op[0] == 's':
+            parent[path[-1]] = op[2]
+        else:
+            del parent[path[-1]]
+    return document
+
+
+class SnapshotArchive:
+    """Append-only file of delta-encoded, compressed JSON snapshots"""
+
+    def __init__(self, path: str, keyframe_interval: int = 50, compression_level: int = None):
+        """
+        Open (or create) an archive
+
+        Args:
+            path: Archive file path
+            keyframe_interval: Store a full snapshot every N entries to bound read cost
+            compression_level: Codec level (default 10 for zstd, 9 for zlib)
+        """
+        self.path = path
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.codec = CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+        self.compression_level = compression_level or (10 if self.codec == CODEC_ZSTD else 9)
+
+        self._offsets = []      # file offset of each entry's header
+        self._kinds = []
+        self._timestamps = []
+        self._end = 0           # end of the last complete entry (0 until the header is written)
+        self._cached_index = None
+        self._cached_document = None
+
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                self._scan(f)
+
+    def _scan(self, f):
+        """Index the complete entries after the last one already known"""
+        if not self._end:
+            magic = f.read(len(MAGIC))
+            if magic != MAGIC:
+                if MAGIC.startswith(magic):
+                    return  # crashed while creating the file; append rewrites the header
+                raise ValueError(f"{self.path} is not a snapshot archive")
+            self._end = len(MAGIC)
+        f.seek(self._end)
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                break
+            kind, _, timestamp, length = _HEADER.unpack(header)
+            if len(f.read(length)) < length:
+                break  # torn write at the end; ignore the partial entry
+            self._offsets.append(self._end)
+            self._kinds.append(kind)
+            self._timestamps.append(timestamp)
+            self._end = f.tell()
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == CODEC_ZSTD:
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+        return zlib.compress(data, self.compression_level)
+
+    @staticmethod
+    def _decompress(codec: int, data: bytes) -> bytes:
+        if codec == CODEC_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("This archive uses zstd; install the zstandard package to read it")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def _read_entry(self, index: int) -> Any:
+        with open(self.path, 'rb') as f:
+            f.seek(self._offsets[index])
+            _, codec, _, length = _HEADER.unpack(f.read(_HEADER.size))
+            return serialization.loads(self._decompress(codec, f.read(length)))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def timestamps(self) -> List[float]:
+        """Capture time (epoch seconds) of every snapshot"""
+        return list(self._timestamps)
+
+    def get(self, index: int) -> Any:
+        """Reconstruct the snapshot at an index (negative indexes count from the end)"""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Snapshot {index} out of range (archive has {len(self)})")
+
+        # Continue from the last reconstructed snapshot when reading forwards
+        if self._cached_index is not None and self._cached_index <= index:
+            start = self._cached_index + 1
+            document = self._cached_document
+        else:
+            start = index
+            while self._kinds[start] != KEYFRAME:
+                start -= 1
+            document = self._read_entry(start)
+            start += 1
+
+        for position in range(start, index + 1):
+            if self._kinds[position] == KEYFRAME:
+                document = self._read_entry(position)
+            else:
+                document = apply_patch(document, self._read_entry(position))
+
+        self._cached_index = index
+        self._cached_document = document
+        return serialization.loads(serialization.dumps(document))  # callers get their own copy
+
+    __getitem__ = get
+
+    def at(self, timestamp: float) -> Any:
+        """Snapshot that was current at a point in time"""
+        index = bisect_right(self._timestamps, timestamp) - 1
+        if index < 0:
+            raise IndexError("No snapshot at or before that time")
+        return self.get(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self.get(index)
+
+    def append(self, document: Any, timestamp: float = None) -> int:
+        """
+        Add a snapshot
+
+        Args:
+            document: Payload to store
+            timestamp: Capture time in epoch seconds (default: now)
+
+        Returns:
+            Index of the new snapshot
+
+        Raises:
+            ValueError: If the timestamp is older than the last snapshot's
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, 'a+b') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                # Pick up snapshots other processes appended since we last looked
+                f.seek(0)
+                self._scan(f)
+                return self._append_locked(f, document, timestamp)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def _append_locked(self, f, document: Any, timestamp: float = None) -> int:
+        last = self._timestamps[-1] if self._timestamps else None
+        if timestamp is None:
+            timestamp = time.time() if last is None else max(time.time(), last)
+        elif last is not None and timestamp < last:
+            raise ValueError(f"Snapshot timestamp {timestamp} is older than the last one ({last})")
+
+        index = len(self)
+        if index % self.keyframe_interval == 0:
+            previous = None
+        elif self._cached_index == index - 1:
+            previous = self._cached_document  # only read here, so no copy needed
+        else:
+            previous = self.get(index - 1)
+        if previous is None:
+            kind, payload = KEYFRAME, document
+        else:
+            kind, payload = DELTA, make_patch(previous, document)
+
+        data = self._compress(serialization.dumps(payload))
+        # Drop a torn final write (or a half-written header) so the entry lands where the scan stopped
+        if f.seek(0, os.SEEK_END) > self._end:
+            f.truncate(self._end)
+        if not self._end:
+            f.write(MAGIC)
+            self._end = len(MAGIC)
+        offset = self._end
+        f.write(_HEADER.pack(kind, self.codec, timestamp, len(data)))
+        f.write(data)
+        f.flush()
+
+        self._end = offset + _HEADER.size + len(data)
+        self._offsets.append(offset)
+        self._kinds.append(kind)
+        self._timestamps.append(timestamp)
+        self._cached_index = index
+        self._cached_document = serialization.loads(serialization.dumps(document))
+        return index
+
+
+def main():
+    """Poll, list or extract rosters snapshots from the command line"""
+    # Handle both relative and absolute imports
+    try:
+        from .secure_config import config
+        from .sleeper_client import SleeperClient
+    except ImportError:
+        from secure_config import config
+        from sleeper_client import SleeperClient
+
+    parser = argparse.ArgumentParser(description="Delta-compressed archive of rosters snapshots")
+    parser.add_argument('command', choices=['poll', 'list', 'show'])
+    parser.add_argument('index', nargs='?', type=int, help='Snapshot index for show')
+    parser.add_argument('--archive', type=str, default=None, help='Archive path (default: <data>/snapshots/rosters_<league>.pksnap)')
+    parser.add_argument('--interval', type=float, default=0, help='Seconds between polls (0 = poll once)')
+    parser.add_argument('--output', type=str, default=None, help='Write the shown snapshot to this file')
+    args = parser.parse_args()
+
+    archive_path = args.archive or default_archive_path(config.data_directory, config.sleeper_league_id)
+    archive = SnapshotArchive(archive_path)
+
+    if args.command == 'poll':
+        client = SleeperClient()
+        while True:
+            response = client.get(f"/league/{config.sleeper_league_id}/rosters")
+            if response.status_code == 200:
+                index = archive.append(response.json())
+                print(f"📸 Snapshot {index} saved ({os.path.getsize(archive_path) / 1024:.1f} KiB archive)")
+            else:
+                print(f"❌ Failed to get rosters: {response.status_code}")
+            if not args.interval:
+                break
+            time.sleep(args.interval)
+
+    elif args.command == 'list':
+        size = os.path.getsize(archive_path) if os.path.exists(archive_path) else 0
+        print(f"📚 {archive_path}: {len(archive)} snapshots, {size / 1024:.1f} KiB")
+        for index, timestamp in enumerate(archive.timestamps()):
+            print(f"  {index:5d}  {datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S')}")
+
+    elif args.command == 'show':
+        if args.index is None:
+            parser.error("show needs a snapshot index")
+        snapshot = archive.get(args.index)
+        if args.output:
+            serialization.dump(snapshot, args.output, pretty=True)
+            print(f"💾 Snapshot {args.index} written to {args.output}")
+        else:
+            print(serialization.dumps(snapshot, pretty=True).decode('utf-8'))
+
+
+if __name__ == "__main__":
+    main()
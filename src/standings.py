@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Season Standings for the skins game
+===================================
+
+A materialized per-season table of each user's totals (score, tier finishes,
+perfect weeks) and weekly cells, kept next to the results file as
+<results>_standings.json. process_week folds each new week into it, so season
+summaries read O(users) rows instead of rescanning the whole history.
+
+The table records the size and modification time of the results file it was
+built from; if the results file changes any other way (save, upgrade, manual
+edit) the next read rebuilds it from history.
+
+Usage:
+    python3 -m src.standings rebuild [data/skins_game_results.json]
+"""
+
+import os
+import sys
+from typing import Dict, List, Optional
+
+# Handle both relative and absolute imports
+try:
+    from . import serialization
+    from .results_store import ResultsStore, RANKING_TIERS, upgrade_record
+except ImportError:
+    import serialization
+    from results_store import ResultsStore, RANKING_TIERS, upgrade_record
+
+STANDINGS_VERSION = 1
+
+# Weekly rank label for each tier, in the precedence used when a user shows up twice
+RANK_LABELS = {
+    'highest': '1st',
+    'second_highest': '2nd',
+    'third_highest': '3rd',
+    'lowest': 'Last',
+    'no_picks': 'No Picks',
+}
+
+# Per-user counter incremented for each tier finish
+TIER_COUNTERS = {
+    'highest': 'wins',
+    'second_highest': 'second_place',
+    'third_highest': 'third_place',
+    'lowest': 'lowest',
+    'no_picks': 'no_picks',
+}
+
+
+def standings_path(results_file: str) -> str:
+    """Standings file kept next to a results file"""
+    return f"{os.path.splitext(results_file)[0]}_standings.json"
+
+
+def _new_user(name: str) -> dict:
+    user = {'name': name, 'total_score': 0, 'perfect_weeks': 0, 'weeks': {}}
+    user.update({counter: 0 for counter in TIER_COUNTERS.values()})
+    return user
+
+
+def _remove_week(table: dict, week_key: str):
+    """Undo a week's contribution (when a week is processed again)"""
+    for user in table['users'].values():
+        cell = user['weeks'].pop(week_key, None)
+        if cell is None:
+            continue
+        score, rank, perfect = cell
+        if score is not None:
+            user['total_score'] -= score
+        for tier, label in RANK_LABELS.items():
+            if label == rank:
+                user[TIER_COUNTERS[tier]] -= 1
+        user['perfect_weeks'] -= perfect
+
+
+def apply_week(table: dict, record: dict):
+    """
+    Fold one week record into a season table
+
+    Args:
+        table: Season table ({'weeks': [...], 'users': {owner_id: {...}}})
+        record: Week record as returned by process_week (or ResultsStore.load)
+    """
+    record = upgrade_record(record)
+    week_key = str(record['week'])
+    if record['week'] in table['weeks']:
+        _remove_week(table, week_key)
+    else:
+        table['weeks'].append(record['week'])
+        table['weeks'].sort()
+
+    names = record.get('winner_names', {})
+    users = table['users']
+    cells = {}
+    for tier in RANKING_TIERS:
+        tier_names = names.get(tier, [])
+        score = 0 if tier == 'no_picks' else record['scores'].get(tier, 0)
+        for position, owner_id in enumerate(record['rankings'].get(tier, [])):
+            if owner_id in cells:
+                continue
+            name = tier_names[position] if position < len(tier_names) else 'Unknown'
+            user = users.setdefault(owner_id, _new_user(name))
+            if name != 'Unknown':
+                user['name'] = name
+            user['total_score'] += score
+            user[TIER_COUNTERS[tier]] += 1
+            cells[owner_id] = [score, RANK_LABELS[tier], 0]
+
+    perfect_names = names.get('perfect_week', [])
+    for position, owner_id in enumerate(record.get('perfect_week_winners', [])):
+        name = perfect_names[position] if position < len(perfect_names) else 'Unknown'
+        user = users.setdefault(owner_id, _new_user(name))
+        user['perfect_weeks'] += 1
+        cells.setdefault(owner_id, [None, '', 0])[2] = 1
+
+    for owner_id, cell in cells.items():
+        users[owner_id]['weeks'][week_key] = cell
+
+
+def build_seasons(records: List[dict]) -> Dict[str, dict]:
+    """Season -> standings table folded from week records (a reprocessed week's last record wins)"""
+    seasons = {}
+    for record in records:
+        record = upgrade_record(record)
+        table = seasons.setdefault(str(record['season']), {'weeks': [], 'users': {}})
+        apply_week(table, record)
+    return seasons
+
+
+class SeasonStandings:
+    """Materialized standings per (league, season) for one results file"""
+
+    def __init__(self, results_file: str, league_id: str = None):
+        """
+        Initialize the standings
+
+        Args:
+            results_file: Results file the standings are derived from
+            league_id: League the results belong to (None to accept whatever the table was built for)
+        """
+        self.results_file = results_file
+        self.league_id = league_id
+        self.path = standings_path(results_file)
+
+    def _results_stamp(self) -> Optional[List[int]]:
+        try:
+            stat = os.stat(self.results_file)
+        except FileNotFoundError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _read_document(self) -> Optional[dict]:
+        try:
+            document = serialization.load(self.path)
+        except (FileNotFoundError, ValueError):
+            return None
+        if document.get('schema_version') != STANDINGS_VERSION:
+            return None
+        return document
+
+    def _write_document(self, document: dict):
+        document['results_stamp'] = self._results_stamp()
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        serialization.dump(document, tmp_path)
+        os.replace(tmp_path, self.path)
+
+    def is_current(self) -> bool:
+        """Whether the stored table matches the results file as it is now"""
+        document = self._read_document()
+        return (document is not None
+                and document.get('results_stamp') == self._results_stamp()
+                and (self.league_id is None or document.get('league_id') == self.league_id))
+
+    def rebuild(self, records: List[dict] = None) -> dict:
+        """
+        Recompute every season table from the full results history
+
+        Returns:
+            The standings document
+        """
+        if records is None:
+            try:
+                records = ResultsStore(self.results_file).load()
+            except FileNotFoundError:
+                records = []
+        document = {'schema_version': STANDINGS_VERSION, 'league_id': self.league_id,
+                    'seasons': build_seasons(records)}
+        self._write_document(document)
+        return document
+
+    def load(self) -> dict:
+        """Standings document, rebuilt first if it is missing or stale"""
+        document = self._read_document()
+        if (document is None or document.get('results_stamp') != self._results_stamp()
+                or (self.league_id is not None and document.get('league_id') != self.league_id)):
+            document = self.rebuild()
+        return document
+
+    def seasons(self) -> Dict[str, dict]:
+        """Season -> standings table"""
+        return self.load()['seasons']
+
+    def season(self, season) -> dict:
+        """Standings table for one season (empty if nothing was processed)"""
+        return self.seasons().get(str(season), {'weeks': [], 'users': {}})
+
+    def record_week(self, record: dict):
+        """Append a week to the results file and fold it into the standings"""
+        was_current = self.is_current()
+        ResultsStore(self.results_file).append(record)
+        if not was_current:
+            self.rebuild()
+            return
+
+        record = upgrade_record(record)
+        document = self._read_document()
+        table = document['seasons'].setdefault(str(record['season']), {'weeks': [], 'users': {}})
+        apply_week(table, record)
+        self._write_document(document)
+
+
+def main():
+    """Rebuild the standings from the command line"""
+    if len(sys.argv) < 2 or sys.argv[1] != 'rebuild':
+        print("Usage: python3 -m src.standings rebuild [results_file]")
+        return
+
+    results_file = sys.argv[2] if len(sys.argv) > 2 else "data/skins_game_results.json"
+    league_id = os.getenv('SLEEPER_LEAGUE_ID')
+    document = SeasonStandings(results_file, league_id).rebuild()
+    for season, table in sorted(document['seasons'].items()):
+        print(f"🏈 Season {season}: {len(table['weeks'])} weeks, {len(table['users'])} users")
+    print(f"💾 Standings written to {standings_path(results_file)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Synthetic League Generator
+==========================
+
+Produces realistic Sleeper pick'em payloads for scale testing: 16-game
+slates, skill-driven picks, tied scores, no-pick users, perfect weeks and
+multiple seasons. Scales from a handful of users to 100k+ per league and
+from one league to hundreds, and writes results-history files of any size.
+
+Usage:
+    python3 -m src.synthetic_league --users 10000 --leagues 3 --output-dir outputs/synthetic
+    python3 -m src.synthetic_league --users 500 --seasons 2022 2023 2024 2025 --results-only
+"""
+
+import argparse
+import os
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+# Handle both relative and absolute imports
+try:
+    from .compact_records import NFL_TEAMS
+    from .results_store import encode_results
+    from . import serialization
+except ImportError:
+    from compact_records import NFL_TEAMS
+    from results_store import encode_results
+    import serialization
+
+RANKING_TIERS = ['highest', 'second_highest', 'third_highest', 'lowest', 'no_picks']
+
+
+class SyntheticLeagueGenerator:
+    """Generates Sleeper-shaped league payloads and results history"""
+
+    def __init__(self, seed: int = None, weeks: int = 17, games_per_week: int = 16,
+                 no_pick_rate: float = 0.04, partial_pick_rate: float = 0.03,
+                 perfect_week_rate: float = 0.002, skill_mean: float = 0.6, skill_std: float = 0.07):
+        """
+        Initialize the generator
+
+        Args:
+            seed: Seed for reproducible output (optional)
+            weeks: Regular-season weeks per season
+            games_per_week: Games on each weekly slate (at most 16)
+            no_pick_rate: Chance a user submits no picks in a week
+            partial_pick_rate: Chance a user skips a few games in a week
+            perfect_week_rate: Chance a user picks every game correctly in a week
+            skill_mean: Average probability of picking a game's winner
+            skill_std: Spread of that probability across users
+        """
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy % (2 ** 32))
+        self.weeks = weeks
+        self.games_per_week = min(games_per_week, len(NFL_TEAMS) // 2)
+        self.no_pick_rate = no_pick_rate
+        self.partial_pick_rate = partial_pick_rate
+        self.perfect_week_rate = perfect_week_rate
+        self.skill_mean = skill_mean
+        self.skill_std = skill_std
+        self._schedules = {}
+
+    def _rng(self, *keys) -> np.random.Generator:
+        """Independent stream per (season, league, ...) so output doesn't depend on call order"""
+        return np.random.default_rng([self.seed] + [key if isinstance(key, int) else zlib.crc32(str(key).encode())
+                                                   for key in keys])
+
+    def season_schedule(self, season: int) -> Dict[int, dict]:
+        """
+        Get the weekly slates for a season
+
+        Returns:
+            {week: {'teams': ndarray (games, 2) of [away, home],
+                    'winner_side': ndarray (games,) of 0=away/1=home,
+                    'underdog_side': ndarray (games,) of 0=away/1=home}}
+        """
+        if season not in self._schedules:
+            rng = self._rng(season)
+            schedule = {}
+            teams = np.array(NFL_TEAMS, dtype=object)
+            for week in range(1, self.weeks + 1):
+                order = rng.permutation(len(NFL_TEAMS))[:self.games_per_week * 2]
+                matchups = teams[order].reshape(self.games_per_week, 2)
+                underdog_side = rng.integers(0, 2, self.games_per_week)
+                # Underdogs win roughly a third of the time
+                upset = rng.random(self.games_per_week) < 0.33
+                winner_side = np.where(upset, underdog_side, 1 - underdog_side)
+                schedule[week] = {'teams': matchups, 'winner_side': winner_side, 'underdog_side': underdog_side}
+            self._schedules[season] = schedule
+        return self._schedules[season]
+
+    def odds_data(self, season: int, week: int) -> Dict[str, dict]:
+        """Game results in the week_X_game_results.json / odds format"""
+        slate = self.season_schedule(season)[week]
+        odds = {}
+        for (away, home), winner, underdog in zip(slate['teams'], slate['winner_side'], slate['underdog_side']):
+            odds[away] = {'opponent': home, 'is_underdog': bool(underdog == 0), 'won': bool(winner == 0)}
+            odds[home] = {'opponent': away, 'is_underdog': bool(underdog == 1), 'won': bool(winner == 1)}
+        return odds
+
+    def games_payload(self, season: int, week: int) -> dict:
+        """Games for a week in the /games/nfl/{season}/{week} format"""
+        slate = self.season_schedule(season)[week]
+        return {
+            f"{season}{week:02d}{g:02d}": {'away': away, 'home': home, 'status': 'complete'}
+            for g, (away, home) in enumerate(slate['teams'])
+        }
+
+    def user_ids(self, league_key: str, num_users: int) -> List[str]:
+        """Stable owner ids for a league's members"""
+        return [f"{league_key}{i:06d}" for i in range(num_users)]
+
+    def users_payload(self, league_id: str, user_ids: List[str]) -> List[dict]:
+        """Users in the /league/{id}/users format"""
+        return [
+            {'user_id': user_id, 'username': f"player{i}", 'display_name': f"Player {i}",
+             'avatar': None, 'league_id': league_id}
+            for i, user_id in enumerate(user_ids)
+        ]
+
+    def simulate_week(self, season: int, week: int, skills: np.ndarray, league_key: str = '') -> dict:
+        """
+        Simulate one week of picks for every user at once
+
+        Args:
+            season: Season year
+            week: Week number
+            skills: Probability of picking each game's winner, one per user
+            league_key: Separates random streams between leagues
+
+        Returns:
+            {'side': (users, games) picked side, 'picked': (users, games) bool,
+             'scores': (users,) correct picks}
+        """
+        slate = self.season_schedule(season)[week]
+        rng = self._rng(season, week, league_key)
+        num_users = len(skills)
+        games = self.games_per_week
+
+        correct = rng.random((num_users, games)) < skills[:, None]
+        correct[rng.random(num_users) < self.perfect_week_rate] = True
+        side = np.where(correct, slate['winner_side'][None, :], 1 - slate['winner_side'][None, :])
+
+        picked = np.ones((num_users, games), dtype=bool)
+        partial = rng.random(num_users) < self.partial_pick_rate
+        if partial.any():
+            picked[partial] = rng.random((int(partial.sum()), games)) > 0.2
+        picked[rng.random(num_users) < self.no_pick_rate] = False
+
+        scores = (correct & picked).sum(axis=1)
+        return {'side': side, 'picked': picked, 'scores': scores}
+
+    def player_skills(self, league_key: str, num_users: int) -> np.ndarray:
+        """Per-user pick accuracy, stable across seasons for the same league"""
+        rng = self._rng('skill', league_key)
+        return np.clip(rng.normal(self.skill_mean, self.skill_std, num_users), 0.3, 0.95)
+
+    def generate_league(self, league_id: str, num_users: int, season: int = 2025,
+                        weeks_played: int = None, league_key: str = None) -> dict:
+        """
+        Generate every payload for one league
+
+        Args:
+            league_id: Sleeper league ID to use
+            num_users: Number of league members
+            season: Season year
+            weeks_played: Completed weeks (defaults to the full season)
+            league_key: Identity shared by the same league across seasons (defaults to league_id)
+
+        Returns:
+            {'league_info': dict, 'users': list, 'rosters': list, 'games': {week: dict},
+             'odds': {week: dict}}
+        """
+        league_key = league_key or league_id
+        weeks_played = self.weeks if weeks_played is None else min(weeks_played, self.weeks)
+        user_ids = self.user_ids(league_key, num_users)
+        skills = self.player_skills(league_key, num_users)
+        schedule = self.season_schedule(season)
+
+        points_by_leg = [{} for _ in range(num_users)]
+        previous_picks = [{} for _ in range(num_users)]
+        for week in range(1, weeks_played + 1):
+            week_key = f"v1:regular:{week}"
+            sim = self.simulate_week(season, week, skills, league_key)
+            picked_teams = schedule[week]['teams'][np.arange(self.games_per_week)[None, :], sim['side']]
+            for i in range(num_users):
+                row_picked = sim['picked'][i]
+                if not row_picked.any():
+                    points_by_leg[i][week_key] = 0
+                    continue
+                previous_picks[i][week_key] = picked_teams[i][row_picked].tolist()
+                points_by_leg[i][week_key] = int(sim['scores'][i])
+
+        rosters = [
+            {
+                'roster_id': i + 1,
+                'owner_id': user_id,
+                'league_id': league_id,
+                'players': [],
+                'starters': [],
+                'settings': {'wins': 0, 'losses': 0, 'ties': 0},
+                'metadata': {'points_by_leg': points_by_leg[i], 'previous_picks': previous_picks[i]},
+            }
+            for i, user_id in enumerate(user_ids)
+        ]
+
+        current_week = min(weeks_played + 1, self.weeks)
+        league_info = {
+            'league_id': league_id,
+            'name': f"Synthetic League {league_key}",
+            'season': str(season),
+            'status': 'in_season' if weeks_played < self.weeks else 'complete',
+            'total_rosters': num_users,
+            'metadata': {
+                'current_pickem_leg_id': f"v1:regular:{current_week}",
+                'latest_report_leg_id': f"v1:regular:{max(weeks_played, 1)}",
+            },
+        }
+
+        return {
+            'league_info': league_info,
+            'users': self.users_payload(league_id, user_ids),
+            'rosters': rosters,
+            'games': {week: self.games_payload(season, week) for week in range(1, weeks_played + 1)},
+            'odds': {week: self.odds_data(season, week) for week in range(1, weeks_played + 1)},
+        }
+
+    def iter_leagues(self, num_leagues: int, num_users: int, seasons: List[int],
+                     first_league_id: int = 1000000000000000000) -> Iterator[dict]:
+        """Yield one league per (league, season) without holding them all in memory"""
+        for league_index in range(num_leagues):
+            league_key = str(first_league_id + league_index * 1000)
+            for season_index, season in enumerate(seasons):
+                league_id = str(int(league_key) + season_index)
+                yield self.generate_league(league_id, num_users, season, league_key=league_key)
+
+    def iter_results_history(self, num_users: int, seasons: List[int], league_key: str = '1000000000000000000',
+                             weeks_played: int = None, with_perfect_weeks: bool = True) -> Iterator[dict]:
+        """
+        Yield result records in the skins_game_results.json format (as process_week stores them)
+
+        Args:
+            num_users: League size
+            seasons: Seasons to cover, in order
+            league_key: League identity the users belong to
+            weeks_played: Weeks per season (defaults to the full season)
+            with_perfect_weeks: Fill perfect_week_winners as if game results were supplied
+        """
+        weeks_played = self.weeks if weeks_played is None else min(weeks_played, self.weeks)
+        user_ids = np.array(self.user_ids(league_key, num_users), dtype=object)
+        names = np.array([f"Player {i}" for i in range(num_users)], dtype=object)
+        skills = self.player_skills(league_key, num_users)
+        processed_at = datetime(2020, 9, 15)
+
+        for season in seasons:
+            for week in range(1, weeks_played + 1):
+                sim = self.simulate_week(season, week, skills, league_key)
+                scores = sim['scores']
+                made_picks = sim['picked'].any(axis=1)
+                no_picks = ~made_picks & (scores == 0)
+
+                tiers = {'no_picks': np.flatnonzero(no_picks)}
+                ranked_scores = np.unique(scores[~no_picks])[::-1]
+                tier_scores = {'no_picks': 0}
+                for tier, position in (('highest', 0), ('second_highest', 1), ('third_highest', 2), ('lowest', -1)):
+                    if len(ranked_scores) > max(position, 0):
+                        value = ranked_scores[position]
+                        tiers[tier] = np.flatnonzero(~no_picks & (scores == value))
+                        tier_scores[tier] = float(value)
+                    else:
+                        tiers[tier] = np.array([], dtype=int)
+                        tier_scores[tier] = 0
+
+                perfect = np.array([], dtype=int)
+                if with_perfect_weeks:
+                    perfect = np.flatnonzero(sim['picked'].all(axis=1) & (scores == self.games_per_week))
+
+                yield {
+                    'week': week,
+                    'season': season,
+                    'date_processed': (processed_at + timedelta(days=7 * week + 365 * (season - 2020))).isoformat(),
+                    'rankings': {tier: user_ids[tiers[tier]].tolist() for tier in RANKING_TIERS},
+                    'scores': tier_scores,
+                    'perfect_week_winners': user_ids[perfect].tolist(),
+                    'winner_names': dict(
+                        {tier: names[tiers[tier]].tolist() for tier in RANKING_TIERS},
+                        perfect_week=names[perfect].tolist()
+                    ),
+                }
+
+    def write_results_history(self, path: str, num_users: int, seasons: List[int],
+                              schema_version: int = 2, **kwargs) -> int:
+        """
+        Write a results-history file
+
+        Args:
+            schema_version: 2 for the compact results schema, 1 to stream the legacy
+                list of week records one record at a time
+
+        Returns:
+            Number of week records written
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        if schema_version == 2:
+            document = encode_results(self.iter_results_history(num_users, seasons, **kwargs))
+            serialization.dump(document, path)
+            return sum(len(season['weeks']) for season in document['seasons'].values())
+
+        count = 0
+        with open(path, 'wb') as f:
+            f.write(b'[')
+            for record in self.iter_results_history(num_users, seasons, **kwargs):
+                f.write(b',\n' if count else b'\n')
+                f.write(serialization.dumps(record))
+                count += 1
+            f.write(b'\n]\n')
+        return count
+
+    @staticmethod
+    def write_fixture(league: dict, directory: str):
+        """Write a league in the same file layout SleeperAPIExplorer saves"""
+        os.makedirs(directory, exist_ok=True)
+        season = league['league_info']['season']
+
+        def dump(data, name):
+            serialization.dump(data, os.path.join(directory, name))
+
+        dump(league['league_info'], 'league_info.json')
+        dump(league['users'], 'users.json')
+        dump(league['rosters'], 'rosters.json')
+        for week, games in league['games'].items():
+            dump(games, f"nfl_games_week_{week}.json")
+        for week, odds in league['odds'].items():
+            dump(odds, f"week_{week}_game_results.json")
+        print(f"💾 League {league['league_info']['league_id']} ({season}) written to {directory}")
+
+
+def main():
+    """Generate synthetic leagues and results history from the command line"""
+    parser = argparse.ArgumentParser(description="Synthetic Sleeper league generator for scale testing")
+    parser.add_argument('--users', type=int, default=12, help='Users per league (10 to 100k+)')
+    parser.add_argument('--leagues', type=int, default=1, help='Number of leagues (1 to 1000)')
+    parser.add_argument('--seasons', type=int, nargs='+', default=[2025], help='Seasons to generate')
+    parser.add_argument('--weeks', type=int, default=17, help='Weeks per season')
+    parser.add_argument('--weeks-played', type=int, default=None, help='Completed weeks (default: all)')
+    parser.add_argument('--seed', type=int, default=None, help='Seed for reproducible output')
+    parser.add_argument('--output-dir', type=str, default='outputs/synthetic')
+    parser.add_argument('--results-only', action='store_true', help='Only write the results-history file')
+    args = parser.parse_args()
+
+    generator = SyntheticLeagueGenerator(seed=args.seed, weeks=args.weeks)
+    print(f"🧪 Generating {args.leagues} league(s) × {len(args.seasons)} season(s) × {args.users} users "
+          f"(seed {generator.seed})")
+
+    if not args.results_only:
+        for league in generator.iter_leagues(args.leagues, args.users, args.seasons):
+            league_id = league['league_info']['league_id']
+            generator.write_fixture(league, os.path.join(args.output_dir, f"league_{league_id}"))
+
+    results_path = os.path.join(args.output_dir, 'skins_game_results.json')
+    count = generator.write_results_history(results_path, args.users, args.seasons, weeks_played=args.weeks_played)
+    print(f"📊 {count} week records written to {results_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -16,14 +16,18 @@ Usage:
 from .skins_game_mvp import SleeperSkinsGameMVP
 from .export_results import SkinsGameExporter
 from .sms_notifications import SMSNotifier
+from .perf_metrics import metrics
 
 # Handle both relative and absolute imports
 try:
     from .secure_config import config
+    from .results_store import ResultsStore
+    from . import serialization
 except ImportError:
     from secure_config import config
+    from results_store import ResultsStore
+    import serialization
 
-import json
 import os
 from datetime import datetime
 
@@ -32,6 +36,7 @@ def main():
     print("=" * 50)
     
     # Initialize with secure configuration
+    metrics.reset()
     skins_game = SleeperSkinsGameMVP()
     
     try:
@@ -42,7 +47,8 @@ def main():
             print(f"📅 Processing Week: {target_week} (specified)")
         else:
             # Get current week and process previous week
-            current_week = skins_game.get_current_week()
+            with metrics.span('api_fetch', endpoint='league'):
+                current_week = skins_game.get_current_week(revalidate=True)
             target_week = current_week - 1
             print(f"📅 Current Week: {current_week}")
             print(f"📅 Processing Previous Week: {target_week} (auto-detected)")
@@ -53,8 +59,7 @@ def main():
         
         if os.path.exists(game_results_filename):
             print(f"📊 Loading game results from {game_results_filename}...")
-            with open(game_results_filename, 'r') as f:
-                game_results_data = json.load(f)
+            game_results_data = serialization.load(game_results_filename)
             print(f"✅ Game results loaded for perfect week detection")
         else:
             print(f"📝 No game results file found ({game_results_filename})")
@@ -67,7 +72,8 @@ def main():
         # Check if there's pickem data available
         try:
             # Try to get a summary to check if data exists
-            summary = skins_game.get_week_summary(target_week)
+            with metrics.span('api_fetch', endpoint='users_rosters'):
+                summary = skins_game.get_week_summary(target_week)
             if summary['high_score'] == 0 and not any(user['score'] > 0 for user in summary['user_data']):
                 print(f"⚠️  No pickem data available for Week {target_week}")
                 print(f"   This is normal early in the season before games are played")
@@ -79,36 +85,27 @@ def main():
             print(f"   The system is ready to process once games are completed")
             return
         
-        result = skins_game.process_week(target_week, game_results_data)
+        with metrics.span('process_week', week=target_week):
+            result = skins_game.process_week(target_week, game_results_data)
         
         # Show just the current week's results
         print(f"\n📈 CURRENT WEEK RESULTS:")
         
-        # Handle new format
-        if 'rankings' in result:
-            print(f"🥇 Highest Scorer(s): {', '.join(result['winner_names']['highest'])} - {result['scores']['highest']} points")
-            if result['rankings']['second_highest']:
-                print(f"🥈 Second Highest: {', '.join(result['winner_names']['second_highest'])} - {result['scores']['second_highest']} points")
-            if result['rankings']['third_highest']:
-                print(f"🥉 Third Highest: {', '.join(result['winner_names']['third_highest'])} - {result['scores']['third_highest']} points")
-            print(f"📉 Lowest Scorer(s): {', '.join(result['winner_names']['lowest'])} - {result['scores']['lowest']} points")
-            
-            if result['rankings'].get('no_picks'):
-                print(f"❌ No Picks Submitted: {', '.join(result['winner_names']['no_picks'])}")
-            
-            # Always show perfect week line, even if empty
-            if result['perfect_week_winners']:
-                print(f"🎯 Perfect Week: {', '.join(result['winner_names']['perfect_week'])}")
-            else:
-                print(f"🎯 Perfect Week: ")
+        print(f"🥇 Highest Scorer(s): {', '.join(result['winner_names']['highest'])} - {result['scores']['highest']} points")
+        if result['rankings']['second_highest']:
+            print(f"🥈 Second Highest: {', '.join(result['winner_names']['second_highest'])} - {result['scores']['second_highest']} points")
+        if result['rankings']['third_highest']:
+            print(f"🥉 Third Highest: {', '.join(result['winner_names']['third_highest'])} - {result['scores']['third_highest']} points")
+        print(f"📉 Lowest Scorer(s): {', '.join(result['winner_names']['lowest'])} - {result['scores']['lowest']} points")
+        
+        if result['rankings'].get('no_picks'):
+            print(f"❌ No Picks Submitted: {', '.join(result['winner_names']['no_picks'])}")
         
-        # Handle old format for backward compatibility
+        # Always show perfect week line, even if empty
+        if result['perfect_week_winners']:
+            print(f"🎯 Perfect Week: {', '.join(result['winner_names']['perfect_week'])}")
         else:
-            print(f"📊 High Score Winner(s): {', '.join(result['winner_names']['high_score'])} - {result['high_score']} points")
-            if 'underdog_percentage' in result:
-                print(f"🐕 Underdog Winner(s): {', '.join(result['winner_names']['underdog'])} - {result['underdog_percentage']:.1f}% correct")
-            else:
-                print(f"🐕 Underdog Winner(s): {', '.join(result['winner_names']['underdog'])} - {result.get('underdog_correct', 0)}/{result['total_underdog_games']} correct")
+            print(f"🎯 Perfect Week: ")
         
         print(f"\n✅ Week {target_week} processing complete!")
         print(f"📁 Results saved to: data/skins_game_results.json")
@@ -116,7 +113,9 @@ def main():
         # Export to CSV/Excel for easy sharing
         print(f"📊 Exporting season report...")
         exporter = SkinsGameExporter()
-        if exporter.export_all():
+        with metrics.span('export'):
+            export_success = exporter.export_all()
+        if export_success:
             print(f"📈 Season report exported: skins_game_season_report.csv & .xlsx")
         else:
             print(f"⚠️  Export failed, but results are still saved")
@@ -147,12 +146,14 @@ def main():
         
         if choice == "1" and has_sms:
             season = result.get('season', config.current_season)
-            sms_notifier.send_results_notification(result, target_week, season)
+            with metrics.span('notifications', channel='sms'):
+                sms_notifier.send_results_notification(result, target_week, season)
         elif choice == "2":
             print(f"\n📱 Generating Apple Shortcuts data for Week {target_week}...")
             from .apple_shortcuts import AppleShortcutsIntegration
             shortcuts = AppleShortcutsIntegration()
-            shortcuts.save_shortcuts_data_for_week("shortcuts/shortcuts_data.json", target_week, result)
+            with metrics.span('notifications', channel='apple_shortcuts'):
+                shortcuts.save_shortcuts_data_for_week("shortcuts/shortcuts_data.json", target_week, result)
             print(f"✅ Data saved to shortcuts/shortcuts_data.json")
             print(f"📱 Transfer this file to your iPhone and run your shortcut!")
         elif choice == "1" and not has_sms:
@@ -181,8 +182,22 @@ def main():
         print(f"  python3 main.py status                     # Quick status check")
         print(f"  python3 main.py test-sms                    # Test SMS notifications")
         print(f"  python3 main.py test-sms +1234567890       # Test SMS to specific number")
+        print(f"  python3 main.py 1 --profile                # Process Week 1 and save a cProfile report")
         print(f"\n📝 Optional: Create week_X_game_results.json for perfect week detection")
         print(f"📱 SMS: Configure Twilio settings in .env file for automatic notifications")
+    finally:
+        write_metrics_report()
+
+def write_metrics_report():
+    """Save the run's stage timings (and Prometheus textfile if configured)"""
+    try:
+        metrics.print_summary()
+        report_path = metrics.write_report(config.metrics_directory)
+        print(f"⏱️  Timing report saved to: {report_path}")
+        if config.prometheus_textfile:
+            metrics.write_prometheus(config.prometheus_textfile)
+    except Exception as e:
+        print(f"⚠️  Could not write timing report: {e}")
 
 def quick_status():
     """Quick status check without processing"""
@@ -208,8 +223,7 @@ def quick_status():
         
         # Check for results
         if os.path.exists("data/skins_game_results.json"):
-            with open("data/skins_game_results.json", 'r') as f:
-                results = json.load(f)
+            results = ResultsStore("data/skins_game_results.json").load()
             print(f"📊 Stored results: {len(results)} weeks")
         else:
             print(f"📊 No stored results yet")
@@ -0,0 +1,126 @@
+"""
+Shared fixtures for the performance benchmark suite
+
+Run with:
+    python -m pytest tests/benchmarks
+    python -m pytest tests/benchmarks --benchmark-save=baseline
+
+Runs are compared against the newest committed baseline and fail when a mean
+regresses past --bench-regression (default mean:100%).
+"""
+
+import sys
+import os
+import glob
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from synthetic_league import SyntheticLeagueGenerator
+
+BASELINE_DIR = os.path.join(os.path.dirname(__file__), 'baselines')
+
+# League sizes (users) benchmarked by default; override with --bench-sizes
+LEAGUE_SIZES = {'small': 12, 'medium': 500, 'large': 5000}
+SEASONS = [2023, 2024, 2025]
+# Shared runners vary by well over 50% between identical runs, so only a doubling fails by default
+DEFAULT_REGRESSION = 'mean:100%'
+
+
+def pytest_addoption(parser):
+    parser.addoption('--bench-sizes', default='small,medium,large',
+                     help='Comma-separated league sizes to benchmark (small, medium, large)')
+    parser.addoption('--bench-regression', default=DEFAULT_REGRESSION,
+                     help='Fail when a benchmark regresses past this threshold against the committed '
+                          'baseline (pytest-benchmark EXPR, "off" disables)')
+
+
+def latest_baseline():
+    """Newest baseline JSON, preferring one recorded on this kind of machine"""
+    from pytest_benchmark.utils import get_machine_id
+
+    for machine in (get_machine_id(), '*'):
+        baselines = sorted(glob.glob(os.path.join(BASELINE_DIR, machine, '*_baseline.json')),
+                           key=os.path.basename)
+        if baselines:
+            return baselines[-1]
+    return None
+
+
+def pytest_configure(config):
+    # Keep baseline JSON next to the suite instead of ./.benchmarks
+    if getattr(config.option, 'benchmark_storage', None) == 'file://./.benchmarks':
+        config.option.benchmark_storage = f"file://{BASELINE_DIR}"
+
+    # Gate every run on the committed baseline unless one is being recorded or chosen by hand
+    threshold = config.getoption('--bench-regression')
+    if (threshold == 'off' or config.option.benchmark_compare or config.option.benchmark_save
+            or config.option.benchmark_disable):
+        return
+    baseline = latest_baseline()
+    if baseline is None:
+        return
+    from pytest_benchmark.utils import parse_compare_fail
+
+    config.option.benchmark_compare = baseline
+    if not config.option.benchmark_compare_fail:
+        config.option.benchmark_compare_fail = [parse_compare_fail(threshold)]
+
+
+def pytest_generate_tests(metafunc):
+    if 'league_size' in metafunc.fixturenames:
+        requested = metafunc.config.getoption('--bench-sizes').split(',')
+        # Chart rendering and Excel export are too slow to run at the largest size every time
+        limit = getattr(metafunc.function, 'max_league_size', None)
+        sizes = [name for name in requested if name in LEAGUE_SIZES
+                 and (limit is None or LEAGUE_SIZES[name] <= LEAGUE_SIZES[limit])]
+        metafunc.parametrize('league_size', sizes)
+
+
+def max_league_size(name: str):
+    """Cap the league sizes a benchmark is parametrized with"""
+    def decorator(func):
+        func.max_league_size = name
+        return func
+    return decorator
+
+
+@pytest.fixture(scope='session')
+def generator():
+    return SyntheticLeagueGenerator(seed=2025)
+
+
+@pytest.fixture
+def league(generator, league_size):
+    """Full-season league payloads for the requested size"""
+    return generator.generate_league('1000000000000000000', LEAGUE_SIZES[league_size], season=2025)
+
+
+@pytest.fixture
+def results_history(generator, league_size):
+    """Three seasons of stored results for the requested size"""
+    return list(generator.iter_results_history(LEAGUE_SIZES[league_size], SEASONS))
+
+
+@pytest.fixture
+def skins_game(league, tmp_path):
+    """MVP wired to the synthetic league without any HTTP traffic"""
+    from skins_game_mvp import SleeperSkinsGameMVP
+
+    game = SleeperSkinsGameMVP.from_league(league)
+    game.results_file = str(tmp_path / 'skins_game_results.json')
+    return game
+
+
+@pytest.fixture
+def dashboard(league):
+    """Analytics dashboard wired to the synthetic league without any HTTP traffic"""
+    from analytics_dashboard import SleeperAnalyticsDashboard
+
+    board = SleeperAnalyticsDashboard.from_league(league)
+    return board
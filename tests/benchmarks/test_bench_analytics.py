@@ -0,0 +1,83 @@
+"""
+Benchmarks for the analytics dashboard
+"""
+
+from conftest import max_league_size
+
+
+def test_extract_player_data(benchmark, dashboard, league):
+    """Build per-player performance records for a full season"""
+    performances = benchmark(dashboard.extract_player_data)
+    assert len(performances) == len(league['rosters'])
+
+
+@max_league_size('medium')
+def test_generate_full_dashboard(benchmark, dashboard, tmp_path):
+    """Render the summary and all four charts"""
+    output_dir = str(tmp_path / 'analytics')
+    benchmark.pedantic(dashboard.generate_full_dashboard, args=(output_dir,), rounds=1, iterations=1)
+    assert (tmp_path / 'analytics' / 'performance_summary.txt').exists()
+
+
+def test_predict_all(benchmark, dashboard, league):
+    """Fit next-week trends for every player at once"""
+    dashboard.extract_player_data()
+    predictions = benchmark(dashboard.predict_all)
+    assert len(predictions) == len(league['rosters'])
+
+
+@max_league_size('medium')
+def test_season_simulation(benchmark, dashboard):
+    """Monte Carlo 10k seasons of the remaining weeks"""
+    from season_simulator import SeasonSimulator
+
+    dashboard.extract_player_data()
+    simulator = SeasonSimulator(dashboard, season_weeks=25, seed=1)
+    simulator.build_pool()
+    odds = benchmark.pedantic(simulator.simulate, kwargs={'sims': 10000}, rounds=1, iterations=1)
+    assert odds['lowest_expected'].sum() >= 8  # at least one lowest scorer per simulated week
+
+
+def test_rolling_window(benchmark, dashboard, league):
+    """Four-week moving stats for every player and week"""
+    dashboard.extract_player_data()
+    rolling = benchmark(dashboard.rolling_window, 4)
+    assert rolling['user_id'].nunique() == len(league['rosters'])
+
+
+def test_streaks(benchmark, dashboard, league):
+    """Streaks and percentile ranks for every player and week"""
+    dashboard.extract_player_data()
+    streaks = benchmark(dashboard.streaks)
+    assert len(streaks) == len(league['rosters'])
+
+
+def test_pick_similarity(benchmark, dashboard, league):
+    """Top-5 most similar pickers for every user"""
+    from pick_analytics import PickMatrix, PickSimilarity
+
+    matrix = PickMatrix.from_rosters(dashboard.get_rosters())
+    neighbors = benchmark(PickSimilarity(matrix).nearest, 5)
+    assert neighbors['user_id'].nunique() == len(league['rosters'])
+
+
+def test_pick_consensus(benchmark, dashboard, league):
+    """Weekly consensus and contrarian scores for every user and week"""
+    from pick_analytics import PickConsensus, PickMatrix
+
+    matrix = PickMatrix.from_rosters(dashboard.get_rosters())
+    consensus = benchmark(PickConsensus, matrix, league['odds'])
+    assert consensus.user_scores()['contrarian_score'].notna().any()
+
+
+def test_what_if_rules(benchmark, dashboard, league):
+    """Rescore the season under every default rule variant"""
+    from rule_variants import WhatIfEngine
+
+    def rescore():
+        engine = WhatIfEngine(dashboard.get_rosters(), league['odds'])
+        return engine.compare(), engine.summary()
+
+    comparison, summary = benchmark(rescore)
+    assert len(comparison) == len(league['rosters'])
+    assert summary['weeks_contested'].min() > 0
@@ -0,0 +1,36 @@
+"""
+Benchmarks for the CSV/Excel season report export
+"""
+
+import serialization
+from results_store import encode_results
+
+from conftest import max_league_size
+
+
+@max_league_size('medium')
+def test_export_all(benchmark, results_history, tmp_path):
+    """Export three seasons of results to CSV and Excel"""
+    from export_results import SkinsGameExporter
+
+    results_file = tmp_path / 'skins_game_results.json'
+    results_file.write_bytes(serialization.dumps(encode_results(results_history)))
+
+    exporter = SkinsGameExporter(str(results_file))
+    exporter.export_file_csv = str(tmp_path / 'report.csv')
+    exporter.export_file_xlsx = str(tmp_path / 'report.xlsx')
+
+    assert benchmark.pedantic(exporter.export_all, rounds=3, iterations=1)
+
+
+def test_season_summary(benchmark, results_history, tmp_path):
+    """Read season totals from the materialized standings"""
+    from standings import SeasonStandings
+
+    results_file = tmp_path / 'skins_game_results.json'
+    results_file.write_bytes(serialization.dumps(encode_results(results_history)))
+    standings = SeasonStandings(str(results_file))
+    standings.rebuild()
+
+    seasons = benchmark(standings.seasons)
+    assert len(seasons) == 3
@@ -0,0 +1,34 @@
+"""
+Benchmarks for notification message formatting
+"""
+
+import pytest
+
+
+@pytest.fixture
+def latest_result(results_history):
+    return results_history[-1]
+
+
+def test_sms_formatting(benchmark, latest_result):
+    from sms_notifications import SMSNotifier
+
+    notifier = SMSNotifier()
+    message = benchmark(notifier.format_results_message, latest_result, 17, 2025)
+    assert 'Week 17' in message
+
+
+def test_discord_formatting(benchmark, latest_result):
+    from discord_notifications import DiscordNotifier
+
+    notifier = DiscordNotifier()
+    embed = benchmark(notifier.format_results_embed, latest_result, 17, 2025)
+    assert embed['fields']
+
+
+def test_shortcuts_formatting(benchmark, latest_result):
+    from apple_shortcuts import AppleShortcutsIntegration
+
+    integration = AppleShortcutsIntegration()
+    data = benchmark(integration.format_for_shortcuts, latest_result)
+    assert data['message_text']
@@ -0,0 +1,43 @@
+"""
+Benchmarks for weekly ranking and results persistence
+"""
+
+import serialization
+from results_store import encode_results
+
+from conftest import SEASONS
+
+
+def test_calculate_week_rankings(benchmark, skins_game):
+    """Rank every week of a full season"""
+    def rank_season():
+        return [skins_game.calculate_week_rankings(week) for week in range(1, 18)]
+
+    rankings = benchmark(rank_season)
+    assert len(rankings) == 17
+
+
+def test_process_week_persistence(benchmark, skins_game, results_history, generator):
+    """Process one week on top of three seasons of stored history"""
+    history = serialization.dumps(encode_results(results_history))
+    odds = generator.odds_data(2025, 17)
+
+    def reset_history():
+        with open(skins_game.results_file, 'wb') as f:
+            f.write(history)
+
+    result = benchmark.pedantic(skins_game.process_week, args=(17, odds, 2025),
+                                setup=reset_history, rounds=5, iterations=1)
+    assert result['week'] == 17
+    stored = skins_game.load_results()
+    assert len(stored) == len(SEASONS) * 17  # reprocessing week 17 replaces the stored record
+    assert stored[-1]['date_processed'] == result['date_processed']
+
+
+def test_rating_rebuild(benchmark, skins_game, tmp_path):
+    """Replay a full season of weekly Elo contests"""
+    from ratings import EloRatingStore
+
+    store = EloRatingStore(str(tmp_path / 'skins_game_results.json'))
+    ratings = benchmark.pedantic(store.rebuild, args=(2025, skins_game.get_rosters()), rounds=3, iterations=1)
+    assert len(ratings) == len(skins_game.get_rosters())
@@ -3,17 +3,24 @@
 Clean and organize the skins game results
 """
 
-import json
+import os
+import shutil
+import sys
 from datetime import datetime
 from collections import defaultdict
 
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from results_store import ResultsStore
+
 def clean_and_organize_results():
     """Clean up duplicate results and organize by week/season"""
     
     # Load current results
+    store = ResultsStore('skins_game_results.json')
     try:
-        with open('skins_game_results.json', 'r') as f:
-            results = json.load(f)
+        results = store.load()
     except FileNotFoundError:
         print("No results file found")
         return
@@ -47,13 +54,11 @@ def clean_and_organize_results():
     
     # Create backup
     backup_filename = f"skins_game_results_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(backup_filename, 'w') as f:
-        json.dump(results, f, indent=2)
+    shutil.copy2(store.path, backup_filename)
     print(f"💾 Created backup: {backup_filename}")
     
     # Save cleaned results
-    with open('skins_game_results.json', 'w') as f:
-        json.dump(cleaned_results, f, indent=2)
+    store.save(cleaned_results)
     
     print(f"✨ Results cleaned and organized!")
     
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test the slotted, array-backed roster and score records
+"""
+
+import sys
+import os
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from compact_records import RosterRecord, RosterTable, TeamCodes, WeeklyScores, team_codes
+from synthetic_league import SyntheticLeagueGenerator
+from skins_game_mvp import SleeperSkinsGameMVP
+
+
+def test_weekly_scores_mapping():
+    """WeeklyScores behaves like the week -> score dicts it replaces"""
+    scores = WeeklyScores.from_points_by_leg({'v1:regular:3': 9, 'v1:regular:1': 12.5, 'v1:post:1': 4})
+    assert list(scores) == [1, 3]
+    assert scores[3] == 9.0
+    assert scores.get(2, 0.0) == 0.0
+    assert dict(scores.items()) == {1: 12.5, 3: 9.0}
+    assert len(scores) == 2
+
+
+def test_roster_record_round_trip():
+    """Picks are stored as codes and decode back to team abbreviations"""
+    roster = {
+        'owner_id': '123',
+        'metadata': {
+            'points_by_leg': {'v1:regular:1': 2, 'v1:regular:2': 0},
+            'previous_picks': {'v1:regular:1': ['KC', 'BUF'], 'v1:regular:2': []},
+        },
+    }
+    record = RosterRecord.from_roster(roster)
+    assert record.score(1) == 2.0 and record.score(5) == 0.0
+    assert record.week_picks(1) == ['KC', 'BUF']
+    assert record.pick_codes(1) == bytes([team_codes.code('KC'), team_codes.code('BUF')])
+    assert record.week_picks(2) == [] and record.week_picks(9) == []
+    assert record.to_roster() == {
+        'owner_id': '123',
+        'metadata': {
+            'points_by_leg': {'v1:regular:1': 2.0, 'v1:regular:2': 0.0},
+            'previous_picks': {'v1:regular:1': ['KC', 'BUF'], 'v1:regular:2': []},
+        },
+    }
+    assert record.get('metadata')['previous_picks']['v1:regular:1'] == ['KC', 'BUF']
+    assert record['metadata']['points_by_leg'] == record.to_roster()['metadata']['points_by_leg']
+    assert record['owner_id'] == record.owner_id and record.get('settings') is None
+    try:
+        record['settings']
+        assert False, "unknown keys should raise KeyError"
+    except KeyError:
+        pass
+
+
+def test_team_codes_assign_unknown_teams():
+    """Teams outside the NFL list get the next free code"""
+    codes = TeamCodes(['KC'])
+    assert codes.code('KC') == 0
+    assert codes.code('XYZ') == 1
+    assert codes.decode(codes.encode(['XYZ', 'KC'])) == ['XYZ', 'KC']
+
+
+def test_mvp_rankings_on_roster_table():
+    """Rankings, picks and perfect weeks read the compact table"""
+    generator = SyntheticLeagueGenerator(seed=3, perfect_week_rate=0.2)
+    league = generator.generate_league('42', num_users=40, weeks_played=2)
+    table = RosterTable.from_rosters(league['rosters'])
+
+    skins_game = SleeperSkinsGameMVP('42')
+    skins_game._rosters_cache = table
+
+    for roster in league['rosters']:
+        owner_id = roster['owner_id']
+        assert skins_game.get_user_score_for_week(owner_id, 1) == float(roster['metadata']['points_by_leg'].get('v1:regular:1', 0))
+        assert skins_game.get_week_picks(1)[owner_id] == roster['metadata']['previous_picks'].get('v1:regular:1', [])
+
+    odds_data = league['odds'][1]
+    winners = {team for team, data in odds_data.items() if data['won']}
+    expected = sorted(
+        roster['owner_id'] for roster in league['rosters']
+        if len(roster['metadata']['previous_picks'].get('v1:regular:1', [])) == len(odds_data)
+        and all(pick in winners for pick in roster['metadata']['previous_picks']['v1:regular:1'])
+    )
+    assert sorted(skins_game.check_perfect_week(1, odds_data)) == expected
+
+
+if __name__ == "__main__":
+    test_weekly_scores_mapping()
+    test_roster_record_round_trip()
+    test_team_codes_assign_unknown_teams()
+    test_mvp_rankings_on_roster_table()
+    print("✅ Compact record tests passed")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test stale-while-revalidate serving of league metadata
+"""
+
+import sys
+import os
+import time
+import json
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from metadata_cache import MetadataCache
+from mock_sleeper_server import MockSleeperServer, LeagueFixture
+from skins_game_mvp import SleeperSkinsGameMVP
+
+
+class CountingLoader:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {'week': self.calls}
+
+
+def age_entry(cache, key, seconds):
+    """Pretend the cached entry was fetched `seconds` ago"""
+    path = cache._path(key)
+    with open(path, 'r') as f:
+        entry = json.load(f)
+    entry['fetched_at'] -= seconds
+    with open(path, 'w') as f:
+        json.dump(entry, f)
+
+
+def test_fresh_value_served_from_disk():
+    """A second cache instance (another CLI run) reuses the stored value"""
+    with tempfile.TemporaryDirectory() as tmp:
+        loader = CountingLoader()
+        assert MetadataCache(tmp).get('league/1', loader) == {'week': 1}
+        assert MetadataCache(tmp).get('league/1', loader) == {'week': 1}
+        assert loader.calls == 1
+
+
+def test_stale_value_returned_while_refreshing():
+    """Past the soft TTL the old value is returned immediately and refreshed behind it"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = MetadataCache(tmp, soft_ttl=10, hard_ttl=100)
+        loader = CountingLoader(delay=0.2)
+        cache.get('league/1', loader)
+        age_entry(cache, 'league/1', 20)
+
+        started = time.monotonic()
+        assert cache.get('league/1', loader) == {'week': 1}
+        assert time.monotonic() - started < 0.1
+
+        for thread in list(cache._refreshing.values()):
+            thread.join()
+        assert loader.calls == 2
+        assert cache.get('league/1', loader) == {'week': 2}
+
+
+def test_expired_value_blocks_for_refresh():
+    """Past the hard TTL the value is refetched before returning"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = MetadataCache(tmp, soft_ttl=10, hard_ttl=100)
+        loader = CountingLoader()
+        cache.get('league/1', loader)
+        age_entry(cache, 'league/1', 200)
+        assert cache.get('league/1', loader) == {'week': 2}
+
+
+def test_current_week_without_api_call():
+    """A new league object reads the week pointer from the shared cache"""
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=3)
+
+    with tempfile.TemporaryDirectory() as tmp, MockSleeperServer([league]) as server:
+        first = SleeperSkinsGameMVP('42', base_url=server.base_url, metadata_cache=MetadataCache(tmp))
+        assert first.get_current_week() == 4
+        second = SleeperSkinsGameMVP('42', base_url=server.base_url, metadata_cache=MetadataCache(tmp))
+        assert second.get_current_week() == 4
+        assert server.request_counts['/v1/league/42'] == 1
+
+        # Picking a week to process always asks the API
+        assert second.get_current_week(revalidate=True) == 4
+        assert server.request_counts['/v1/league/42'] == 2
+
+
+if __name__ == "__main__":
+    test_fresh_value_served_from_disk()
+    test_stale_value_returned_while_refreshing()
+    test_expired_value_blocks_for_refresh()
+    test_current_week_without_api_call()
+    print("✅ Metadata cache tests passed")
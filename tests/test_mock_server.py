@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test the local Sleeper API stand-in server against the league classes
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+os.environ.setdefault('CACHE_DIRECTORY', tempfile.mkdtemp(prefix='pickem_cache_'))
+
+from mock_sleeper_server import MockSleeperServer, LeagueFixture
+from skins_game_mvp import SleeperSkinsGameMVP
+from sleeper_client import SleeperClient
+
+
+def test_mvp_against_mock_server():
+    """The MVP should run end to end against a synthetic league"""
+    league = LeagueFixture.synthetic('42', num_users=25, weeks=5, seed=7)
+
+    with MockSleeperServer([league]) as server:
+        skins_game = SleeperSkinsGameMVP('42', base_url=server.base_url)
+
+        assert skins_game.get_current_week() == 6
+        assert len(skins_game.get_users()) == 25
+
+        rankings = skins_game.calculate_week_rankings(3)
+        assert rankings['highest']
+        assert server.request_counts['/v1/league/42/rosters'] == 1
+
+
+def test_games_and_matchups_routes():
+    """Games are served per season/week and unknown leagues return 404"""
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=2, seed=1)
+
+    with MockSleeperServer([league]) as server:
+        client = SleeperClient(server.base_url)
+
+        games = client.get('/games/nfl/2025/1').json()
+        assert len(games) == 16
+        assert client.get('/league/42/matchups/1').json() == []
+        assert client.get('/league/999/rosters').status_code == 404
+
+
+def test_error_injection():
+    """Every request fails when the error rate is 1"""
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=1)
+
+    with MockSleeperServer([league], error_rate=1.0, error_status=503) as server:
+        client = SleeperClient(server.base_url, max_retries=0)
+        assert client.get('/league/42').status_code == 503
+
+
+if __name__ == "__main__":
+    test_mvp_against_mock_server()
+    test_games_and_matchups_routes()
+    test_error_injection()
+    print("✅ Mock server tests passed")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test stage timing spans, counters and report output
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from perf_metrics import RunMetrics, metrics
+from mock_sleeper_server import MockSleeperServer, LeagueFixture
+from sleeper_client import SleeperClient
+
+
+def test_spans_and_counters():
+    """Nested spans record their path and counters accumulate"""
+    run = RunMetrics()
+    with run.span('process_week', week=3):
+        with run.span('ranking'):
+            pass
+        with run.span('persist'):
+            pass
+    run.incr('cache_hits')
+    run.incr('cache_hits', 2)
+
+    report = run.report()
+    paths = [span['path'] for span in report['spans']]
+    assert 'process_week/ranking' in paths
+    assert report['stage_totals']['process_week']['count'] == 1
+    assert report['spans'][0]['attrs'] == {'week': 3}
+    assert report['counters']['cache_hits'] == 3
+
+
+def test_report_files():
+    """JSON and Prometheus textfile reports are written"""
+    run = RunMetrics()
+    with run.span('excel_export'):
+        run.incr('http_bytes', 1024)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(run.write_report(tmp), 'r') as f:
+            assert json.load(f)['run_id'] == run.run_id
+
+        prom_path = run.write_prometheus(os.path.join(tmp, 'pickem.prom'))
+        with open(prom_path, 'r') as f:
+            text = f.read()
+
+    assert 'pickem_stage_seconds{stage="excel_export"}' in text
+    assert 'pickem_http_bytes 1024' in text
+
+
+def test_client_counts_http_bytes():
+    """SleeperClient feeds request and byte counters"""
+    league = LeagueFixture.synthetic('42', num_users=10, weeks=2, seed=1)
+    metrics.reset()
+
+    with MockSleeperServer([league]) as server:
+        response = SleeperClient(server.base_url).get('/league/42/rosters')
+
+    assert metrics.counters['http_requests'] == 1
+    assert metrics.counters['http_bytes'] == len(response.content)
+    assert metrics.stage_totals()['http_get']['count'] == 1
+
+
+if __name__ == "__main__":
+    test_spans_and_counters()
+    test_report_files()
+    test_client_counts_http_bytes()
+    print("✅ Metrics tests passed")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Test the pick matrix and pick-similarity engine
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+os.environ.setdefault('CACHE_DIRECTORY', tempfile.mkdtemp(prefix='pickem_cache_'))
+
+from compact_records import RosterTable
+from pick_analytics import PickConsensus, PickMatrix, PickSimilarity, load_game_results
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def make_rosters(num_users=40, weeks_played=8):
+    league = SyntheticLeagueGenerator(seed=13).generate_league(
+        '1000000000000000000', num_users, weeks_played=weeks_played)
+    return league, RosterTable.from_rosters(league['rosters'])
+
+
+def brute_force_jaccard(rosters, a, b):
+    shared = union = 0
+    for week in set(a.pick_weeks) | set(b.pick_weeks):
+        picks_a, picks_b = set(a.week_picks(week)), set(b.week_picks(week))
+        shared += len(picks_a & picks_b)
+        union += len(picks_a | picks_b)
+    return shared, (shared / union if union else 0.0)
+
+
+def test_matrix_round_trips_picks():
+    """Unpacking the bitsets gives back every user's weekly picks"""
+    _, rosters = make_rosters()
+    matrix = PickMatrix.from_rosters(rosters)
+    picked = matrix.unpack()
+    for row, owner_id in enumerate(matrix.owner_ids):
+        record = rosters.owner(owner_id)
+        for col, week in enumerate(matrix.weeks):
+            teams = {matrix.codes.team(code) for code in np.flatnonzero(picked[row, col])}
+            assert teams == set(record.week_picks(int(week)))
+            assert matrix.pick_counts[row, col] == len(teams)
+
+    only_week_3 = PickMatrix.from_rosters(rosters, weeks=[3])
+    assert list(only_week_3.weeks) == [3]
+    assert (only_week_3.pick_counts[:, 0] == matrix.pick_counts[:, 2]).all()
+
+
+def test_pairwise_matches_brute_force():
+    """Popcount Jaccard equals set arithmetic on the raw picks"""
+    _, rosters = make_rosters(num_users=25)
+    matrix = PickMatrix.from_rosters(rosters)
+    shared, jaccard = PickSimilarity(matrix).pairwise()
+    for i, a in enumerate(matrix.owner_ids):
+        for j, b in enumerate(matrix.owner_ids):
+            expected_shared, expected_jaccard = brute_force_jaccard(rosters, rosters.owner(a), rosters.owner(b))
+            assert shared[i, j] == expected_shared
+            assert np.isclose(jaccard[i, j], expected_jaccard)
+
+
+def test_nearest_neighbours():
+    """Top-k excludes the user and agrees with the full matrix"""
+    _, rosters = make_rosters()
+    matrix = PickMatrix.from_rosters(rosters)
+    similarity = PickSimilarity(matrix)
+    _, jaccard = similarity.pairwise()
+    neighbors = similarity.nearest(3)
+    assert len(neighbors) == 3 * len(matrix)
+
+    index = {owner_id: i for i, owner_id in enumerate(matrix.owner_ids)}
+    for user_id, group in neighbors.groupby('user_id'):
+        row = jaccard[index[user_id]].copy()
+        row[index[user_id]] = -1
+        assert user_id not in set(group['neighbor_id'])
+        assert np.allclose(group.sort_values('rank')['jaccard'], np.sort(row)[::-1][:3])
+
+
+def test_consensus_matches_per_user_loops():
+    """Vectorized shares and contrarian scores equal a straightforward loop"""
+    league, rosters = make_rosters(num_users=30, weeks_played=6)
+    matrix = PickMatrix.from_rosters(rosters)
+    outcomes = {week: league['odds'][week] for week in (1, 2, 4)}
+    consensus = PickConsensus(matrix, outcomes)
+
+    weekly = {}
+    for week in matrix.weeks:
+        week = int(week)
+        picks = {r.owner_id: set(r.week_picks(week)) for r in rosters if r.owner_id and r.week_picks(week)}
+        counts = {}
+        for teams in picks.values():
+            for team in teams:
+                counts[team] = counts.get(team, 0) + 1
+        weekly[week] = (picks, {team: count / len(picks) for team, count in counts.items()})
+
+    table = consensus.consensus_table()
+    for row in table.itertuples():
+        assert np.isclose(row.share, weekly[row.week][1][row.team])
+        if row.week in outcomes:
+            assert row.won == outcomes[row.week][row.team]['won']
+        else:
+            assert row.won is pd.NA
+
+    scores = consensus.user_scores()
+    for owner_id in matrix.owner_ids:
+        rarity_total = won_total = picked = 0.0
+        for week in outcomes:
+            picks, shares = weekly[week]
+            for team in picks.get(owner_id, ()):
+                picked += 1
+                won_total += (1 - shares[team]) * outcomes[week][team]['won']
+        assert scores.loc[owner_id, 'decided_picks'] == picked
+        if picked:
+            assert np.isclose(scores.loc[owner_id, 'contrarian_score'], won_total / picked)
+
+    week_rows = consensus.weekly_scores()
+    assert week_rows.loc[week_rows['week'] == 3, 'contrarian_score'].isna().all()
+    assert week_rows.loc[week_rows['week'] == 1, 'contrarian_score'].notna().all()
+
+
+def test_unknown_result_teams_leave_codes_alone():
+    """Results for teams nobody picked do not add codes to the shared table"""
+    from compact_records import team_codes
+
+    league, rosters = make_rosters(num_users=10, weeks_played=2)
+    matrix = PickMatrix.from_rosters(rosters)
+    outcomes = {1: dict(league['odds'][1], XYZ={'opponent': 'ABC', 'won': True})}
+    before = len(team_codes)
+    consensus = PickConsensus(matrix, outcomes)
+    assert len(team_codes) == before and team_codes.find('XYZ') is None
+    assert consensus.won.shape == (len(matrix.weeks), matrix.team_count)
+
+
+def test_consensus_feeds_exports():
+    """Game results files are picked up and the exporter writes the consensus sheets"""
+    from export_results import SkinsGameExporter
+    from results_store import ResultsStore
+
+    league, rosters = make_rosters(num_users=12, weeks_played=3)
+    with tempfile.TemporaryDirectory() as tmp:
+        for week in (1, 2):
+            with open(os.path.join(tmp, f'week_{week}_game_results.json'), 'w') as f:
+                json.dump(league['odds'][week], f)
+        matrix = PickMatrix.from_rosters(rosters)
+        outcomes = load_game_results(matrix.weeks, tmp)
+        assert sorted(outcomes) == [1, 2]
+
+        history = list(SyntheticLeagueGenerator(seed=13).iter_results_history(12, [2025]))
+        results_file = os.path.join(tmp, 'skins_game_results.json')
+        ResultsStore(results_file).save(history)
+        exporter = SkinsGameExporter(results_file, pick_consensus=PickConsensus(matrix, outcomes))
+        exporter.export_file_csv = os.path.join(tmp, 'report.csv')
+        exporter.export_file_xlsx = os.path.join(tmp, 'report.xlsx')
+        assert exporter.export_all()
+
+        sheets = pd.read_excel(exporter.export_file_xlsx, sheet_name=None)
+        assert len(sheets['Contrarian_Scores']) == len(matrix)
+        assert set(sheets['Pick_Consensus']['Week']) == {1, 2, 3}
+
+
+def test_toolkit_against_mock_server():
+    """The testing toolkit reports neighbours from live-shaped rosters"""
+    from mock_sleeper_server import MockSleeperServer, LeagueFixture
+    from sleeper_testing_toolkit import SleeperTestingToolkit
+
+    league = LeagueFixture.synthetic('42', num_users=12, weeks=4, seed=3)
+    with MockSleeperServer([league]) as server, tempfile.TemporaryDirectory() as tmp:
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            neighbors = SleeperTestingToolkit('42', base_url=server.base_url).analyze_pick_similarity(k=2)
+        finally:
+            os.chdir(cwd)
+        assert len(neighbors) == 24
+        assert neighbors['neighbor_name'].notna().all()
+
+
+if __name__ == "__main__":
+    test_matrix_round_trips_picks()
+    test_pairwise_matches_brute_force()
+    test_nearest_neighbours()
+    test_consensus_matches_per_user_loops()
+    test_unknown_result_teams_leave_codes_alone()
+    test_consensus_feeds_exports()
+    test_toolkit_against_mock_server()
+    print("✅ Pick analytics tests passed")
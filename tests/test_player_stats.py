@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test the running per-player statistics
+"""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from compact_records import RosterTable
+from player_stats import RunningStats, PlayerStatsStore
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def make_league(num_users=25, weeks_played=12):
+    return SyntheticLeagueGenerator(seed=8).generate_league(
+        '1000000000000000000', num_users, weeks_played=weeks_played)
+
+
+def test_running_stats_match_numpy():
+    """Welford mean/std and the regression sums agree with numpy"""
+    rng = np.random.default_rng(2)
+    weeks = np.arange(1, 18, dtype=float)
+    scores = rng.integers(0, 16, size=17).astype(float)
+    stats = RunningStats.from_scores(weeks, scores)
+    assert np.isclose(stats.mean, scores.mean())
+    assert np.isclose(stats.std(), np.std(scores))
+    assert np.isclose(stats.slope(), np.polyfit(weeks, scores, 1)[0])
+    restored = RunningStats.from_list(stats.to_list())
+    assert restored.to_list() == stats.to_list()
+    assert RunningStats.from_scores([3], [7]).improvement_trend() == 0
+
+
+def test_process_week_keeps_stats_current():
+    """Processing weeks one by one gives the same stats as a full rebuild"""
+    from skins_game_mvp import SleeperSkinsGameMVP
+
+    league = make_league()
+    with tempfile.TemporaryDirectory() as tmp:
+        game = SleeperSkinsGameMVP.from_league(league)
+        game.results_file = os.path.join(tmp, 'skins_game_results.json')
+        for week in range(1, 13):
+            game.process_week(week, season=2025)
+        game.process_week(12, season=2025)  # reprocessing does not double count
+        assert PlayerStatsStore(game.results_file).is_current()
+
+        store = PlayerStatsStore(game.results_file)
+        incremental = store.season(2025)
+        assert store.weeks(2025) == list(range(1, 13))
+        rebuilt = store.rebuild(2025, game.get_rosters())
+        assert set(incremental) == set(rebuilt)
+        for owner_id, stats in rebuilt.items():
+            assert np.allclose(incremental[owner_id].to_list(), stats.to_list())
+
+
+def test_dashboard_uses_running_stats():
+    """The dashboard reads consistency and trend from the store when it is complete"""
+    from analytics_dashboard import SleeperAnalyticsDashboard
+
+    league = make_league()
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PlayerStatsStore(os.path.join(tmp, 'skins_game_results.json'))
+        plain = SleeperAnalyticsDashboard.from_league(league, player_stats=store)
+        expected = plain.extract_player_data()
+
+        store.rebuild(league['league_info']['season'], plain.get_rosters())
+        board = SleeperAnalyticsDashboard.from_league(league, player_stats=store)
+        for owner_id, performance in board.extract_player_data().items():
+            assert np.isclose(performance.consistency_score, expected[owner_id].consistency_score)
+            assert np.isclose(performance.improvement_trend, expected[owner_id].improvement_trend)
+
+
+
+def test_dashboard_ignores_stats_that_no_longer_match():
+    """Stats for other weeks, or older than the results file, fall back to the roster scores"""
+    from analytics_dashboard import SleeperAnalyticsDashboard
+
+    league = make_league()
+
+    def assert_matches_roster_scores(board):
+        with tempfile.TemporaryDirectory() as empty:
+            expected = SleeperAnalyticsDashboard.from_league(
+                league, player_stats=PlayerStatsStore(os.path.join(empty, 'results.json'))).extract_player_data()
+        for owner_id, performance in board.extract_player_data().items():
+            assert np.isclose(performance.consistency_score, expected[owner_id].consistency_score)
+            assert np.isclose(performance.improvement_trend, expected[owner_id].improvement_trend)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results_file = os.path.join(tmp, 'skins_game_results.json')
+        store = PlayerStatsStore(results_file)
+        store.rebuild(league['league_info']['season'], RosterTable.from_rosters(league['rosters']))
+        assert store.is_current()
+
+        # One player's week 2 moves to week 13 (same count, a week the stats never saw)
+        points = league['rosters'][1]['metadata']['points_by_leg']
+        points['v1:regular:13'] = points.pop('v1:regular:2', 0) + 1
+        assert_matches_roster_scores(SleeperAnalyticsDashboard.from_league(league, player_stats=store))
+
+        # Sleeper corrects a score and the week is reprocessed, rewriting the results file
+        league['rosters'][0]['metadata']['points_by_leg']['v1:regular:4'] += 3
+        with open(results_file, 'w') as f:
+            f.write('{}')
+        assert not store.is_current()
+        assert_matches_roster_scores(SleeperAnalyticsDashboard.from_league(league, player_stats=store))
+
+
+def test_dashboard_store_follows_results_file():
+    """The default stats store lives next to the results file the dashboard is given"""
+    from analytics_dashboard import SleeperAnalyticsDashboard
+    from player_stats import stats_path
+
+    results_file = os.path.join('somewhere', 'results.json')
+    board = SleeperAnalyticsDashboard('1000000000000000000', results_file=results_file)
+    assert board.player_stats.path == stats_path(results_file)
+
+
+if __name__ == "__main__":
+    test_running_stats_match_numpy()
+    test_process_week_keeps_stats_current()
+    test_dashboard_uses_running_stats()
+    test_dashboard_ignores_stats_that_no_longer_match()
+    test_dashboard_store_follows_results_file()
+    print("✅ Player stats tests passed")
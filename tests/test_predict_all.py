@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Test batch next-week predictions against the per-player fit
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from analytics_dashboard import SleeperAnalyticsDashboard
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def make_dashboard(num_users=40, weeks_played=9):
+    league = SyntheticLeagueGenerator(seed=11).generate_league(
+        '1000000000000000000', num_users, weeks_played=weeks_played)
+    # Uneven histories: drop some weeks for some players, leave one with a single week
+    for i, roster in enumerate(league['rosters']):
+        points = roster['metadata']['points_by_leg']
+        for week in range(1, weeks_played + 1):
+            if (i + week) % 5 == 0:
+                points.pop(f"v1:regular:{week}", None)
+    league['rosters'][0]['metadata']['points_by_leg'] = {'v1:regular:3': 7}
+
+    board = SleeperAnalyticsDashboard.from_league(league)
+    return board
+
+
+def test_predict_all_matches_single_player_fit():
+    """Vectorized fits agree with predict_next_week_performance for every player"""
+    board = make_dashboard()
+    predictions = board.predict_all()
+    assert len(predictions) == len(board.player_performances)
+
+    for user_id, row in predictions.iterrows():
+        single = board.predict_next_week_performance(user_id)
+        assert np.isclose(row['predicted_score'], single['predicted_score'])
+        assert np.isclose(row['confidence'], single['confidence'])
+        if 'trend' in single:
+            assert np.isclose(row['slope'], single['trend'])
+            assert row['next_week'] == single['next_week']
+
+
+def test_single_week_player_gets_average():
+    """Players with one scored week fall back to their average"""
+    board = make_dashboard()
+    predictions = board.predict_all()
+    row = predictions.iloc[0]
+    assert row['weeks_played'] == 1
+    assert row['predicted_score'] == 7 and row['slope'] == 0 and row['confidence'] == 0.1
+    assert row['next_week'] == 4
+
+
+if __name__ == "__main__":
+    test_predict_all_matches_single_player_fit()
+    test_single_week_player_gets_average()
+    print("✅ Prediction tests passed")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test the --profile support used by the CLIs
+"""
+
+import sys
+import os
+import pstats
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from profiling import ProfileSession
+
+
+def busy_function():
+    return sorted(str(i) for i in range(20000))
+
+
+def test_profile_session_writes_stats_and_summary():
+    """A session saves loadable pstats plus hot-function and allocation summaries"""
+    with tempfile.TemporaryDirectory() as tmp:
+        with ProfileSession('week 3', output_dir=tmp, top_n=5, trace_memory=True) as session:
+            busy_function()
+
+        assert os.path.basename(session.stats_path).startswith('week_3_')
+        stats = pstats.Stats(session.stats_path)
+        assert any(func[2] == 'busy_function' for func in stats.stats)
+
+        with open(session.summary_path, 'r') as f:
+            summary = f.read()
+
+    assert 'TOP 5 BY CUMULATIVE TIME' in summary
+    assert 'busy_function' in summary
+    assert 'Peak traced memory' in summary
+
+
+if __name__ == "__main__":
+    test_profile_session_writes_stats_and_summary()
+    print("✅ Profiling tests passed")
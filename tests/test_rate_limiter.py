@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test the shared token-bucket rate limiter
+"""
+
+import sys
+import os
+import time
+import tempfile
+import multiprocessing
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from rate_limiter import TokenBucketRateLimiter, RateLimitTimeout, DEFAULT_STATE_FILE
+
+
+def _drain(state_file, count, results):
+    limiter = TokenBucketRateLimiter(requests_per_minute=600, burst=5, state_file=state_file)
+    for _ in range(count):
+        limiter.acquire()
+    results.put(os.getpid())
+
+
+def test_burst_then_throttle():
+    """Burst is served immediately, then requests are paced at the sustained rate"""
+    with tempfile.TemporaryDirectory() as tmp:
+        limiter = TokenBucketRateLimiter(requests_per_minute=1200, burst=3,
+                                         state_file=os.path.join(tmp, 'bucket.state'))
+        started = time.monotonic()
+        for _ in range(3):
+            assert limiter.acquire() < 0.01
+        limiter.acquire()
+        limiter.acquire()
+        elapsed = time.monotonic() - started
+        assert 0.08 <= elapsed < 0.5  # two extra tokens at 20/s
+        limiter.close()
+
+
+def test_state_shared_between_instances():
+    """Two limiters on the same state file draw from one bucket"""
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = os.path.join(tmp, 'bucket.state')
+        first = TokenBucketRateLimiter(requests_per_minute=60, burst=2, state_file=state_file)
+        second = TokenBucketRateLimiter(requests_per_minute=60, burst=2, state_file=state_file)
+        first.acquire()
+        second.acquire()
+        try:
+            first.acquire(timeout=0.1)
+            assert False, "bucket should be empty"
+        except RateLimitTimeout:
+            pass
+        first.close()
+        second.close()
+
+
+def test_shared_across_processes():
+    """Worker processes together stay within the budget"""
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = os.path.join(tmp, 'bucket.state')
+        results = multiprocessing.Queue()
+        started = time.monotonic()
+        workers = [multiprocessing.Process(target=_drain, args=(state_file, 4, results)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+        elapsed = time.monotonic() - started
+        # 12 requests, 5 burst, 10/s afterwards -> at least 0.7s
+        assert elapsed >= 0.6
+        assert len({results.get(timeout=1) for _ in workers}) == 3
+
+
+def test_request_larger_than_bucket():
+    """Asking for more tokens than the bucket holds fails instead of waiting forever"""
+    limiter = TokenBucketRateLimiter(requests_per_minute=60, burst=2, state_file=None)
+    try:
+        limiter.acquire(3)
+        assert False, "acquire should reject a request the bucket can never satisfy"
+    except ValueError:
+        pass
+    assert limiter.acquire(2) < 0.01
+
+
+def test_forked_worker_reopens_state_file():
+    """An inherited descriptor is closed and replaced in the child process"""
+    with tempfile.TemporaryDirectory() as tmp:
+        limiter = TokenBucketRateLimiter(requests_per_minute=60, burst=2,
+                                         state_file=os.path.join(tmp, 'bucket.state'))
+        limiter._open()
+        open_fds = len(os.listdir('/proc/self/fd'))
+        limiter._pid = -1  # pretend the descriptor came from a parent process
+        limiter._open()
+        assert limiter._pid == os.getpid()
+        assert len(os.listdir('/proc/self/fd')) == open_fds
+        assert limiter.acquire() < 0.01
+        limiter.close()
+
+
+def test_state_file_is_private():
+    """The bucket file is readable and writable only by its owner, and per user by default"""
+    with tempfile.TemporaryDirectory() as tmp:
+        state_file = os.path.join(tmp, 'bucket.state')
+        limiter = TokenBucketRateLimiter(requests_per_minute=60, burst=2, state_file=state_file)
+        limiter.acquire()
+        limiter.close()
+        assert os.stat(state_file).st_mode & 0o777 == 0o600
+    assert str(os.getuid()) in os.path.basename(DEFAULT_STATE_FILE)
+
+
+def test_disabled_limiter():
+    """A zero budget turns limiting off"""
+    limiter = TokenBucketRateLimiter(requests_per_minute=0, state_file=None)
+    assert not limiter.enabled
+    for _ in range(100):
+        assert limiter.acquire() == 0.0
+
+
+if __name__ == "__main__":
+    test_burst_then_throttle()
+    test_state_shared_between_instances()
+    test_shared_across_processes()
+    test_request_larger_than_bucket()
+    test_forked_worker_reopens_state_file()
+    test_state_file_is_private()
+    test_disabled_limiter()
+    print("✅ All rate limiter tests passed!")
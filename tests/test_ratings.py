@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test the weekly Elo rating engine
+"""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from compact_records import RosterTable
+from ratings import EloRatingStore, rate_week, ratings_path
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def make_league(num_users=20, weeks_played=8):
+    return SyntheticLeagueGenerator(seed=6).generate_league(
+        '1000000000000000000', num_users, weeks_played=weeks_played)
+
+
+def pairwise_update(ratings, scores, k_factor=32.0):
+    """Reference multi-player Elo, one opponent at a time"""
+    updated = []
+    for i, (rating, score) in enumerate(zip(ratings, scores)):
+        delta = 0.0
+        for j, (other, other_score) in enumerate(zip(ratings, scores)):
+            if i == j:
+                continue
+            actual = 1.0 if score > other_score else 0.5 if score == other_score else 0.0
+            delta += actual - 1 / (1 + 10 ** ((other - rating) / 400))
+        updated.append(rating + k_factor * delta / (len(ratings) - 1))
+    return updated
+
+
+def test_vectorized_update_matches_pairwise():
+    """Sorted wins and blocked expectations equal the pairwise loop"""
+    rng = np.random.default_rng(5)
+    ratings = rng.normal(1500, 120, size=40)
+    scores = rng.integers(4, 15, size=40).astype(float)
+    updated = rate_week(ratings, scores)
+    assert np.allclose(updated, pairwise_update(ratings, scores))
+    assert np.isclose(updated.sum(), ratings.sum())  # zero-sum
+    assert np.allclose(rate_week(np.array([1500.0]), np.array([9.0])), [1500.0])
+
+
+def test_process_week_applies_only_new_weeks():
+    """process_week rates its week once and matches a replay of the season"""
+    from skins_game_mvp import SleeperSkinsGameMVP
+
+    league = make_league()
+    with tempfile.TemporaryDirectory() as tmp:
+        game = SleeperSkinsGameMVP.from_league(league)
+        game.results_file = os.path.join(tmp, 'skins_game_results.json')
+        for week in range(1, 9):
+            game.process_week(week, season=2025)
+        store = EloRatingStore(game.results_file)
+        incremental = store.ratings()
+        game.process_week(8, season=2025)
+        assert store.ratings() == incremental
+        assert store.weeks(2025) == list(range(1, 9))
+
+        replayed = store.rebuild(2025, game.get_rosters())
+        assert set(replayed) == set(incremental)
+        for owner_id, (rating, weeks) in incremental.items():
+            assert np.isclose(replayed[owner_id][0], rating)
+            assert replayed[owner_id][1] == weeks <= 8
+        assert os.path.exists(ratings_path(game.results_file))
+
+
+def test_seasons_carry_over_and_replay_independently():
+    """A season replays from its own starting ratings"""
+    league = make_league(weeks_played=4)
+    rosters = RosterTable.from_rosters(league['rosters'])
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EloRatingStore(os.path.join(tmp, 'skins_game_results.json'))
+        first = store.rebuild(2024, rosters)
+        second = store.rebuild(2025, rosters)
+        assert all(second[uid][1] == 2 * first[uid][1] for uid in second)
+        assert second != first
+
+        again = store.rebuild(2025, rosters)
+        assert all(np.isclose(again[uid][0], second[uid][0]) for uid in second)
+        try:
+            store.rebuild(2024, rosters)
+            assert False, "replaying an earlier season should fail"
+        except ValueError:
+            pass
+        leaderboard = store.leaderboard()
+        assert leaderboard[0][1] >= leaderboard[-1][1]
+
+
+if __name__ == "__main__":
+    test_vectorized_update_matches_pairwise()
+    test_process_week_applies_only_new_weeks()
+    test_seasons_carry_over_and_replay_independently()
+    print("✅ Rating tests passed")
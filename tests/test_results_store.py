@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test the v2 results schema, its upgrader and incremental appends
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from results_store import ResultsStore, encode_results, decode_results, SCHEMA_VERSION
+from secure_config import config
+from standings import build_seasons
+from synthetic_league import SyntheticLeagueGenerator
+
+LEGACY_RECORD = {
+    'week': 1,
+    'season': 2024,
+    'date_processed': '2024-09-10T09:00:00',
+    'high_score': 13,
+    'high_score_winners': ['10', '11'],
+    'underdog_winners': ['12'],
+    'underdog_correct': 3,
+    'total_underdog_games': 5,
+    'winner_names': {'high_score': ['Ann', 'Bo'], 'underdog': ['Cy']},
+}
+
+
+def history(num_users=40, seasons=(2024, 2025)):
+    return list(SyntheticLeagueGenerator(seed=9).iter_results_history(num_users, list(seasons)))
+
+
+def test_round_trip_preserves_records():
+    """Encoding and decoding gives back the process_week records"""
+    records = history()
+    document = encode_results(records)
+    assert document['schema_version'] == SCHEMA_VERSION
+    assert decode_results(document) == records
+
+
+def test_legacy_records_upgrade_to_tiers():
+    """Old high score/underdog records become tiered records with the extras kept"""
+    record = decode_results(encode_results([LEGACY_RECORD]))[0]
+    assert record['rankings']['highest'] == ['10', '11']
+    assert record['winner_names']['highest'] == ['Ann', 'Bo']
+    assert record['scores']['highest'] == 13
+    assert record['rankings']['lowest'] == [] and record['perfect_week_winners'] == []
+    assert record['legacy'] == {
+        'underdog_winners': ['12'], 'underdog_correct': 3, 'total_underdog_games': 5,
+        'underdog_names': ['Cy'],
+    }
+
+
+def test_records_without_season_use_current_season():
+    """Records from before seasons were stored are filed under the configured season"""
+    legacy = {key: value for key, value in LEGACY_RECORD.items() if key != 'season'}
+    tiered = {key: value for key, value in history(num_users=5, seasons=(2024,))[0].items() if key != 'season'}
+    records = decode_results(encode_results([legacy, tiered]))
+    assert [record['season'] for record in records] == [config.current_season] * 2
+    assert list(build_seasons([legacy, tiered])) == [str(config.current_season)]
+
+
+def test_v1_file_upgraded_once_and_smaller():
+    """Loading a v1 file rewrites it as v2 and keeps a backup"""
+    records = history(num_users=200) + [LEGACY_RECORD]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'skins_game_results.json')
+        with open(path, 'w') as f:
+            json.dump(records, f, indent=2)
+        v1_size = os.path.getsize(path)
+
+        loaded = ResultsStore(path).load()
+        assert len(loaded) == len(records)
+        assert os.path.exists(path + '.v1.bak')
+        with open(path, 'r') as f:
+            assert json.load(f)['schema_version'] == SCHEMA_VERSION
+        assert os.path.getsize(path) < v1_size / 2
+        assert ResultsStore(path).load() == loaded
+
+
+def test_append_adds_week_and_new_users():
+    """append merges a week into the stored season without expanding history"""
+    records = history()
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResultsStore(os.path.join(tmp, 'results.json'))
+        store.append(records[0])
+        for record in records[1:]:
+            store.append(record)
+        new_week = dict(records[-1], week=18)
+        new_week['rankings'] = dict(new_week['rankings'], no_picks=['new-user'])
+        new_week['winner_names'] = dict(new_week['winner_names'], no_picks=['Newcomer'])
+        store.append(new_week)
+
+        loaded = store.load()
+        assert loaded[:-1] == records
+        assert loaded[-1]['winner_names']['no_picks'] == ['Newcomer']
+
+
+if __name__ == "__main__":
+    test_round_trip_preserves_records()
+    test_legacy_records_upgrade_to_tiers()
+    test_records_without_season_use_current_season()
+    test_v1_file_upgraded_once_and_smaller()
+    test_append_adds_week_and_new_users()
+    print("✅ Results store tests passed")
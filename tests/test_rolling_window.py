@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test the rolling-window (recent form) analytics
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from analytics_dashboard import SleeperAnalyticsDashboard
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def make_dashboard(num_users=15, weeks_played=12):
+    league = SyntheticLeagueGenerator(seed=21).generate_league(
+        '1000000000000000000', num_users, weeks_played=weeks_played)
+    # A gap in one player's history
+    del league['rosters'][1]['metadata']['points_by_leg']['v1:regular:6']
+    board = SleeperAnalyticsDashboard.from_league(league)
+    board.extract_player_data()
+    return board
+
+
+def test_matches_direct_window_computation():
+    """Sliding sums agree with computing each window from scratch"""
+    board = make_dashboard()
+    for window in (1, 3, 5, 20):
+        rolling = board.rolling_window(window)
+        for row in rolling.itertuples():
+            points = board.player_performances[row.user_id].weekly_scores
+            in_window = [(w, points[w]) for w in points if row.week - window < w <= row.week]
+            weeks = np.array([w for w, _ in in_window], dtype=float)
+            scores = np.array([s for _, s in in_window])
+            assert row.weeks_in_window == len(scores)
+            assert np.isclose(row.moving_average, scores.mean())
+            assert np.isclose(row.moving_std, np.std(scores))
+            expected_trend = np.polyfit(weeks, scores, 1)[0] if len(scores) > 1 else 0
+            assert np.isclose(row.trend, expected_trend, atol=1e-9)
+
+
+def test_recent_form_uses_latest_week():
+    """The leaderboard ranks players by their latest moving average"""
+    board = make_dashboard()
+    leaders = board.recent_form(4, top_n=5)
+    assert len(leaders) == 5
+    assert (leaders['week'] == 12).all()
+    assert list(leaders['moving_average']) == sorted(leaders['moving_average'], reverse=True)
+    assert board.recent_form(4, top_n=5, rolling=board.rolling_window(4)).equals(leaders)
+
+
+if __name__ == "__main__":
+    test_matches_direct_window_computation()
+    test_recent_form_uses_latest_week()
+    print("✅ Rolling window tests passed")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test compact parsing of rosters payloads
+"""
+
+import sys
+import os
+import json
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import roster_parser
+from roster_parser import compact_roster, parse_rosters
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def sample_body():
+    league = SyntheticLeagueGenerator(seed=11).generate_league('42', num_users=30, weeks_played=4)
+    rosters = league['rosters']
+    for roster in rosters:
+        roster['players'] = ['4046', '6794', '8138']
+        roster['settings'] = {'wins': 3, 'fpts': 120}
+        roster['metadata']['record'] = 'WWLW'
+    return rosters, json.dumps(rosters).encode('utf-8')
+
+
+def test_compact_roster_keeps_only_pickem_fields():
+    """Players, settings and other metadata are dropped"""
+    roster = {
+        'owner_id': '7', 'roster_id': 3, 'players': ['1'], 'settings': {'wins': 1},
+        'metadata': {'points_by_leg': {'v1:regular:1': 9.0}, 'previous_picks': {}, 'record': 'W'},
+    }
+    assert compact_roster(roster) == {
+        'owner_id': '7',
+        'metadata': {'points_by_leg': {'v1:regular:1': 9.0}, 'previous_picks': {}},
+    }
+    assert compact_roster({'owner_id': None, 'metadata': None}) == {'owner_id': None, 'metadata': {}}
+
+
+def test_parse_rosters_matches_full_parse():
+    """Streaming and json fallback produce the same compact rosters"""
+    rosters, body = sample_body()
+    expected = [compact_roster(roster) for roster in rosters]
+
+    assert parse_rosters(body) == expected
+
+    saved = roster_parser.ijson
+    roster_parser.ijson = None
+    try:
+        assert parse_rosters(body) == expected
+    finally:
+        roster_parser.ijson = saved
+
+
+if __name__ == "__main__":
+    test_compact_roster_keeps_only_pickem_fields()
+    test_parse_rosters_matches_full_parse()
+    print("✅ Roster parser tests passed")
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test the what-if rescoring engine
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from compact_records import RosterTable
+from rule_variants import DEFAULT_VARIANTS, RuleVariant, WhatIfEngine
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def make_engine(num_users=25, weeks_played=10, decided_weeks=range(1, 11)):
+    league = SyntheticLeagueGenerator(seed=17).generate_league(
+        '1000000000000000000', num_users, weeks_played=weeks_played)
+    rosters = RosterTable.from_rosters(league['rosters'])
+    outcomes = {week: league['odds'][week] for week in decided_weeks}
+    names = {user['user_id']: user['display_name'] for user in league['users']}
+    return WhatIfEngine(rosters, outcomes, names), rosters, outcomes
+
+
+def week_values(rosters, outcomes, week, metric):
+    """One week's metric per playing user, computed the way the game classes do"""
+    values = {}
+    for roster in rosters:
+        if week not in roster.points:
+            continue
+        picks = roster.week_picks(week)
+        if roster.score(week) == 0 and not picks:
+            continue
+        if metric == 'score':
+            values[roster.owner_id] = roster.score(week)
+            continue
+        odds = outcomes.get(week)
+        if not odds:
+            continue
+        underdog_winners = [team for team, data in odds.items() if data['is_underdog'] and data['won']]
+        underdog_picks = [pick for pick in picks if odds.get(pick, {}).get('is_underdog')]
+        correct = len([pick for pick in picks if pick in underdog_winners])
+        if metric == 'underdog_count':
+            values[roster.owner_id] = correct
+        else:
+            values[roster.owner_id] = correct / len(underdog_picks) if underdog_picks else 0.0
+    return values
+
+
+def replay(rosters, outcomes, weeks, variant):
+    """Week-by-week loop with a running pot, like SleeperSkinsGame.process_week"""
+    totals = {}
+    pot = None
+    for week in weeks:
+        values = week_values(rosters, outcomes, week, variant.metric)
+        if not values:
+            continue
+        levels = sorted(set(values.values()), reverse=True)
+        for position, amount in enumerate(variant.tier_payouts):
+            if position >= len(levels):
+                break
+            winners = [uid for uid, value in values.items() if value == levels[position]]
+            if position == 0 and variant.carry_over:
+                pot = amount if pot is None else pot
+                if len(winners) == 1:
+                    totals[winners[0]] = totals.get(winners[0], 0) + pot
+                    pot = amount
+                else:
+                    pot += amount
+            else:
+                for uid in winners:
+                    totals[uid] = totals.get(uid, 0) + amount / len(winners)
+        for uid, value in values.items():
+            if value == levels[-1]:
+                totals[uid] = totals.get(uid, 0) - variant.lowest_penalty
+    return totals
+
+
+def test_variants_match_week_by_week_replay():
+    """Vectorized payouts equal a loop over weeks with a running pot"""
+    engine, rosters, outcomes = make_engine(decided_weeks=(1, 2, 3, 5, 8))
+    weeks = [int(week) for week in engine.weeks]
+    variants = [RuleVariant(v.name, v.metric, v.tier_payouts, v.carry_over, v.lowest_penalty)
+                for v in DEFAULT_VARIANTS]
+    comparison = engine.compare(variants)
+    for variant in variants:
+        expected = replay(rosters, outcomes, weeks, variant)
+        for owner_id, total in comparison[variant.name].items():
+            assert np.isclose(total, expected.get(owner_id, 0.0)), (variant.name, owner_id)
+
+
+def test_carryover_accumulates_across_ties():
+    """Tied weeks roll the pot forward and the summary reports what is left"""
+    engine, _, _ = make_engine(num_users=8)
+    variant = RuleVariant('carry', metric='underdog_count', tier_payouts=(3.0,), carry_over=True)
+    payouts, pots = engine.payouts(variant)
+    tier1 = engine._metrics['underdog_count'][1] == 1
+    single = tier1.sum(axis=0) == 1
+
+    assert np.isclose(payouts[payouts > 0].sum(), pots[single].sum())
+    assert pots[0] == 3.0
+    for col in range(1, len(pots)):
+        assert pots[col] == (3.0 if single[col - 1] else pots[col - 1] + 3.0)
+
+    summary = engine.summary([variant])
+    assert summary.loc['carry', 'weeks_carried'] == int((~single).sum())
+    assert summary.loc['carry', 'unpaid_pot'] == (0.0 if single[-1] else pots[-1])
+
+
+def test_perfect_weeks_and_undecided_weeks():
+    """Bonuses need game results; weeks without them are skipped by underdog rules"""
+    engine, rosters, outcomes = make_engine(decided_weeks=(1, 2))
+    assert not engine.perfect[:, 2:].any()
+    for row, owner_id in enumerate(engine.owner_ids):
+        roster = rosters.owner(owner_id)
+        for col, week in enumerate((1, 2)):
+            games = sum(data['won'] for data in outcomes[week].values())
+            picks = roster.week_picks(week)
+            perfect = len(picks) == games and all(outcomes[week][pick]['won'] for pick in picks)
+            assert engine.perfect[row, col] == perfect
+
+    summary = engine.summary()
+    assert summary.loc['underdog_count', 'weeks_contested'] == 2
+    assert summary.loc['high_score_carry', 'weeks_contested'] == 10
+    assert list(summary.index) == [variant.name for variant in DEFAULT_VARIANTS]
+
+
+if __name__ == "__main__":
+    test_variants_match_week_by_week_replay()
+    test_carryover_accumulates_across_ties()
+    test_perfect_weeks_and_undecided_weeks()
+    print("✅ What-if rules tests passed")
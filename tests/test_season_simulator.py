@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test the Monte Carlo season simulator
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from analytics_dashboard import SleeperAnalyticsDashboard
+from compact_records import perfect_week_winners
+from season_simulator import SeasonSimulator, format_simulation
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def make_league(num_users=30, weeks_played=10):
+    return SyntheticLeagueGenerator(seed=5).generate_league(
+        '1000000000000000000', num_users, weeks_played=weeks_played)
+
+
+def make_dashboard(num_users=30, weeks_played=10):
+    return SleeperAnalyticsDashboard.from_league(make_league(num_users, weeks_played))
+
+
+def test_probabilities_are_consistent():
+    """Tier odds are valid probabilities and the weekly skins add up"""
+    board = make_dashboard()
+    frame = SeasonSimulator(board, season_weeks=17, seed=1).simulate(sims=4000)
+    assert frame.attrs['weeks'] == 7
+    for tier in ('highest', 'lowest', 'perfect_week'):
+        assert ((frame[f'{tier}_prob'] >= 0) & (frame[f'{tier}_prob'] <= 1)).all()
+        assert (frame[f'{tier}_expected'] >= frame[f'{tier}_prob']).all()
+    # At most one player takes each week's skin; every week has at least one lowest scorer
+    assert frame['highest_expected'].sum() <= 7
+    assert frame['lowest_expected'].sum() >= 7
+    # The best historical average should be among the likeliest skin winners
+    averages = {uid: p.average_score for uid, p in board.player_performances.items()}
+    best = max(averages, key=averages.get)
+    assert best in frame.index[:5]
+    assert 'HIGHEST SCORE SKIN' in format_simulation(frame)
+
+
+def test_seeded_and_process_independent():
+    """Same seed gives the same answer with or without worker processes"""
+    board = make_dashboard(num_users=20)
+    single = SeasonSimulator(board, season_weeks=17, seed=3).simulate(sims=30000)
+    pooled = SeasonSimulator(board, season_weeks=17, seed=3).simulate(sims=30000, processes=2)
+    assert np.allclose(single.drop(columns='display_name').to_numpy(),
+                       pooled.loc[single.index].drop(columns='display_name').to_numpy())
+
+
+def test_ties_carry_the_skin_and_perfect_weeks_follow_the_game_rule():
+    """A shared top score takes no skin, and perfect weeks come from the game results"""
+    league = make_league(num_users=6, weeks_played=10)
+    for i, roster in enumerate(league['rosters']):
+        points = roster['metadata']['points_by_leg']
+        for leg in points:
+            points[leg] = 9 if i < 2 else 5  # two players always tie for the top score
+    owner_ids = [roster['owner_id'] for roster in league['rosters']]
+
+    # Week 3's results make exactly player 2's picks a clean sweep
+    picks = league['rosters'][2]['metadata']['previous_picks']['v1:regular:3']
+    game_results = {3: {team: {'won': True} for team in picks}}
+    board = SleeperAnalyticsDashboard.from_league(league)
+    expected_perfect = set(perfect_week_winners(board.get_rosters(), 3, game_results[3]))
+    assert owner_ids[2] in expected_perfect
+
+    frame = SeasonSimulator(board, season_weeks=17, seed=2, game_results=game_results).simulate(sims=2000)
+    assert (frame['highest_prob'] == 0).all()
+    assert (frame.loc[owner_ids[2:], 'lowest_expected'] == 7).all()
+    assert (frame.loc[owner_ids[:2], 'lowest_prob'] == 0).all()
+    for owner_id in owner_ids:
+        assert (frame.loc[owner_id, 'perfect_week_prob'] > 0) == (owner_id in expected_perfect)
+
+    # Break the tie and the sole leader takes every skin
+    league['rosters'][1]['metadata']['points_by_leg'] = {
+        leg: 8 for leg in league['rosters'][1]['metadata']['points_by_leg']}
+    board = SleeperAnalyticsDashboard.from_league(league)
+    frame = SeasonSimulator(board, season_weeks=17, seed=2, game_results={}).simulate(sims=2000)
+    assert frame.loc[owner_ids[0], 'highest_expected'] == 7
+    assert frame['highest_expected'].sum() == 7
+    assert (frame['perfect_week_prob'] == 0).all()
+
+
+if __name__ == "__main__":
+    test_probabilities_are_consistent()
+    test_seeded_and_process_independent()
+    test_ties_carry_the_skin_and_perfect_weeks_follow_the_game_rule()
+    print("✅ Season simulator tests passed")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test the pluggable JSON serializer
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import serialization
+
+
+SAMPLE = {
+    'week': 3,
+    'season': 2025,
+    'rankings': {'highest': ['1', '2'], 'lowest': []},
+    'scores': {'1': 14.5, '2': 14.5},
+    'winner_names': {'highest': ['Zoë', 'Ana']},
+}
+
+
+def each_backend():
+    saved = serialization.backend
+    try:
+        for name in serialization.BACKENDS:
+            if name == 'orjson' and serialization.orjson is None:
+                continue
+            if name == 'msgspec' and serialization.msgspec is None:
+                continue
+            serialization.backend = name
+            yield name
+    finally:
+        serialization.backend = saved
+
+
+def test_round_trip_every_backend():
+    """Every available backend reads back what it wrote, compact or pretty"""
+    for name in each_backend():
+        compact = serialization.dumps(SAMPLE)
+        pretty = serialization.dumps(SAMPLE, pretty=True)
+        assert b'\n' not in compact, name
+        assert b'\n  "week": 3' in pretty, name
+        assert serialization.loads(compact) == SAMPLE
+        assert serialization.loads(pretty) == SAMPLE
+        assert json.loads(compact) == SAMPLE  # stays plain JSON for other consumers
+
+
+def test_file_round_trip():
+    """dump/load go through files and report missing files like open()"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.json')
+        serialization.dump([SAMPLE], path)
+        assert serialization.load(path) == [SAMPLE]
+        try:
+            serialization.load(os.path.join(tmp, 'missing.json'))
+            assert False, "expected FileNotFoundError"
+        except FileNotFoundError:
+            pass
+
+
+def test_every_backend_handles_numpy_and_int_keys():
+    """Analytics output with numpy values and int keys encodes the same under every backend"""
+    sample = {1: np.float64(2.5), 'count': np.int64(4), 'flag': np.bool_(True), 'weeks': np.arange(3)}
+    for name in each_backend():
+        data = serialization.loads(serialization.dumps(sample))
+        assert data == {'1': 2.5, 'count': 4, 'flag': True, 'weeks': [0, 1, 2]}, name
+
+
+if __name__ == "__main__":
+    test_round_trip_every_backend()
+    test_file_round_trip()
+    test_every_backend_handles_numpy_and_int_keys()
+    print(f"✅ Serialization tests passed (backend: {serialization.backend})")
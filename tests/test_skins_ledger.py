@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test the event-sourced skins carryover ledger
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from skins_ledger import SkinsLedger, PERFECT_WEEK, skins_ledger_path
+
+BASE_POTS = {'high_score': 10, 'underdog': 3}
+
+# (high score winners, underdog winners, perfect week winners) per week
+WEEKS = [
+    (['a'], ['b', 'c'], []),
+    (['a', 'b'], ['c', 'd'], []),
+    (['c', 'd'], ['b'], ['c']),
+    (['d'], ['a'], []),
+    (['b'], ['a', 'd'], []),
+]
+
+
+def settle_all(ledger, season=2025):
+    return [ledger.settle_week(season, week, {'high_score': high, 'underdog': dog}, perfect)
+            for week, (high, dog, perfect) in enumerate(WEEKS, 1)]
+
+
+def open_ledger(tmp):
+    return SkinsLedger(skins_ledger_path(os.path.join(tmp, 'skins_game_data.xlsx')), BASE_POTS, 40)
+
+
+def test_payouts_and_carryovers():
+    """Ties roll the pot forward and winners collect the whole pot"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = open_ledger(tmp)
+        settlements = settle_all(ledger)
+
+        assert [s['high_score']['pot'] for s in settlements] == [10, 10, 20, 30, 10]
+        assert [s['underdog']['pot'] for s in settlements] == [3, 6, 9, 3, 3]
+        assert settlements[1]['high_score']['carried'] and settlements[1]['high_score']['next_pot'] == 20
+        assert settlements[2][PERFECT_WEEK] == {'pot': 40, 'winners': ['c'], 'carried': False}
+
+        assert ledger.pots() == {'high_score': 10, 'underdog': 6}
+        assert ledger.balances() == {'a': 10 + 3, 'b': 9 + 10, 'c': 40, 'd': 30}
+        assert ledger.winnings('d') == 30 and ledger.winnings('nobody') == 0
+        assert ledger.wins('high_score', 'a') == 1 and ledger.wins(PERFECT_WEEK, 'c') == 1
+
+
+def test_settling_twice_is_idempotent():
+    """Reprocessing a week returns the recorded settlement and appends nothing"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = open_ledger(tmp)
+        first = settle_all(ledger)
+        events = list(ledger.events())
+        again = ledger.settle_week(2025, 2, {'high_score': ['z'], 'underdog': ['z']}, [])
+        assert again == first[1]
+        assert list(ledger.events()) == events
+
+
+def test_snapshot_catches_up_and_replay_rewinds():
+    """Reopening applies events written after the snapshot; replay rebuilds any week"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = open_ledger(tmp)
+        ledger.settle_week(2025, 1, {'high_score': ['a'], 'underdog': ['b', 'c']}, [])
+        stale_snapshot = os.path.join(tmp, 'stale.json')
+        shutil.copy(ledger.snapshot_path, stale_snapshot)
+        settle_all(ledger)
+        current = ledger.state
+
+        # A snapshot that lags the log is caught up from the tail
+        shutil.copy(stale_snapshot, ledger.snapshot_path)
+        assert open_ledger(tmp).state == current
+
+        # A torn final write is ignored
+        with open(ledger.path, 'ab') as f:
+            f.write(b'{"type": "skin_paid", "sea')
+        os.remove(ledger.snapshot_path)
+        assert open_ledger(tmp).state == current
+
+        week_3 = ledger.replay(2025, 3)
+        assert week_3['pots'] == {'high_score': 30, 'underdog': 3}
+        assert week_3['last_week'] == [2025, 3]
+        assert ledger.replay(2024)['events'] == 0
+        assert ledger.replay() == current
+
+
+def test_appending_after_a_torn_write():
+    """A partial last line is cut off on open so later weeks stay readable"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = open_ledger(tmp)
+        ledger.settle_week(2025, 1, {'high_score': ['a'], 'underdog': ['b', 'c']}, [])
+        with open(ledger.path, 'ab') as f:
+            f.write(b'{"type": "skin_paid", "sea')
+
+        torn_size = os.path.getsize(ledger.path)
+        reopened = open_ledger(tmp)
+        reopened.replay()
+        assert os.path.getsize(ledger.path) == torn_size  # reading never rewrites the log
+        reopened.settle_week(2025, 2, {'high_score': ['b'], 'underdog': ['c']}, [])
+        assert open_ledger(tmp).state == reopened.state
+        os.remove(reopened.snapshot_path)
+        assert open_ledger(tmp).state == reopened.state
+        assert [event['week'] for event in reopened.events()] == [1, 1, 2, 2]
+        assert reopened.balances() == {'a': 10, 'b': 10, 'c': 6}
+
+
+def test_weeks_settle_in_order():
+    """An earlier week cannot be settled after a later one"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = open_ledger(tmp)
+        ledger.settle_week(2025, 1, {'high_score': ['a'], 'underdog': ['b']}, [])
+        ledger.settle_week(2025, 3, {'high_score': ['b'], 'underdog': ['c']}, [])
+        try:
+            ledger.settle_week(2025, 2, {'high_score': ['c'], 'underdog': ['a']}, [])
+            assert False, "settling week 2 after week 3 should fail"
+        except ValueError:
+            pass
+        assert ledger.replay(2025, 2)['last_week'] == [2025, 1]
+        assert ledger.replay(2025, 3) == ledger.state
+
+
+def test_opened_pots_seed_an_empty_ledger():
+    """Pots carried in from the old spreadsheet start the ledger"""
+    with tempfile.TemporaryDirectory() as tmp:
+        ledger = open_ledger(tmp)
+        ledger.open_pots(2025, 6, {'high_score': 30, 'underdog': 6})
+        settlement = ledger.settle_week(2025, 6, {'high_score': ['a'], 'underdog': ['b', 'c']})
+        assert settlement['high_score']['pot'] == 30
+        assert settlement['underdog']['next_pot'] == 9
+        try:
+            ledger.open_pots(2025, 7, {'high_score': 10})
+            assert False, "opening pots on a ledger with events should fail"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_payouts_and_carryovers()
+    test_settling_twice_is_idempotent()
+    test_snapshot_catches_up_and_replay_rewinds()
+    test_appending_after_a_torn_write()
+    test_weeks_settle_in_order()
+    test_opened_pots_seed_an_empty_ledger()
+    print("✅ Skins ledger tests passed")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Test retries, Retry-After handling and the circuit breaker in SleeperClient
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from mock_sleeper_server import MockSleeperServer, LeagueFixture
+from sleeper_client import SleeperClient, parse_retry_after
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from skins_game_mvp import SleeperSkinsGameMVP
+
+
+def fast_client(base_url, **kwargs):
+    kwargs.setdefault('backoff_base', 0.001)
+    kwargs.setdefault('circuit_breaker', CircuitBreaker(failure_threshold=2, reset_timeout=60))
+    kwargs.setdefault('cache_directory', tempfile.mkdtemp(prefix='pickem_cache_'))
+    return SleeperClient(base_url, **kwargs)
+
+
+def test_retries_transient_errors():
+    """Flaky 5xx responses are retried until one succeeds"""
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=1)
+
+    with MockSleeperServer([league], error_rate=0.5, error_status=503, seed=3) as server:
+        client = fast_client(server.base_url, max_retries=10)
+        for _ in range(5):
+            assert client.get('/league/42').status_code == 200
+        assert server.request_counts['/v1/league/42'] > 5
+
+
+def test_honors_retry_after():
+    """429 responses wait for Retry-After before retrying"""
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=1)
+
+    with MockSleeperServer([league], error_rate=1.0, error_status=429) as server:
+        client = fast_client(server.base_url, max_retries=1)
+        started = time.monotonic()
+        assert client.get('/league/42').status_code == 429
+        assert time.monotonic() - started >= 0.9  # mock server sends Retry-After: 1
+        assert server.request_counts['/v1/league/42'] == 2
+
+
+def test_breaker_falls_back_to_last_good_payload():
+    """An open breaker serves the cached payload instead of calling the API"""
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=1)
+
+    with MockSleeperServer([league]) as server:
+        client = fast_client(server.base_url, max_retries=1)
+        users = client.get('/league/42/users').json()
+
+        server.error_rate = 1.0
+        assert client.get('/league/42/users').json() == users  # retries fail, cached payload served
+        client.get('/league/42/users')
+        assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+        before = server.request_counts['/v1/league/42/users']
+        assert client.get('/league/42/users').json() == users
+        assert server.request_counts['/v1/league/42/users'] == before
+
+        try:
+            client.get('/league/42/rosters')
+            assert False, "nothing cached for rosters"
+        except CircuitOpenError:
+            pass
+
+
+def test_new_client_falls_back_to_persisted_payload():
+    """A later run with nothing in memory serves the body an earlier run saved"""
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=1)
+
+    with tempfile.TemporaryDirectory() as cache, MockSleeperServer([league]) as server:
+        users = fast_client(server.base_url, cache_directory=cache).get('/league/42/users').json()
+
+        server.error_rate = 1.0
+        client = fast_client(server.base_url, max_retries=0, cache_directory=cache)
+        response = client.get('/league/42/users')
+        assert response.status_code == 200 and response.json() == users
+        assert client.get('/league/42').status_code == 500  # nothing saved for it
+
+
+def test_stream_saves_body_for_fallback():
+    """Streamed bodies are read incrementally, saved, and replayed from disk during an outage"""
+    import json
+    from sleeper_client import last_good_path
+
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=1)
+
+    with tempfile.TemporaryDirectory() as cache, MockSleeperServer([league]) as server:
+        client = fast_client(server.base_url, cache_directory=cache)
+        with client.stream('/league/42/rosters') as (status_code, body):
+            assert status_code == 200
+            rosters = json.load(body)
+        assert rosters == client.get('/league/42/rosters').json()
+        with open(last_good_path(cache, client.url('/league/42/rosters')), 'rb') as f:
+            assert json.loads(f.read()) == rosters
+
+        with client.stream('/league/999/rosters') as (status_code, body):
+            assert status_code == 404 and body is None
+
+        server.error_rate = 1.0
+        offline = fast_client(server.base_url, max_retries=0, cache_directory=cache)
+        with offline.stream('/league/42/rosters') as (status_code, body):
+            assert status_code == 200 and json.load(body) == rosters
+
+
+def test_breaker_half_open_trial():
+    """After the cool-down one trial request closes the breaker again"""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    time.sleep(0.06)
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record_success()
+    assert breaker.allow_request()
+
+
+def run_concurrently(target, count=8):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(target())) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_gets_are_coalesced():
+    """Identical concurrent GETs share one request"""
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=1)
+
+    with MockSleeperServer([league], latency=0.2) as server:
+        client = fast_client(server.base_url)
+        responses = run_concurrently(lambda: client.get('/league/42/rosters'))
+        assert len(responses) == 8
+        assert all(response.status_code == 200 for response in responses)
+        assert server.request_counts['/v1/league/42/rosters'] == 1
+
+
+def test_rosters_cache_populated_once():
+    """Threads sharing a league object fetch its rosters once and see the same cache"""
+    league = LeagueFixture.synthetic('42', num_users=4, weeks=1)
+
+    with MockSleeperServer([league], latency=0.1) as server:
+        skins_game = SleeperSkinsGameMVP('42', base_url=server.base_url)
+        rosters = run_concurrently(skins_game.get_rosters)
+        assert all(result is rosters[0] for result in rosters)
+        assert server.request_counts['/v1/league/42/rosters'] == 1
+
+
+def test_parse_retry_after():
+    """Both Retry-After forms are understood"""
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('soon') is None
+
+
+if __name__ == "__main__":
+    test_retries_transient_errors()
+    test_honors_retry_after()
+    test_breaker_falls_back_to_last_good_payload()
+    test_new_client_falls_back_to_persisted_payload()
+    test_stream_saves_body_for_fallback()
+    test_breaker_half_open_trial()
+    test_concurrent_gets_are_coalesced()
+    test_rosters_cache_populated_once()
+    test_parse_retry_after()
+    print("✅ Sleeper client tests passed")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test the delta-compressed rosters snapshot archive
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from snapshot_archive import SnapshotArchive, make_patch, apply_patch, KEYFRAME
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def season_polls(num_users=60, polls_per_week=4):
+    """Rosters payloads as a poller would see them over a season"""
+    generator = SyntheticLeagueGenerator(seed=7)
+    polls = []
+    for week in range(1, generator.weeks + 1):
+        rosters = generator.generate_league('1000000000000000000', num_users, weeks_played=week)['rosters']
+        polls.extend([rosters] * polls_per_week)
+    return polls
+
+
+def test_patch_round_trip():
+    """apply_patch(old, make_patch(old, new)) rebuilds new"""
+    old = {'a': 1, 'b': [1, 2, {'c': 3}], 'gone': True, 'list': [1]}
+    new = {'a': 2, 'b': [1, 2, {'c': 4, 'd': 5}], 'list': [1, 2], 'added': 'x'}
+    patch = make_patch(old, new)
+    assert apply_patch(json.loads(json.dumps(old)), patch) == new
+    assert make_patch(new, new) == []
+    assert apply_patch([1], make_patch([1], {'x': 1})) == {'x': 1}
+
+
+def test_random_access_and_reopen():
+    """Every snapshot reads back exactly, in any order and after reopening"""
+    polls = season_polls(num_users=20, polls_per_week=2)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rosters.pksnap')
+        archive = SnapshotArchive(path, keyframe_interval=8)
+        for i, rosters in enumerate(polls):
+            assert archive.append(rosters, timestamp=1000.0 + i) == i
+
+        reopened = SnapshotArchive(path, keyframe_interval=8)
+        assert len(reopened) == len(polls)
+        assert reopened._kinds[0] == KEYFRAME and reopened._kinds[8] == KEYFRAME
+        order = list(range(len(polls)))
+        random.Random(3).shuffle(order)
+        for index in order:
+            assert reopened[index] == polls[index]
+        assert reopened[-1] == polls[-1]
+        assert reopened.at(1005.5) == polls[5]
+        assert list(reopened) == polls
+
+        # Appending after reopening continues the chain
+        reopened.append(polls[0], timestamp=5000.0)
+        assert SnapshotArchive(path)[len(polls)] == polls[0]
+
+
+def test_archive_much_smaller_than_dumps():
+    """A season of polls costs far less than the pretty-printed files it replaces"""
+    polls = season_polls()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rosters.pksnap')
+        archive = SnapshotArchive(path)
+        for rosters in polls:
+            archive.append(rosters)
+        dumped = sum(len(json.dumps(rosters, indent=2)) for rosters in polls)
+        assert os.path.getsize(path) * 50 < dumped
+
+
+def test_torn_tail_is_ignored():
+    """A partially written last entry does not break reading the rest"""
+    polls = season_polls(num_users=5, polls_per_week=1)[:3]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rosters.pksnap')
+        archive = SnapshotArchive(path)
+        for rosters in polls:
+            archive.append(rosters)
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 3)
+        torn_size = os.path.getsize(path)
+        reopened = SnapshotArchive(path)
+        assert len(reopened) == 2
+        assert reopened[1] == polls[1]
+        assert os.path.getsize(path) == torn_size  # opening never rewrites the file
+
+        # Later appends stay reachable after reopening
+        reopened.append(polls[2])
+        again = SnapshotArchive(path)
+        assert len(again) == 3
+        assert again[2] == polls[2]
+
+
+
+def test_concurrent_writers_and_crashed_creation():
+    """Appends from another handle are picked up, and an empty file starts a fresh archive"""
+    polls = season_polls(num_users=5, polls_per_week=1)[:4]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rosters.pksnap')
+        with open(path, 'wb') as f:
+            f.write(b'PKS')  # crash while writing the header
+        first = SnapshotArchive(path)
+        assert len(first) == 0
+        second = SnapshotArchive(path)
+        first.append(polls[0], timestamp=100.0)
+        second.append(polls[1], timestamp=200.0)
+        first.append(polls[2], timestamp=300.0)
+
+        reopened = SnapshotArchive(path)
+        assert list(reopened) == polls[:3]
+        assert reopened.at(250.0) == polls[1]
+        try:
+            reopened.append(polls[3], timestamp=150.0)
+            assert False, "an older timestamp should be rejected"
+        except ValueError:
+            pass
+        assert len(SnapshotArchive(path)) == 3
+
+
+def test_reading_does_not_create_the_file():
+    """Opening a missing archive to list it writes nothing"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'missing', 'rosters.pksnap')
+        assert len(SnapshotArchive(path)) == 0
+        assert not os.path.exists(path)
+
+
+if __name__ == "__main__":
+    test_patch_round_trip()
+    test_random_access_and_reopen()
+    test_archive_much_smaller_than_dumps()
+    test_torn_tail_is_ignored()
+    test_concurrent_writers_and_crashed_creation()
+    test_reading_does_not_create_the_file()
+    print("✅ Snapshot archive tests passed")
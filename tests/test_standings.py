@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test the materialized season standings
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from results_store import ResultsStore
+from standings import SeasonStandings, standings_path
+from synthetic_league import SyntheticLeagueGenerator
+
+LEAGUE_ID = '1000000000000000000'
+
+
+def history(num_users=30, seasons=(2024, 2025)):
+    return list(SyntheticLeagueGenerator(seed=4).iter_results_history(num_users, list(seasons)))
+
+
+def expected_totals(records, season):
+    """Season totals computed the slow way, by scanning every record"""
+    totals = {}
+    for record in records:
+        if record['season'] != season:
+            continue
+        seen = set()
+        for tier in ['highest', 'second_highest', 'third_highest', 'lowest', 'no_picks']:
+            for owner_id in record['rankings'][tier]:
+                if owner_id in seen:
+                    continue
+                seen.add(owner_id)
+                user = totals.setdefault(owner_id, {'total_score': 0, 'wins': 0, 'perfect_weeks': 0})
+                user['total_score'] += 0 if tier == 'no_picks' else record['scores'][tier]
+                user['wins'] += tier == 'highest'
+        for owner_id in record['perfect_week_winners']:
+            totals.setdefault(owner_id, {'total_score': 0, 'wins': 0, 'perfect_weeks': 0})['perfect_weeks'] += 1
+    return totals
+
+
+def table_totals(table):
+    return {owner_id: {'total_score': user['total_score'], 'wins': user['wins'],
+                       'perfect_weeks': user['perfect_weeks']}
+            for owner_id, user in table['users'].items()}
+
+
+def test_incremental_matches_rebuild():
+    """Recording weeks one by one gives the same table as a full rebuild"""
+    records = history()
+    with tempfile.TemporaryDirectory() as tmp:
+        results_file = os.path.join(tmp, 'skins_game_results.json')
+        standings = SeasonStandings(results_file, LEAGUE_ID)
+        for record in records:
+            standings.record_week(record)
+        assert standings.is_current()
+        incremental = standings.seasons()
+
+        rebuilt = standings.rebuild()['seasons']
+        assert incremental == rebuilt
+        for season in (2024, 2025):
+            assert table_totals(incremental[str(season)]) == expected_totals(records, season)
+            assert incremental[str(season)]['weeks'] == list(range(1, 18))
+
+
+def test_reprocessing_a_week_replaces_it():
+    """Processing a week again swaps its contribution instead of double counting"""
+    records = history(seasons=(2025,))
+    with tempfile.TemporaryDirectory() as tmp:
+        results_file = os.path.join(tmp, 'skins_game_results.json')
+        standings = SeasonStandings(results_file, LEAGUE_ID)
+        for record in records:
+            standings.record_week(record)
+        before = standings.season(2025)
+
+        standings.record_week(records[4])
+        after = standings.season(2025)
+        assert after['weeks'] == before['weeks']
+        assert table_totals(after) == table_totals(before)
+
+
+def test_stale_table_rebuilt_from_results():
+    """Rewriting the results file outside process_week invalidates the table"""
+    records = history()
+    with tempfile.TemporaryDirectory() as tmp:
+        results_file = os.path.join(tmp, 'skins_game_results.json')
+        standings = SeasonStandings(results_file, LEAGUE_ID)
+        for record in records:
+            standings.record_week(record)
+
+        trimmed = [record for record in records if record['season'] == 2025]
+        ResultsStore(results_file).save(trimmed)
+        assert not SeasonStandings(results_file).is_current()
+        assert set(SeasonStandings(results_file).seasons()) == {'2025'}
+
+        os.remove(standings_path(results_file))
+        assert table_totals(SeasonStandings(results_file).season(2025)) == expected_totals(trimmed, 2025)
+
+
+def test_exporter_season_scores_from_standings():
+    """The exporter's season sheet and summary read the standings"""
+    from export_results import SkinsGameExporter
+
+    records = history(seasons=(2025,))
+    with tempfile.TemporaryDirectory() as tmp:
+        results_file = os.path.join(tmp, 'skins_game_results.json')
+        ResultsStore(results_file).save(records)
+
+        exporter = SkinsGameExporter(results_file)
+        season_df = exporter.create_season_scores()
+        totals = expected_totals(records, 2025)
+        assert len(season_df) == len(totals)
+        for row in season_df.to_dict('records'):
+            assert row['Total_Score'] == totals[row['User_ID']]['total_score']
+            assert row['Total_Wins'] == totals[row['User_ID']]['wins']
+
+        summary = dict(zip(*exporter.create_summary(records).to_dict('list').values()))
+        assert summary['Total Weeks'] == 17
+        assert summary['Total Perfect Weeks'] == sum(len(r['perfect_week_winners']) for r in records)
+
+
+
+def test_reprocessed_week_consistent_across_sheets():
+    """After a week is reprocessed the stored record, weekly sheet and season sheet all use the new one"""
+    from export_results import SkinsGameExporter
+
+    records = history(num_users=10, seasons=(2025,))
+    with tempfile.TemporaryDirectory() as tmp:
+        results_file = os.path.join(tmp, 'skins_game_results.json')
+        standings = SeasonStandings(results_file, LEAGUE_ID)
+        for record in records:
+            standings.record_week(record)
+
+        corrected = dict(records[2], scores=dict(records[2]['scores'], highest=records[2]['scores']['highest'] + 5))
+        standings.record_week(corrected)
+        stored = ResultsStore(results_file).load()
+        assert len(stored) == len(records) and stored[2]['scores'] == corrected['scores']
+
+        exporter = SkinsGameExporter(results_file)
+        duplicated = records + [corrected]
+        weekly_df = exporter.create_weekly_breakdown(duplicated)
+        assert len(weekly_df) == len(records)
+        assert weekly_df.loc[weekly_df['Week'] == 3, 'Highest_Score'].item() == corrected['scores']['highest']
+
+        season_df = exporter.create_season_scores(duplicated)
+        assert season_df.equals(exporter.create_season_scores())
+        winner = corrected['rankings']['highest'][0]
+        row = season_df[season_df['User_ID'] == winner].iloc[0]
+        assert row['Week_3_Score'] == corrected['scores']['highest']
+
+
+if __name__ == "__main__":
+    test_incremental_matches_rebuild()
+    test_reprocessing_a_week_replaces_it()
+    test_stale_table_rebuilt_from_results()
+    test_exporter_season_scores_from_standings()
+    test_reprocessed_week_consistent_across_sheets()
+    print("✅ Standings tests passed")
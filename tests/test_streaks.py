@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test the streak and percentile-rank analytics
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from analytics_dashboard import SleeperAnalyticsDashboard
+from synthetic_league import SyntheticLeagueGenerator
+
+
+def make_dashboard(num_users=20, weeks_played=10):
+    league = SyntheticLeagueGenerator(seed=8).generate_league(
+        '1000000000000000000', num_users, weeks_played=weeks_played)
+    # One player sits out week 4 (0 points, no picks), another misses week 7 entirely
+    league['rosters'][2]['metadata']['points_by_leg']['v1:regular:4'] = 0
+    del league['rosters'][2]['metadata']['previous_picks']['v1:regular:4']
+    del league['rosters'][5]['metadata']['points_by_leg']['v1:regular:7']
+    board = SleeperAnalyticsDashboard.from_league(league)
+    board.extract_player_data()
+    return board
+
+
+def week_tiers(board, week):
+    """Ranked scores and tiers for one week, the way calculate_week_rankings groups them"""
+    scores = {}
+    for roster in board.get_rosters():
+        if week in roster.points and not (roster.score(week) == 0 and not roster.pick_codes(week)):
+            scores[roster.owner_id] = roster.score(week)
+    levels = sorted(set(scores.values()), reverse=True)
+    return scores, {owner_id: levels.index(score) + 1 for owner_id, score in scores.items()}, len(levels)
+
+
+def test_ranks_match_per_week_grouping():
+    """Tiers and percentiles equal a per-week sort of the ranked scores"""
+    board = make_dashboard()
+    ranks = board.weekly_ranks()
+    for week, group in ranks.groupby('week'):
+        scores, tiers, _ = week_tiers(board, week)
+        assert set(group['user_id']) == set(scores)
+        for row in group.itertuples():
+            assert row.tier == tiers[row.user_id]
+            at_or_below = sum(score <= row.score for score in scores.values())
+            assert np.isclose(row.percentile, at_or_below / len(scores))
+    assert not ((ranks['week'] == 4) & (ranks['user_id'] == board.get_rosters()[2].owner_id)).any()
+
+
+def test_streaks_match_week_by_week_walk():
+    """Run lengths equal walking each player's season week by week"""
+    board = make_dashboard()
+    streaks = board.streaks()
+    weeks = sorted({week for roster in board.get_rosters() for week in roster.points})
+    tiers_by_week = {week: week_tiers(board, week) for week in weeks}
+
+    for owner_id, row in streaks.iterrows():
+        top3 = last = longest_top3 = longest_last = 0
+        for week in weeks:
+            _, tiers, levels = tiers_by_week[week]
+            tier = tiers.get(owner_id)
+            top3 = top3 + 1 if tier is not None and tier <= 3 else 0
+            last = last + 1 if tier is not None and tier == levels else 0
+            longest_top3, longest_last = max(longest_top3, top3), max(longest_last, last)
+        assert row['current_top3_streak'] == top3
+        assert row['longest_top3_streak'] == longest_top3
+        assert row['current_last_place_streak'] == last
+        assert row['longest_last_place_streak'] == longest_last
+
+    ranks = board.weekly_ranks()
+    latest = ranks[ranks['week'] == weeks[-1]].set_index('user_id')
+    assert (latest['top3_streak'] == streaks.loc[latest.index, 'current_top3_streak']).all()
+
+
+if __name__ == "__main__":
+    test_ranks_match_per_week_grouping()
+    test_streaks_match_week_by_week_walk()
+    print("✅ Streak tests passed")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test the synthetic league generator used for scale testing
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('SLEEPER_LEAGUE_ID', '1000000000000000000')
+
+from synthetic_league import SyntheticLeagueGenerator
+from results_store import ResultsStore
+from skins_game_mvp import SleeperSkinsGameMVP
+
+
+def test_roster_payloads_are_realistic():
+    """Rosters carry 16-game slates, ties and no-pick weeks"""
+    generator = SyntheticLeagueGenerator(seed=3)
+    league = generator.generate_league('42', num_users=300, season=2024, weeks_played=4)
+
+    assert league['league_info']['metadata']['current_pickem_leg_id'] == 'v1:regular:5'
+    week_scores = [r['metadata']['points_by_leg']['v1:regular:1'] for r in league['rosters']]
+    full_slates = [r for r in league['rosters'] if len(r['metadata']['previous_picks'].get('v1:regular:1', [])) == 16]
+
+    assert len(full_slates) > 250
+    assert len(set(week_scores)) < len(week_scores)  # Ties
+    assert any('v1:regular:1' not in r['metadata']['previous_picks'] for r in league['rosters'])
+    assert len(league['odds'][1]) == 32
+
+
+def test_generator_is_reproducible():
+    """The same seed produces the same league"""
+    first = SyntheticLeagueGenerator(seed=11).generate_league('7', num_users=20)
+    second = SyntheticLeagueGenerator(seed=11).generate_league('7', num_users=20)
+    assert first['rosters'] == second['rosters']
+
+
+def test_results_history_matches_mvp_rankings():
+    """Streamed results records agree with the MVP ranking logic for the same league"""
+    generator = SyntheticLeagueGenerator(seed=5)
+    league = generator.generate_league('42', num_users=50, season=2025, weeks_played=3)
+
+    skins_game = SleeperSkinsGameMVP.from_league(league)
+
+    records = list(generator.iter_results_history(50, [2025], league_key='42', weeks_played=3))
+    assert len(records) == 3
+    for record in records:
+        rankings = skins_game.calculate_week_rankings(record['week'])
+        for tier, owner_ids in rankings.items():
+            assert sorted(owner_ids) == sorted(record['rankings'][tier])
+
+
+def test_write_results_history():
+    """Results history files are valid JSON of the requested size"""
+    generator = SyntheticLeagueGenerator(seed=1)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'skins_game_results.json')
+        count = generator.write_results_history(path, 100, [2023, 2024, 2025])
+        results = ResultsStore(path).load()
+
+        legacy_path = os.path.join(tmp, 'skins_game_results_v1.json')
+        generator.write_results_history(legacy_path, 100, [2023, 2024, 2025], schema_version=1)
+        with open(legacy_path, 'r') as f:
+            legacy_results = json.load(f)
+
+    assert count == len(results) == len(legacy_results) == 51
+    assert {r['season'] for r in results} == {2023, 2024, 2025}
+    assert [r['rankings'] for r in results] == [r['rankings'] for r in legacy_results]
+
+
+if __name__ == "__main__":
+    test_roster_payloads_are_realistic()
+    test_generator_is_reproducible()
+    test_results_history_matches_mvp_rankings()
+    test_write_results_history()
+    print("✅ Synthetic league tests passed")